@@ -1,9 +1,23 @@
+import numpy as np
 from asv_runner.benchmarks.mark import SkipNotImplemented
 
 import astropy.units as u
-from astropy.coordinates import HCRS, ITRS, HeliocentricMeanEcliptic, SphericalRepresentation
+from astropy.coordinates import (
+    HCRS,
+    ITRS,
+    HeliocentricMeanEcliptic,
+    SphericalDifferential,
+    SphericalRepresentation,
+)
+from astropy.time import Time
 
 import sunpy.coordinates.frames as f
+from sunpy.coordinates import NorthOffsetFrame, RotatedSunFrame, get_earth
+from sunpy.coordinates.screens import PlanarScreen, SphericalScreen
+
+# The number of coordinates in the array benchmarks
+SIZES = [1, 10_000, 1_000_000]
+OBSTIME = '2023-01-01'
 
 
 class TransformationHeliographic:
@@ -83,3 +97,180 @@ class TransformationMagnetic:
 
     def time_transform(self, frames, src, dest):
         frames[src].transform_to(frames[dest])
+
+
+def random_spherical(size, *, distance=1*u.AU, velocity=False, seed=0):
+    """
+    Random coordinates over the whole sphere, optionally with a velocity.
+    """
+    rng = np.random.default_rng(seed)
+    lon = rng.uniform(-180, 180, size) * u.deg
+    lat = np.rad2deg(np.arcsin(rng.uniform(-1, 1, size))) * u.deg
+    distance = distance * rng.uniform(0.5, 1.5, size)
+    differentials = None
+    if velocity:
+        differentials = SphericalDifferential(rng.normal(size=size) * u.arcsec/u.s,
+                                              rng.normal(size=size) * u.arcsec/u.s,
+                                              rng.normal(size=size) * u.km/u.s)
+    return SphericalRepresentation(lon, lat, distance, differentials=differentials)
+
+
+def array_obstime(size):
+    """
+    Observation times spread over one year.
+    """
+    return Time(OBSTIME) + np.linspace(0, 365, size) * u.day
+
+
+class TransformationArray:
+    """
+    Transformations of coordinate arrays of increasing size, where the observation
+    time is either a scalar or an array of the same size as the coordinates, and
+    where the coordinates optionally have velocities.
+    """
+    paths = ['HCRS-HGS', 'HGS-HGC', 'HGS-HCI', 'HGS-HPC', 'HPC-HPC']
+    params = (SIZES, paths, ['scalar-obstime', 'array-obstime', 'velocity'])
+    param_names = ['size', 'path', 'feature']
+    timeout = 600
+
+    def setup(self, size, path, feature):
+        if feature == 'array-obstime' and size > 10_000:
+            # Transformations with an array of distinct observation times take seconds even
+            # for 10,000 coordinates, so the largest size would exceed the timeout
+            raise SkipNotImplemented
+        obstime = array_obstime(size) if feature == 'array-obstime' else Time(OBSTIME)
+        observer = get_earth(obstime)
+        frames = {
+            'HCRS': HCRS(obstime=obstime),
+            'HGS': f.HeliographicStonyhurst(obstime=obstime),
+            'HGC': f.HeliographicCarrington(obstime=obstime, observer=observer),
+            'HCI': f.HeliocentricInertial(obstime=obstime),
+            'HPC': f.Helioprojective(obstime=obstime, observer=observer),
+        }
+        src, dest = path.split('-')
+        if src == dest:
+            # Change the observer by shifting the observation time of the destination by a day
+            dest_obstime = obstime + 1*u.day
+            self.dest = f.Helioprojective(obstime=dest_obstime, observer=get_earth(dest_obstime))
+        else:
+            self.dest = frames[dest]
+        data = random_spherical(size, distance=1*u.AU if src != 'HPC' else 0.01*u.AU,
+                                velocity=feature == 'velocity')
+        self.coord = frames[src].realize_frame(data)
+        if feature == 'velocity':
+            # Not every transformation supports velocities
+            try:
+                self.coord[:1].transform_to(self.dest)
+            except (NotImplementedError, TypeError, ValueError):
+                raise SkipNotImplemented
+
+    def time_transform(self, size, path, feature):
+        self.coord.transform_to(self.dest)
+
+    def peakmem_transform(self, size, path, feature):
+        self.coord.transform_to(self.dest)
+
+
+class TransformationRotatedSunFrame:
+    """
+    Transformations into and out of a `~sunpy.coordinates.RotatedSunFrame`.
+    """
+    params = (SIZES, ['HGS', 'HPC'], ['from', 'to'])
+    param_names = ['size', 'base', 'direction']
+    timeout = 300
+
+    def setup(self, size, base, direction):
+        observer = get_earth(OBSTIME)
+        if base == 'HGS':
+            base_frame = f.HeliographicStonyhurst(obstime=OBSTIME)
+            data = random_spherical(size, distance=1*u.R_sun)
+        else:
+            base_frame = f.Helioprojective(obstime=OBSTIME, observer=observer)
+            data = random_spherical(size, distance=0.99*u.AU)
+        rotated_frame = RotatedSunFrame(base=base_frame, duration=3*u.day)
+        if direction == 'from':
+            self.coord = rotated_frame.realize_frame(data)
+            self.dest = base_frame
+        else:
+            self.coord = base_frame.realize_frame(data)
+            self.dest = rotated_frame
+
+    def time_transform(self, size, base, direction):
+        self.coord.transform_to(self.dest)
+
+    def peakmem_transform(self, size, base, direction):
+        self.coord.transform_to(self.dest)
+
+
+class TransformationNorthOffsetFrame:
+    """
+    Transformations into and out of a `~sunpy.coordinates.NorthOffsetFrame`.
+    """
+    params = (SIZES, ['from', 'to'])
+    param_names = ['size', 'direction']
+    timeout = 300
+
+    def setup(self, size, direction):
+        north = f.HeliographicStonyhurst(30*u.deg, 60*u.deg, obstime=OBSTIME)
+        offset_frame = NorthOffsetFrame(north=north)
+        hgs_frame = f.HeliographicStonyhurst(obstime=OBSTIME)
+        data = random_spherical(size, distance=1*u.R_sun)
+        if direction == 'from':
+            self.coord = offset_frame.realize_frame(data)
+            self.dest = hgs_frame
+        else:
+            self.coord = hgs_frame.realize_frame(data)
+            self.dest = offset_frame
+
+    def time_transform(self, size, direction):
+        self.coord.transform_to(self.dest)
+
+    def peakmem_transform(self, size, direction):
+        self.coord.transform_to(self.dest)
+
+
+class TransformationScreen:
+    """
+    Transformations of 2D helioprojective coordinates between two observers, which
+    places the off-disk coordinates on a screen from `sunpy.coordinates.screens`.
+    """
+    params = (SIZES, ['none', 'spherical', 'planar', 'spherical-off-disk'])
+    param_names = ['size', 'screen']
+    timeout = 300
+
+    def setup(self, size, screen):
+        observer = get_earth(OBSTIME)
+        rng = np.random.default_rng(0)
+        self.coord = f.Helioprojective(rng.uniform(-2000, 2000, size) * u.arcsec,
+                                       rng.uniform(-2000, 2000, size) * u.arcsec,
+                                       obstime=OBSTIME, observer=observer)
+        new_observer = f.HeliographicStonyhurst(30*u.deg, 0*u.deg, 1*u.AU, obstime=OBSTIME)
+        self.dest = f.Helioprojective(obstime=OBSTIME, observer=new_observer)
+        self.screen = {
+            'none': None,
+            'spherical': SphericalScreen(observer),
+            'planar': PlanarScreen(observer),
+            'spherical-off-disk': SphericalScreen(observer, only_off_disk=True),
+        }[screen]
+
+    def _transform(self):
+        if self.screen is None:
+            self.coord.transform_to(self.dest)
+        else:
+            with self.screen:
+                self.coord.transform_to(self.dest)
+
+    def time_transform(self, size, screen):
+        self._transform()
+
+    def peakmem_transform(self, size, screen):
+        self._transform()
+
+
+# The import time is measured in a new process each time
+def timeraw_import_coordinates():
+    return "import sunpy.coordinates"
+
+
+def timeraw_import_coordinates_docstring():
+    return "import sunpy.coordinates; sunpy.coordinates.__doc__"
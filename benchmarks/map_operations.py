@@ -0,0 +1,218 @@
+"""
+Benchmarks of map operations on synthetic full-disk maps of increasing size.
+
+Unlike the benchmarks in ``map.py``, these do not need the sample data, and
+are parametrized over the size of the map so that the scaling of each
+operation can be tracked.
+"""
+import importlib
+
+import numpy as np
+from asv_runner.benchmarks.mark import SkipNotImplemented
+
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+
+import sunpy.map
+from sunpy.coordinates import frames, get_earth
+from sunpy.map.maputils import all_coordinates_from_map, contains_full_disk, sample_sequence_at_coords
+from sunpy.physics.differential_rotation import differential_rotate, differential_rotate_sequence
+
+SIZES = [1024, 4096, 8192]
+OBSTIME = '2023-01-01T00:00:00'
+
+
+def make_header(size, obstime=OBSTIME):
+    """
+    The header of a synthetic helioprojective map of ``size`` x ``size`` pixels
+    with the full disk of the Sun in the field of view.
+    """
+    center = SkyCoord(0*u.arcsec, 0*u.arcsec, frame=frames.Helioprojective,
+                      obstime=obstime, observer=get_earth(obstime))
+    return sunpy.map.make_fitswcs_header((size, size), center,
+                                         scale=[2500 / size] * 2 * u.arcsec/u.pix,
+                                         telescope='synthetic', instrument='synthetic')
+
+
+def make_data(size):
+    """
+    A smooth disk with noise.
+    """
+    rng = np.random.default_rng(seed=size)
+    y, x = np.ogrid[-1:1:size*1j, -1:1:size*1j]
+    data = 1000 * np.exp(-4 * (x**2 + y**2)) + rng.normal(scale=10, size=(size, size))
+    return data.astype(np.float32)
+
+
+def make_map(size, obstime=OBSTIME):
+    return sunpy.map.Map(make_data(size), make_header(size, obstime))
+
+
+class Rotate:
+    params = (SIZES, ['scipy', 'scipy-threaded', 'scikit-image', 'opencv'])
+    param_names = ['size', 'method']
+    timeout = 300
+
+    def setup(self, size, method):
+        # The optional packages needed by some of the rotation methods
+        module = {'scikit-image': 'skimage', 'opencv': 'cv2'}.get(method)
+        if module is not None:
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                raise SkipNotImplemented
+        self.map = make_map(size)
+
+    def time_rotate(self, size, method):
+        self.map.rotate(30*u.deg, method=method)
+
+    def peakmem_rotate(self, size, method):
+        self.map.rotate(30*u.deg, method=method)
+
+
+class Submap:
+    params = (SIZES, ['pixel', 'coordinate'])
+    param_names = ['size', 'corners']
+
+    def setup(self, size, corners):
+        self.map = make_map(size)
+        if corners == 'pixel':
+            self.bottom_left = [size // 4, size // 4] * u.pix
+            self.top_right = [3 * size // 4, 3 * size // 4] * u.pix
+        else:
+            self.bottom_left = SkyCoord(-500*u.arcsec, -500*u.arcsec, frame=self.map.coordinate_frame)
+            self.top_right = SkyCoord(500*u.arcsec, 500*u.arcsec, frame=self.map.coordinate_frame)
+
+    def time_submap(self, size, corners):
+        self.map.submap(self.bottom_left, top_right=self.top_right)
+
+    def peakmem_submap(self, size, corners):
+        self.map.submap(self.bottom_left, top_right=self.top_right)
+
+
+class Superpixel:
+    params = (SIZES, [2, 4, 16])
+    param_names = ['size', 'factor']
+
+    def setup(self, size, factor):
+        self.map = make_map(size)
+
+    def time_superpixel(self, size, factor):
+        self.map.superpixel([factor, factor] * u.pix)
+
+    def peakmem_superpixel(self, size, factor):
+        self.map.superpixel([factor, factor] * u.pix)
+
+
+class Resample:
+    params = (SIZES, ['nearest', 'linear', 'spline'])
+    param_names = ['size', 'method']
+    timeout = 300
+
+    def setup(self, size, method):
+        self.map = make_map(size)
+        self.dimensions = [size // 3, size // 3] * u.pix
+
+    def time_resample(self, size, method):
+        self.map.resample(self.dimensions, method=method)
+
+    def peakmem_resample(self, size, method):
+        self.map.resample(self.dimensions, method=method)
+
+
+class Reproject:
+    params = (SIZES, ['interpolation', 'plan'])
+    param_names = ['size', 'algorithm']
+    timeout = 600
+
+    def setup(self, size, algorithm):
+        self.map = make_map(size)
+        new_observer = SkyCoord(30*u.deg, 0*u.deg, 1*u.AU, frame=frames.HeliographicStonyhurst,
+                                obstime=OBSTIME)
+        center = SkyCoord(0*u.arcsec, 0*u.arcsec, frame=frames.Helioprojective,
+                          obstime=OBSTIME, observer=new_observer)
+        self.header = sunpy.map.make_fitswcs_header((size, size), center,
+                                                    scale=u.Quantity(self.map.scale))
+        if algorithm == 'plan':
+            # The plan is built for the first map, so this measures the reuse
+            self.plan = sunpy.map.ReprojectionPlan(self.header)
+            self.plan.apply(self.map)
+
+    def time_reproject_to(self, size, algorithm):
+        if algorithm == 'plan':
+            self.plan.apply(self.map)
+        else:
+            self.map.reproject_to(self.header, algorithm=algorithm)
+
+    def peakmem_reproject_to(self, size, algorithm):
+        if algorithm == 'plan':
+            self.plan.apply(self.map)
+        else:
+            self.map.reproject_to(self.header, algorithm=algorithm)
+
+
+class DifferentialRotate:
+    params = [1024, 4096]
+    param_names = ['size']
+    timeout = 600
+
+    def setup(self, size):
+        self.map = make_map(size)
+        self.new_observer = get_earth('2023-01-02T00:00:00')
+
+    def time_differential_rotate(self, size):
+        differential_rotate(self.map, observer=self.new_observer)
+
+    def peakmem_differential_rotate(self, size):
+        differential_rotate(self.map, observer=self.new_observer)
+
+
+class MapSequenceSuite:
+    params = ([1024, 4096], [4, 16])
+    param_names = ['size', 'n_maps']
+    timeout = 600
+
+    def setup(self, size, n_maps):
+        # The data array is shared between the maps, so that the memory used
+        # by the sequence itself does not dominate
+        data = make_data(size)
+        self.sequence = sunpy.map.MapSequence([
+            sunpy.map.Map(data, make_header(size, f'2023-01-01T{hour:02}:00:00'))
+            for hour in range(n_maps)
+        ])
+        self.new_observer = get_earth('2023-01-02T00:00:00')
+        self.coordinates = SkyCoord([-100, 0, 100]*u.arcsec, [0, 100, -100]*u.arcsec,
+                                    frame=self.sequence[0].coordinate_frame)
+
+    def time_data(self, size, n_maps):
+        self.sequence.data
+
+    def peakmem_data(self, size, n_maps):
+        self.sequence.data
+
+    def time_differential_rotate_sequence(self, size, n_maps):
+        differential_rotate_sequence(self.sequence, observer=self.new_observer)
+
+    def peakmem_differential_rotate_sequence(self, size, n_maps):
+        differential_rotate_sequence(self.sequence, observer=self.new_observer)
+
+    def time_sample_sequence_at_coords(self, size, n_maps):
+        sample_sequence_at_coords(self.sequence, self.coordinates)
+
+
+class MapUtils:
+    params = SIZES
+    param_names = ['size']
+    timeout = 300
+
+    def setup(self, size):
+        self.map = make_map(size)
+
+    def time_contains_full_disk(self, size):
+        contains_full_disk(self.map)
+
+    def time_all_coordinates_from_map(self, size):
+        all_coordinates_from_map(self.map)
+
+    def peakmem_all_coordinates_from_map(self, size):
+        all_coordinates_from_map(self.map)
@@ -18,12 +18,43 @@ below (see `astropy.coordinates.builtin_frames`).
 
 """
 
-from . import sun
-from ._transformations import _make_sunpy_graph, propagate_with_solar_surface, transform_with_sun_center
+import importlib
+
+from ._transformations import (
+    _make_sunpy_graph,
+    clear_transformation_cache,
+    propagate_with_solar_surface,
+    transform_with_sun_center,
+    transformation_cache_info,
+)
 from .ephemeris import *
 from .frames import *
 from .metaframes import *
-from .screens import PlanarScreen, SphericalScreen
 from .wcs_utils import *
 
+# Submodules and objects that are imported only when first accessed, to speed up importing
+# sunpy.coordinates
+_LAZY_ATTRIBUTES = {
+    'sun': ('.sun', None),
+    'PlanarScreen': ('.screens', 'PlanarScreen'),
+    'SphericalScreen': ('.screens', 'SphericalScreen'),
+}
+
+
+# See PEP 562 (https://peps.python.org/pep-0562/) for module-level __getattr__()
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        module = importlib.import_module(module_name, __name__)
+        value = module if attribute is None else getattr(module, attribute)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+# See PEP 562 (https://peps.python.org/pep-0562/) for module-level __dir__()
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __doc__ += _make_sunpy_graph()
@@ -13,8 +13,11 @@ This module contains the functions for converting one
 
 """
 import logging
+import threading
 from copy import deepcopy
-from functools import wraps
+from functools import wraps, lru_cache
+from contextlib import contextmanager
+from collections import OrderedDict, namedtuple
 
 import erfa
 import numpy as np
@@ -31,6 +34,7 @@ from astropy.coordinates import (
     ConvertError,
     HeliocentricMeanEcliptic,
     get_body_barycentric,
+    solar_system_ephemeris,
 )
 from astropy.coordinates.baseframe import frame_transform_graph
 from astropy.coordinates.builtin_frames import make_transform_graph_docs
@@ -48,6 +52,7 @@ from astropy.time import Time
 from sunpy import log
 from sunpy.sun import constants
 from sunpy.util.decorators import sunpycontextmanager
+from sunpy.util.util import _make_readonly
 from .frames import (
     _J2000,
     GeocentricEarthEquatorial,
@@ -67,7 +72,9 @@ from .frames import (
 RSUN_METERS = constants.get('radius').si.to(u.m)
 
 __all__ = ['transform_with_sun_center',
-           'propagate_with_solar_surface']
+           'propagate_with_solar_surface',
+           'transformation_cache_info',
+           'clear_transformation_cache']
 
 
 # Boolean flag for whether to ignore the motion of the center of the Sun in inertial space
@@ -76,6 +83,8 @@ _ignore_sun_motion = False
 
 # If not None, the name of the differential-rotation model to use for any obstime change
 _autoapply_diffrot = None
+# Lock so that temporary internal changes of the above flag from different threads do not interleave
+_autoapply_diffrot_lock = threading.RLock()
 
 
 @sunpycontextmanager
@@ -223,6 +232,24 @@ def propagate_with_solar_surface(rotation_model='howard'):
             _autoapply_diffrot = old_autoapply_diffrot
 
 
+@contextmanager
+def _disable_autoapply_diffrot():
+    """
+    Context manager to temporarily disable automatic solar differential rotation.
+
+    The previous setting is restored on exit while still holding the lock, so that
+    concurrent uses cannot restore each other's temporary setting.
+    """
+    global _autoapply_diffrot
+    with _autoapply_diffrot_lock:
+        old_autoapply_diffrot = _autoapply_diffrot
+        _autoapply_diffrot = None
+        try:
+            yield
+        finally:
+            _autoapply_diffrot = old_autoapply_diffrot
+
+
 # Global counter to keep track of the layer of transformation
 _layer_level = 0
 
@@ -273,6 +300,144 @@ def _transformation_debug(description):
     return decorator
 
 
+# The maximum number of entries in the cache of each time-dependent matrix function
+_TRANSFORMATION_CACHE_SIZE = 128
+
+
+# The time-dependent matrix functions that are cached, by name
+_transformation_caches = {}
+
+
+# Functions which clear other caches of values that depend on the transformations
+_dependent_cache_clears = []
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _time_key(time):
+    """
+    Return a hashable key for a scalar time, or `None` if the time should not be cached.
+    """
+    if not isinstance(time, Time) or not time.isscalar or time.masked or time.location is not None:
+        return None
+    return (time.scale, float(time.jd1), float(time.jd2))
+
+
+def _distance_key(distance):
+    """
+    Return a hashable key for a scalar distance, or `None` if the distance should not be cached.
+    """
+    if not isinstance(distance, u.Quantity) or not distance.isscalar:
+        return None
+    return float(distance.to_value(u.m))
+
+
+def _angle_key(angle):
+    """
+    Return a hashable key for a scalar angle, or `None` if the angle should not be cached.
+    """
+    if not isinstance(angle, u.Quantity) or not angle.isscalar:
+        return None
+    return float(angle.to_value(u.deg))
+
+
+def _cache_by_time(key_func, caches=_transformation_caches):
+    """
+    Decorator to cache the output of a function that depends only on observation times (and other
+    scalar quantities), in a least-recently-used cache of size ``_TRANSFORMATION_CACHE_SIZE``.
+
+    ``key_func`` is called with the same arguments as the function and returns a tuple of the
+    hashable keys for those arguments, any of which are `None` if the output should not be cached
+    (e.g., for array times). The current solar-system ephemeris is always part of the key, since
+    the positions of the Sun and the Earth depend on it.
+
+    Like `functools.lru_cache`, the wrapped function has ``cache_info()`` and ``cache_clear()``
+    methods. Any arrays in the cached output are made read-only. The wrapped function is added
+    by name to the ``caches`` dictionary, which defaults to the caches of the transformation
+    matrices.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        stats = {'hits': 0, 'misses': 0}
+
+        @wraps(func)
+        def wrapped_func(*args):
+            key = key_func(*args)
+            if any(item is None for item in key):
+                return func(*args)
+            key = (solar_system_ephemeris.get(), *key)
+
+            with lock:
+                if key in cache:
+                    stats['hits'] += 1
+                    cache.move_to_end(key)
+                    return cache[key]
+                stats['misses'] += 1
+
+            result = _make_readonly(func(*args))
+
+            with lock:
+                cache[key] = result
+                if len(cache) > _TRANSFORMATION_CACHE_SIZE:
+                    cache.popitem(last=False)
+            return result
+
+        def cache_info():
+            with lock:
+                return CacheInfo(stats['hits'], stats['misses'], _TRANSFORMATION_CACHE_SIZE, len(cache))
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                stats['hits'] = stats['misses'] = 0
+
+        wrapped_func.cache_info = cache_info
+        wrapped_func.cache_clear = cache_clear
+        caches[func.__name__] = wrapped_func
+        return wrapped_func
+    return decorator
+
+
+def transformation_cache_info():
+    """
+    Return the statistics of the caches of time-dependent transformation matrices.
+
+    Transformations between many of the sunpy frames (e.g.,
+    `~sunpy.coordinates.frames.HeliographicStonyhurst` to
+    `~sunpy.coordinates.frames.HeliographicCarrington`) require the positions of the Sun and
+    the Earth at the observation time. The resulting transformation matrices and offsets are
+    cached for the most recently used scalar observation times, so that repeated
+    transformations for the same observation time do not need to recalculate them.
+
+    Returns
+    -------
+    `dict`
+        For each cached matrix function, a named tuple of the number of cache ``hits`` and
+        ``misses``, the ``maxsize`` of the cache, and its current size (``currsize``).
+
+    See Also
+    --------
+    clear_transformation_cache
+    """
+    return {name: func.cache_info() for name, func in _transformation_caches.items()}
+
+
+def clear_transformation_cache():
+    """
+    Clear the caches of time-dependent transformation matrices.
+
+    See Also
+    --------
+    transformation_cache_info
+    """
+    for func in _transformation_caches.values():
+        func.cache_clear()
+    for cache_clear in _dependent_cache_clears:
+        cache_clear()
+
+
 def _observers_are_equal(obs_1, obs_2):
     # Note that this also lets pass the situation where both observers are None
     if obs_1 is obs_2:
@@ -352,6 +517,7 @@ def _transform_obstime(frame, obstime):
         return new_frame
 
 
+@_cache_by_time(lambda obstime, distance: (_time_key(obstime), _distance_key(distance)))
 def _rotation_matrix_hgs_to_hgc(obstime, observer_distance_from_sun):
     """
     Return the rotation matrix from HGS to HGC at the same observation time
@@ -496,7 +662,19 @@ def hpc_to_hcc(heliopcoord, heliocframe):
 
 def _rotation_matrix_hcc_to_hgs(longitude, latitude):
     # Returns the rotation matrix from HCC to HGS based on the observer longitude and latitude
+    key = (_angle_key(longitude), _angle_key(latitude))
+    if None not in key:
+        return _cached_rotation_matrix_hcc_to_hgs(*key)
+    return _compute_rotation_matrix_hcc_to_hgs(longitude, latitude)
+
+
+@lru_cache(maxsize=_TRANSFORMATION_CACHE_SIZE)
+def _cached_rotation_matrix_hcc_to_hgs(longitude, latitude):
+    # The matrix for a single observer, with the longitude and latitude in degrees
+    return _make_readonly(_compute_rotation_matrix_hcc_to_hgs(longitude * u.deg, latitude * u.deg))
+
 
+def _compute_rotation_matrix_hcc_to_hgs(longitude, latitude):
     # Permute the axes of HCC to match HGS Cartesian equivalent
     #   HGS_X = HCC_Z
     #   HGS_Y = HCC_X
@@ -709,6 +887,8 @@ _SUN_DETILT_MATRIX = _rotation_matrix_reprs_to_reprs(_SOLAR_NORTH_POLE_HCRS,
                                                      CartesianRepresentation(0, 0, 1))
 
 
+@_cache_by_time(lambda hcrs_time, hgs_time: (_time_key(hcrs_time), _time_key(hgs_time),
+                                             _ignore_sun_motion))
 def _affine_params_hcrs_to_hgs(hcrs_time, hgs_time):
     """
     Return the affine parameters (matrix and offset) from HCRS to HGS
@@ -852,6 +1032,7 @@ def hcc_to_hcc(from_coo, to_frame):
     return hgscoord.transform_to(to_frame)
 
 
+@_cache_by_time(lambda hmeframe: (_time_key(hmeframe.obstime), _time_key(hmeframe.equinox)))
 def _rotation_matrix_hme_to_hee(hmeframe):
     """
     Return the rotation matrix from HME to HEE at the same observation time
@@ -985,6 +1166,7 @@ def gse_to_hee(gsecoord, heeframe):
     return heeframe._replicate(newrepr, obstime=int_coord.obstime)
 
 
+@_cache_by_time(lambda geiframe: (_time_key(geiframe.obstime), _time_key(geiframe.equinox)))
 def _rotation_matrix_gei_to_gse(geiframe):
     """
     Return the rotation matrix from GEI to gse at the same observation time
@@ -1054,6 +1236,7 @@ def gse_to_gei(gsecoord, geiframe):
 frame_transform_graph._add_merged_transform(GeocentricSolarEcliptic, GeocentricEarthEquatorial, GeocentricSolarEcliptic)
 
 
+@_cache_by_time(lambda obstime: (_time_key(obstime),))
 def _rotation_matrix_hgs_to_hci(obstime):
     """
     Return the rotation matrix from HGS to HCI at the same observation time
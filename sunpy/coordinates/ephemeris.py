@@ -2,9 +2,10 @@
 Ephemeris calculations using SunPy coordinate frames
 """
 import re
+from contextvars import ContextVar
 
 import numpy as np
-import requests
+from numpy.polynomial import chebyshev
 
 import astropy.units as u
 from astropy.constants import c as speed_of_light
@@ -14,6 +15,7 @@ from astropy.coordinates import (
     SkyCoord,
     get_body_barycentric,
     get_body_barycentric_posvel,
+    solar_system_ephemeris,
 )
 from astropy.coordinates.representation import (
     CartesianDifferential,
@@ -24,13 +26,17 @@ from astropy.io import ascii
 from astropy.time import Time
 
 from sunpy import log
+from sunpy.sun import constants
 from sunpy.time import parse_time
 from sunpy.time.time import _variables_for_parse_time_docstring
 from sunpy.util.decorators import add_common_docstring
 from .frames import HeliographicStonyhurst
 
 __all__ = ['get_body_heliographic_stonyhurst', 'get_earth',
-           'get_horizons_coord']
+           'get_horizons_coord', 'EphemerisTable']
+
+# The EphemerisTables that are currently in use in this context, innermost last
+_active_tables = ContextVar('_active_tables', default=())
 
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
@@ -102,6 +108,11 @@ def get_body_heliographic_stonyhurst(body, time='now', observer=None, *, include
     """
     obstime = parse_time(time)
 
+    if observer is None and not include_velocity:
+        values = _tabulated([f"{str(body).lower()}_{component}" for component in "xyz"], obstime)
+        if values is not None:
+            return HeliographicStonyhurst(CartesianRepresentation(*values, unit=u.AU), obstime=obstime)
+
     if observer is None:
         # If there is no observer, there is not adjustment for light travel time
         emitted_time = obstime
@@ -329,6 +340,9 @@ def get_horizons_coord(body, time='now', id_type=None, *, include_velocity=False
     contents = "!$$SOF\n" + '\n'.join(f"{k}={v}" for k, v in args.items())
     log.debug(f"JPL HORIZONS query via POST request:\n{contents}")
 
+    # Imported here to avoid the cost of importing requests with sunpy.coordinates
+    import requests
+
     output = requests.post('https://ssd.jpl.nasa.gov/api/horizons_file.api',
                            data={'format': 'text'}, files={'input': contents})
 
@@ -389,3 +403,248 @@ def get_horizons_coord(body, time='now', id_type=None, *, include_velocity=False
     coord = SkyCoord(vector, frame=HeliocentricEclipticIAU76, obstime=obstime)
 
     return coord.transform_to(HeliographicStonyhurst).reshape(obstime.shape)
+
+
+def _tabulated(names, time):
+    """
+    Return the values of quantities from the `EphemerisTable` in use, or `None` if there is no
+    such table or it does not cover the request.
+    """
+    active_tables = _active_tables.get()
+    if not active_tables:
+        return None
+    return active_tables[-1]._lookup(names, time)
+
+
+@add_common_docstring(**_variables_for_parse_time_docstring())
+class EphemerisTable:
+    """
+    A table of precomputed ephemerides for fast evaluation at many times.
+
+    Evaluating ephemerides with the full calculation is comparatively expensive for each
+    time, which dominates when positions or solar parameters are needed at, e.g., every
+    timestamp of a time series.
+    This table fits piecewise Chebyshev polynomials to the ephemerides over a time span
+    once, after which evaluating them at any number of times within the span only requires
+    evaluating the polynomials.
+
+    The table is used when it is entered as a context manager.
+    Within the context, `get_body_heliographic_stonyhurst` (without an ``observer`` or
+    velocity), `get_earth`, and the functions in `sunpy.coordinates.sun` that depend on
+    them, e.g., `~sunpy.coordinates.sun.B0`, `~sunpy.coordinates.sun.L0`,
+    `~sunpy.coordinates.sun.P`, `~sunpy.coordinates.sun.earth_distance` and
+    `~sunpy.coordinates.sun.carrington_rotation_number`, use the table.
+    Any call with times outside of the span of the table, for a body that is not in the
+    table, or with a different solar-system ephemeris than the one the table was built
+    with falls back to the full calculation.
+
+    Parameters
+    ----------
+    start : {parse_time_types}
+        The start of the time span of the table.
+    end : {parse_time_types}
+        The end of the time span of the table.
+    bodies : `list` of `str`, optional
+        The solar-system bodies to tabulate the locations of, in addition to the Earth.
+    tolerance : `~astropy.units.Quantity`, optional
+        The accuracy of the table.
+        The tabulated angles, and the tabulated locations as seen from the center of the
+        Sun, differ by less than this amount from the full calculation.
+        Defaults to 1 milliarcsecond.
+
+    Attributes
+    ----------
+    errors : `dict`
+        The largest difference from the full calculation for each tabulated quantity,
+        determined at times in between the points used for the fit.
+
+    Notes
+    -----
+    Building a table requires the full calculation at many times, particularly for the
+    P angle, which has a short-period component that needs segments of about a day.
+    For long time spans, a table can be written to a file once with
+    `EphemerisTable.write` and read back in other processes with `EphemerisTable.read`.
+    A table is in use only in the thread (or `asyncio` task) in which it is entered.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import astropy.units as u
+    >>> from astropy.time import Time
+    >>> from sunpy.coordinates import EphemerisTable, sun
+    >>> table = EphemerisTable('2020-01-01', '2020-02-01')
+    >>> times = Time('2020-01-01') + np.arange(10000) * 4*u.min
+    >>> with table:
+    ...     b0 = sun.B0(times)
+    >>> b0[0]  # doctest: +FLOAT_CMP
+    <Latitude -2.94243301 deg>
+    >>> table.write('ephemeris_2020.npz')  # doctest: +SKIP
+    >>> table = EphemerisTable.read('ephemeris_2020.npz')  # doctest: +SKIP
+    """
+
+    # The degree of the Chebyshev polynomials
+    _degree = 10
+    # The initial length of the segments that the time span is split into
+    _initial_segment = 16*u.day
+    # The number of times that the segment length is halved to reach the tolerance
+    _max_refinements = 8
+
+    def __init__(self, start, end, *, bodies=(), tolerance=1*u.mas):
+        self.start = parse_time(start).tt
+        self.end = parse_time(end).tt
+        if self.end <= self.start:
+            raise ValueError("The end of the time span must be after its start.")
+        self.bodies = tuple(dict.fromkeys(['earth', *[body.lower() for body in bodies]]))
+        self.tolerance = tolerance.to(u.arcsec)
+        self.ephemeris = solar_system_ephemeris.get()
+
+        self._span = (self.end - self.start).to_value(u.day)
+        self._coefficients, self.errors = {}, {}
+        for group in self._groups:
+            # Each group of quantities has its own segments, since some vary much faster than others
+            n_segments = int(np.ceil(self._span / self._initial_segment.to_value(u.day)))
+            for _ in range(self._max_refinements + 1):
+                coefficients, error = self._fit(group, n_segments)
+                if error <= self.tolerance:
+                    break
+                n_segments *= 2
+            else:
+                raise RuntimeError(f"The table could not be built to a tolerance of {self.tolerance}.")
+            self._coefficients.update(coefficients)
+            self.errors[group] = error
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} from {self.start.utc.isot} to {self.end.utc.isot} "
+                f"for {', '.join(self.bodies)} (tolerance={self.tolerance}, "
+                f"ephemeris={self.ephemeris})>")
+
+    def __enter__(self):
+        _active_tables.set((*_active_tables.get(), self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        _active_tables.set(_active_tables.get()[:-1])
+
+    @property
+    def _groups(self):
+        # The tabulated quantities, grouped by how their errors are determined
+        groups = {body: [f"{body}_{component}" for component in 'xyz'] for body in self.bodies}
+        return groups | {'earth_detilt_lon': ['earth_detilt_lon'], 'p_angle': ['p_angle']}
+
+    def _calculate(self, group, time):
+        """
+        Calculate a group of tabulated quantities at the specified times without any table.
+        Locations are in AU and angles are in radians.
+        """
+        # Imported here to avoid a circular import
+        from sunpy.coordinates import sun
+
+        token = _active_tables.set(())
+        try:
+            if group == 'earth_detilt_lon':
+                return [sun._detilt_lon(get_earth(time)).to_value(u.rad)]
+            if group == 'p_angle':
+                return [sun.P(time).to_value(u.rad)]
+            return list(get_body_heliographic_stonyhurst(group, time).cartesian.xyz.to_value(u.AU))
+        finally:
+            _active_tables.reset(token)
+
+    def _fit(self, group, n_segments):
+        """
+        Fit the Chebyshev polynomials of a group of quantities for the specified number of
+        segments, and determine their largest error at the extrema of the polynomials in between
+        the nodes.
+        """
+        n_nodes = self._degree + 1
+        nodes = np.cos(np.pi * (np.arange(n_nodes) + 0.5) / n_nodes)
+        checks = np.cos(np.pi * np.arange(n_nodes + 1) / n_nodes)
+        x = np.concatenate([nodes, checks])
+
+        segment = self._span / n_segments
+        offsets = (np.arange(n_segments)[:, np.newaxis] + (x + 1) / 2) * segment
+        values = self._calculate(group, self.start + offsets.ravel() * u.day)
+
+        coefficients, residuals, expected = {}, [], []
+        for name, value in zip(self._groups[group], values):
+            value = value.reshape(offsets.shape)
+            if name.endswith('_lon'):
+                # Remove any wrapping of the longitude within each segment
+                value = value[:, :1] + np.angle(np.exp(1j * (value - value[:, :1])))
+            coefficients[name] = chebyshev.chebfit(nodes, value[:, :n_nodes].T, self._degree)
+            residuals.append(chebyshev.chebval(checks, coefficients[name]) - value[:, n_nodes:])
+            expected.append(value[:, n_nodes:])
+
+        if group in self.bodies:
+            # The error in the location as an angle seen from the center of the Sun
+            radius = np.maximum(np.linalg.norm(expected, axis=0), constants.radius.to_value(u.AU))
+            error = np.max(np.linalg.norm(residuals, axis=0) / radius)
+        else:
+            error = np.max(np.abs(residuals))
+        return coefficients, (error * u.rad).to(u.arcsec)
+
+    def _lookup(self, names, time):
+        """
+        Evaluate the tabulated quantities at the specified times, or return `None` if the table
+        cannot be used for them.
+        """
+        if self.ephemeris != solar_system_ephemeris.get() or not set(names) <= self._coefficients.keys():
+            return None
+        offset = np.asanyarray((time - self.start).to_value(u.day))
+        if not (np.all(offset >= 0) and np.all(offset <= self._span)):
+            return None
+
+        values = []
+        for name in names:
+            coefficients = self._coefficients[name]
+            position = offset * (coefficients.shape[1] / self._span)
+            index = np.clip(np.floor(position).astype(int), 0, coefficients.shape[1] - 1)
+            x = 2 * (position - index) - 1
+            values.append(chebyshev.chebval(x, coefficients[:, index], tensor=False))
+        return values
+
+    def write(self, filename):
+        """
+        Write the table to a file, which can be read with `EphemerisTable.read`.
+
+        Parameters
+        ----------
+        filename : `str` or `pathlib.Path`
+            The file to write to, in the ``.npz`` format of `numpy.savez`.
+        """
+        np.savez(filename,
+                 start=[self.start.jd1, self.start.jd2],
+                 end=[self.end.jd1, self.end.jd2],
+                 bodies=np.array(self.bodies),
+                 tolerance=self.tolerance.to_value(u.arcsec),
+                 ephemeris=self.ephemeris,
+                 error_names=np.array(list(self.errors.keys())),
+                 errors=[error.to_value(u.arcsec) for error in self.errors.values()],
+                 **{f"coefficients_{name}": value for name, value in self._coefficients.items()})
+
+    @classmethod
+    def read(cls, filename):
+        """
+        Read a table that was written with `EphemerisTable.write`.
+
+        Parameters
+        ----------
+        filename : `str` or `pathlib.Path`
+            The file to read from.
+
+        Returns
+        -------
+        `EphemerisTable`
+        """
+        table = cls.__new__(cls)
+        with np.load(filename, allow_pickle=False) as contents:
+            table.start = Time(*contents['start'], format='jd', scale='tt')
+            table.end = Time(*contents['end'], format='jd', scale='tt')
+            table.bodies = tuple(str(body) for body in contents['bodies'])
+            table.tolerance = contents['tolerance'] * u.arcsec
+            table.ephemeris = str(contents['ephemeris'])
+            table.errors = {str(name): error * u.arcsec
+                            for name, error in zip(contents['error_names'], contents['errors'])}
+            table._coefficients = {name: contents[f"coefficients_{name}"]
+                                  for names in table._groups.values() for name in names}
+        table._span = (table.end - table.start).to_value(u.day)
+        return table
@@ -2,9 +2,12 @@
 Coordinate frames that are defined relative to other frames
 """
 
+import numpy as np
+
 import astropy.units as u
 from astropy.coordinates.attributes import Attribute, QuantityAttribute
 from astropy.coordinates.baseframe import frame_transform_graph
+from astropy.coordinates.representation import SphericalRepresentation
 from astropy.coordinates.transformations import FunctionTransform
 
 from sunpy.time import parse_time
@@ -25,6 +28,57 @@ NorthOffsetFrame.__module__ = __name__
 _rotatedsun_cache = {}
 
 
+def _is_constant(array, axis):
+    """
+    Return whether an array has the same values along an axis.
+    """
+    if array.strides[axis] == 0:
+        return True
+    array = array.view(np.ndarray)
+    first = np.take(array, [0], axis=axis)
+    # Check the second element first, since most arrays are not constant
+    return (np.array_equal(np.take(array, [1], axis=axis), first) and
+            bool(np.all(array == first)))
+
+
+def _reduce_data(data):
+    """
+    Return the smallest part of a representation from which the representation can be broadcast.
+
+    The data of a `RotatedSunFrame` is often the same along the axes over which its ``duration``
+    varies, e.g., when tracking an array of coordinates through an array of durations, so
+    transforming only this part of the data avoids repeating the same calculation for each duration.
+    Data with differentials are returned unchanged.
+    """
+    if data.differentials:
+        return data
+    for axis, length in enumerate(data.shape):
+        if length > 1 and all(_is_constant(getattr(data, component), axis)
+                              for component in data.components):
+            data = data[(slice(None),) * axis + (slice(0, 1),)]
+    return data
+
+
+def _apply_diffrot(hgs_coord, duration, rotation_model, shape):
+    """
+    Apply differential rotation over ``duration`` to a coordinate in HGS, returning a coordinate
+    with the specified shape.
+
+    The rotation is proportional to the duration, so the rotation rate is calculated only for
+    the latitudes of the coordinate, which is then broadcast against the duration.
+    """
+    # Import here to avoid a circular import
+    from sunpy.sun.models import differential_rotation
+
+    oldrepr = hgs_coord.spherical
+    rate = differential_rotation(1*u.day, oldrepr.lat, model=rotation_model, frame_time='sidereal')
+    newlon = oldrepr.lon.to_value(u.deg) + rate.to_value(u.deg) * duration.to_value(u.day)
+    newrepr = SphericalRepresentation(newlon << u.deg, oldrepr.lat, oldrepr.distance)
+    if newrepr.shape != shape:
+        newrepr = newrepr._apply(np.broadcast_to, shape=shape, subok=True)
+    return hgs_coord.realize_frame(newrepr)
+
+
 def _make_rotatedsun_cls(framecls):
     """
     Create a new class that is the rotated-Sun frame for a specific class of
@@ -68,11 +122,14 @@ def _make_rotatedsun_cls(framecls):
     @_transformation_debug(f"HGS->{_RotatedSunFramecls.__name__}")
     def reference_to_rotatedsun(hgs_coord, rotatedsun_frame):
         int_frame = HeliographicStonyhurst(obstime=rotatedsun_frame.base.obstime)
+        shape = np.broadcast_shapes(hgs_coord.shape, rotatedsun_frame.duration.shape)
+        # The same coordinates are transformed only once for all of the durations
+        hgs_coord = hgs_coord.realize_frame(_reduce_data(hgs_coord.data))
         int_coord = hgs_coord.make_3d().transform_to(int_frame)  # obstime change handled here
 
         # Rotate the coordinate in HGS
-        int_coord = int_coord._apply_diffrot(-rotatedsun_frame.duration,
-                                             rotatedsun_frame.rotation_model)
+        int_coord = _apply_diffrot(int_coord, -rotatedsun_frame.duration,
+                                   rotatedsun_frame.rotation_model, shape)
 
         # Transform from HGS
         new_coord = int_coord.transform_to(rotatedsun_frame.base)
@@ -82,15 +139,16 @@ def _make_rotatedsun_cls(framecls):
     @_transformation_debug(f"{_RotatedSunFramecls.__name__}->HGS")
     def rotatedsun_to_reference(rotatedsun_coord, hgs_frame):
         # Transform to HGS
-        from_coord = rotatedsun_coord.base.realize_frame(rotatedsun_coord.data)
+        # The same coordinates are transformed only once for all of the durations
+        from_coord = rotatedsun_coord.base.realize_frame(_reduce_data(rotatedsun_coord.data))
         if hasattr(from_coord, 'make_3d'):
             from_coord = from_coord.make_3d()
         int_frame = HeliographicStonyhurst(obstime=rotatedsun_coord.base.obstime)
         int_coord = from_coord.transform_to(int_frame)
 
         # Rotate the coordinate in HGS
-        int_coord = int_coord._apply_diffrot(rotatedsun_coord.duration,
-                                             rotatedsun_coord.rotation_model)
+        int_coord = _apply_diffrot(int_coord, rotatedsun_coord.duration,
+                                   rotatedsun_coord.rotation_model, rotatedsun_coord.shape)
 
         # Transform from HGS
         return int_coord.transform_to(hgs_frame)  # obstime change handled here
@@ -189,9 +247,9 @@ class RotatedSunFrame(SunPyBaseCoordinateFrame):
             raise ValueError("Specify either `duration` or `rotated_time`, not both.")
 
         if duration is not None:
-            rotated_time = base_frame.obstime + duration
-
-        if rotated_time is not None:
+            # Converting a duration to a time and back would be costly for a large duration array
+            kwargs['duration'] = duration.to('day')
+        elif rotated_time is not None:
             kwargs['duration'] = (parse_time(rotated_time) - base_frame.obstime).to('day')
 
         super().__init__(*args, **kwargs)
@@ -77,7 +77,8 @@ from sunpy.time import parse_time
 from sunpy.time.time import _variables_for_parse_time_docstring
 from sunpy.util.decorators import add_common_docstring
 
-__all__ = ['SpiceBaseCoordinateFrame', 'get_body', 'get_fov', 'initialize', 'install_frame', 'get_rotation_matrix']
+__all__ = ['SpiceBaseCoordinateFrame', 'get_body', 'get_fov', 'initialize', 'install_frame', 'get_rotation_matrix',
+           'clear_cache']
 
 
 # Note that this epoch is very slightly different from the typical definition of J2000.0 (in TT)
@@ -90,6 +91,12 @@ _CLASS_TYPES = {1: 'inertial', 2: 'PCK', 3: 'CK', 4: 'TK', 5: 'dynamic', 6: 'swi
 _frame_registry = {}
 _center_registry = {'SOLAR SYSTEM BARYCENTER': ICRS}
 
+# Cache of the results of SPICE calls, which maps the arguments of a call other than the
+# ephemeris time to a tuple of the sorted ephemeris times and the corresponding results
+_spice_cache = {}
+# The largest number of ephemeris times that are cached for each set of arguments
+_CACHE_SIZE = 100_000
+
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
 class SpiceBaseCoordinateFrame(SunPyBaseCoordinateFrame):
@@ -134,12 +141,11 @@ class SpiceBaseCoordinateFrame(SunPyBaseCoordinateFrame):
         et = _convert_to_et(self.obstime)
 
         # Get the matrix to rotate from the SPICE frame to heliographic coordinates
-        # matrix needs to be contiguous (see https://github.com/astropy/astropy/issues/15503)
-        frame_to_iau = np.ascontiguousarray(spiceypy.sxform(self._frame_name, 'IAU_SUN', et)[..., :3, :3])
+        frame_to_iau = _rotation_matrix(self._frame_name, 'IAU_SUN', et)
 
         # Get the observer location in heliographic coordinates
-        obs_iau = spiceypy.spkpos(self._center_name, et, 'IAU_SUN', 'NONE', 'SUN')[0] << u.km
-        obs_iau = CartesianRepresentation(obs_iau.T).represent_as(SphericalRepresentation)
+        obs_iau = _position(self._center_name, et, 'IAU_SUN', 'SUN') << u.km
+        obs_iau = CartesianRepresentation(obs_iau, xyz_axis=-1).represent_as(SphericalRepresentation)
 
         # Construct the matrix to rotate from heliographic coordinates to HPC-like coordinates
         iau_to_hpc = rotation_matrix(-obs_iau.lat, axis='y') @ rotation_matrix(obs_iau.lon, axis='z')
@@ -151,8 +157,8 @@ class SpiceBaseCoordinateFrame(SunPyBaseCoordinateFrame):
         hpc_repr = self.cartesian.transform(flip_x @ iau_to_hpc @ frame_to_iau)
 
         # Get the observer location in ICRS, with obstime define to be able to transform to HGS
-        obs_icrs = spiceypy.spkpos(self._center_name, et, 'J2000', 'NONE', 'SSB')[0] << u.km
-        obs_sc = SkyCoord(CartesianRepresentation(obs_icrs.T), frame='icrs', obstime=self.obstime)
+        obs_icrs = _position(self._center_name, et, 'J2000', 'SSB') << u.km
+        obs_sc = SkyCoord(CartesianRepresentation(obs_icrs, xyz_axis=-1), frame='icrs', obstime=self.obstime)
 
         # Construct the HPC coordinate from the vector and the observer
         out_sc = SkyCoord(hpc_repr, frame='helioprojective', obstime=self.obstime, observer=obs_sc)
@@ -165,6 +171,74 @@ def _convert_to_et(time):
     return (time.tdb - _ET_REF_EPOCH).to_value('s')
 
 
+def clear_cache():
+    """
+    Clear the cache of the results of SPICE calls.
+
+    The locations and orientations computed via SPICE are cached for each
+    ephemeris time, so that repeated transformations at the same times do not
+    repeat the SPICE calls.
+    The cache is cleared automatically by :func:`~sunpy.coordinates.spice.initialize`,
+    but needs to be cleared manually if kernels are loaded or unloaded directly
+    through `~spiceypy.spiceypy`.
+    """
+    _spice_cache.clear()
+
+
+def _cached_spice_call(key, func, et):
+    """
+    Return the results of ``func`` for an array of ephemeris times, calling ``func`` only once
+    with the unique ephemeris times that are not yet in the cache for ``key``.
+    """
+    et = np.asarray(et, dtype=float)
+    unique_et, inverse = np.unique(et, return_inverse=True)
+
+    cached_et, cached_values = _spice_cache.get(key, (np.empty(0), None))
+    index = np.clip(np.searchsorted(cached_et, unique_et), 0, max(len(cached_et) - 1, 0))
+    found = (cached_et[index] == unique_et) if len(cached_et) else np.zeros(len(unique_et), dtype=bool)
+
+    if np.all(found):
+        values = cached_values[index]
+    else:
+        missing_values = np.asarray(func(unique_et[~found]))
+        values = np.empty((len(unique_et), *missing_values.shape[1:]))
+        if cached_values is not None:
+            values[found] = cached_values[index[found]]
+        values[~found] = missing_values
+
+        if cached_values is None or len(cached_et) + np.sum(~found) > _CACHE_SIZE:
+            cached_et, cached_values = unique_et[~found], missing_values
+        else:
+            cached_et = np.concatenate([cached_et, unique_et[~found]])
+            cached_values = np.concatenate([cached_values, missing_values])
+            order = np.argsort(cached_et)
+            cached_et, cached_values = cached_et[order], cached_values[order]
+        _spice_cache[key] = (cached_et, cached_values)
+
+    return values[inverse.reshape(et.shape)]
+
+
+def _rotation_matrix(from_frame, to_frame, et):
+    """
+    Return the rotation matrices from one SPICE frame to another, with a shape of ``et.shape + (3, 3)``.
+    """
+    matrix = _cached_spice_call(('sxform', from_frame, to_frame),
+                                lambda et: spiceypy.sxform(from_frame, to_frame, et)[..., :3, :3],
+                                et)
+    # matrix needs to be contiguous (see https://github.com/astropy/astropy/issues/15503)
+    return np.ascontiguousarray(matrix)
+
+
+def _position(target, et, frame, observer):
+    """
+    Return the positions in km of a target relative to an observer in a SPICE frame, without
+    any aberration corrections, with a shape of ``et.shape + (3,)``.
+    """
+    return _cached_spice_call(('spkpos', target, frame, observer),
+                              lambda et: spiceypy.spkpos(target, et, frame, 'NONE', observer)[0],
+                              et)
+
+
 def _astropy_frame_name(spice_frame_name):
     # Replace plus/minus characters in the SPICE frame name with lowercase 'p'/'n'
     return f"spice_{spice_frame_name.translate(str.maketrans('+-', 'pn'))}"
@@ -193,20 +267,16 @@ def _install_center_by_id(center_id):
     def icrs_to_shifted(from_icrs_coord, to_shifted_frame):
         if _is_2d(from_icrs_coord.data):
             raise ConvertError("Cannot transform a 2D coordinate due to a shift in origin.")
-        icrs_offset = spiceypy.spkpos(center_name,
-                                      _convert_to_et(to_shifted_frame.obstime),
-                                      'J2000', 'NONE', 'SSB')[0] << u.km
-        shifted_pos = from_icrs_coord.cartesian - CartesianRepresentation(icrs_offset.T)
+        icrs_offset = _position(center_name, _convert_to_et(to_shifted_frame.obstime), 'J2000', 'SSB') << u.km
+        shifted_pos = from_icrs_coord.cartesian - CartesianRepresentation(icrs_offset, xyz_axis=-1)
         return to_shifted_frame.realize_frame(shifted_pos)
 
     @frame_transform_graph.transform(FunctionTransformWithFiniteDifference, center_cls, ICRS)
     def shifted_to_icrs(from_shifted_coord, to_icrs_frame):
         if _is_2d(from_shifted_coord.data):
             raise ConvertError("Cannot transform a 2D coordinate due to a shift in origin.")
-        icrs_offset = spiceypy.spkpos(center_name,
-                                      _convert_to_et(from_shifted_coord.obstime),
-                                      'J2000', 'NONE', 'SSB')[0] << u.km
-        icrs_pos = from_shifted_coord.cartesian + CartesianRepresentation(icrs_offset.T)
+        icrs_offset = _position(center_name, _convert_to_et(from_shifted_coord.obstime), 'J2000', 'SSB') << u.km
+        icrs_pos = from_shifted_coord.cartesian + CartesianRepresentation(icrs_offset, xyz_axis=-1)
         return to_icrs_frame.realize_frame(icrs_pos)
 
     frame_transform_graph._add_merged_transform(center_cls, ICRS, center_cls)
@@ -234,17 +304,13 @@ def _install_frame_by_id(frame_id):
 
     @frame_transform_graph.transform(FunctionTransformWithFiniteDifference, center_cls, frame_cls)
     def rotate_from_icrf(from_shifted_coord, to_spice_frame):
-        et = _convert_to_et(to_spice_frame.obstime)
-        # matrix needs to be contiguous (see https://github.com/astropy/astropy/issues/15503)
-        matrix = np.ascontiguousarray(spiceypy.sxform('J2000', frame_name, et)[..., :3, :3])
+        matrix = _rotation_matrix('J2000', frame_name, _convert_to_et(to_spice_frame.obstime))
         new_pos = from_shifted_coord.data.transform(matrix)
         return to_spice_frame.realize_frame(new_pos)
 
     @frame_transform_graph.transform(FunctionTransformWithFiniteDifference, frame_cls, center_cls)
     def rotate_to_icrf(from_spice_coord, to_shifted_frame):
-        et = _convert_to_et(from_spice_coord.obstime)
-        # matrix needs to be contiguous (see https://github.com/astropy/astropy/issues/15503)
-        matrix = np.ascontiguousarray(spiceypy.sxform(frame_name, 'J2000', et)[..., :3, :3])
+        matrix = _rotation_matrix(frame_name, 'J2000', _convert_to_et(from_spice_coord.obstime))
         shifted_pos = from_spice_coord.data.transform(matrix)
         return to_shifted_frame.realize_frame(shifted_pos)
 
@@ -288,6 +354,9 @@ def initialize(kernels):
     # furnsh() needs path strings
     spiceypy.furnsh([str(kernel) for kernel in kernels])
 
+    # Any cached results may no longer be valid with the new kernels
+    clear_cache()
+
     # Remove all existing SPICE frame classes
     global _frame_registry
     if _frame_registry:
@@ -379,11 +448,7 @@ def get_body(body, time, *, spice_frame='J2000', observer=None):
     frame_center = spiceypy.frinfo(spiceypy.namfrm(spice_frame))[0]
 
     if observer is None:
-        pos = spiceypy.spkpos(body_name,
-                              et,
-                              spice_frame,
-                              'NONE',
-                              spiceypy.bodc2n(frame_center))[0] << u.km
+        pos = _position(body_name, et, spice_frame, spiceypy.bodc2n(frame_center)) << u.km
     else:
         obspos = observer.icrs.cartesian.xyz.to_value('km')
         pos, lt = spiceypy.spkcpo(body_name,
@@ -411,7 +476,7 @@ def get_body(body, time, *, spice_frame='J2000', observer=None):
 
     frame_name = 'icrs' if spice_frame == 'J2000' else _astropy_frame_name(spice_frame)
 
-    return SkyCoord(CartesianRepresentation(pos.T), frame=frame_name, obstime=obstime)
+    return SkyCoord(CartesianRepresentation(pos, xyz_axis=-1), frame=frame_name, obstime=obstime)
 
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
@@ -493,6 +558,8 @@ def get_rotation_matrix(source_frame, target_frame, from_time, to_time=None):
     -------
     `~numpy.ndarray`
         A 3x3 rotation matrix for the change in orientation.
+        If either time is an array, the array of rotation matrices has a shape of
+        the broadcast time shape followed by ``(3, 3)``.
 
     Examples
     --------
@@ -522,16 +589,11 @@ def get_rotation_matrix(source_frame, target_frame, from_time, to_time=None):
     from_time_et = _convert_to_et(from_time)
     to_time_et = _convert_to_et(to_time)
 
-    # First transformation: from source frame at from_time to J2000
-    from_source_to_j2000 = spiceypy.sxform(source_frame_spice, "J2000", from_time_et)
+    # First rotation: from source frame at from_time to J2000
+    from_source_to_j2000 = _rotation_matrix(source_frame_spice, "J2000", from_time_et)
 
-    # Second transformation: from J2000 at to_time to target frame
-    from_j2000_to_target = spiceypy.sxform("J2000", target_frame_spice, to_time_et)
+    # Second rotation: from J2000 at to_time to target frame
+    from_j2000_to_target = _rotation_matrix("J2000", target_frame_spice, to_time_et)
 
     # Combine: source -> J2000 -> target
-    combined_transform = spiceypy.mxmg(from_j2000_to_target, from_source_to_j2000)
-
-    # Extract the rotation matrix (upper left 3x3 block)
-    rotation_matrix = combined_transform[:3, :3]
-
-    return rotation_matrix
+    return from_j2000_to_target @ from_source_to_j2000
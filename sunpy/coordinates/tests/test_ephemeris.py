@@ -1,3 +1,5 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -10,7 +12,13 @@ from astropy.coordinates import SkyCoord, solar_system_ephemeris
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.time import Time
 
-from sunpy.coordinates.ephemeris import get_body_heliographic_stonyhurst, get_earth, get_horizons_coord
+from sunpy.coordinates import sun
+from sunpy.coordinates.ephemeris import (
+    EphemerisTable,
+    get_body_heliographic_stonyhurst,
+    get_earth,
+    get_horizons_coord,
+)
 from sunpy.coordinates.tests.strategies import times
 
 # Ensure all of these tests are run on the same parallel worker
@@ -178,3 +186,79 @@ def test_consistency_with_horizons(use_DE440s, obstime):
     e1 = get_body_heliographic_stonyhurst('mars', obstime)
     e2 = get_horizons_coord('Mars barycenter', obstime)
     assert_quantity_allclose(e2.separation_3d(e1), 0*u.km, atol=500*u.m)
+
+
+@pytest.fixture(scope="module")
+def ephemeris_table():
+    return EphemerisTable('2020-01-01', '2020-01-11', bodies=['Mars'])
+
+
+def test_ephemeris_table(ephemeris_table):
+    assert ephemeris_table.bodies == ('earth', 'mars')
+    assert all(error <= ephemeris_table.tolerance for error in ephemeris_table.errors.values())
+
+    times = Time('2020-01-01') + np.linspace(0, 10, 101) * u.day
+    functions = [get_earth, lambda t: get_body_heliographic_stonyhurst('mars', t),
+                 sun.B0, sun.L0, sun.P, sun.earth_distance]
+    expected = [func(times) for func in functions]
+    with ephemeris_table:
+        actual = [func(times) for func in functions]
+
+    for coord in [0, 1]:
+        assert_quantity_allclose(actual[coord].separation(expected[coord]), 0*u.deg, atol=1*u.mas)
+        assert_quantity_allclose(actual[coord].radius, expected[coord].radius, rtol=1e-8)
+    for angle in [2, 3, 4]:
+        assert_quantity_allclose(actual[angle], expected[angle], atol=1*u.mas)
+    assert_quantity_allclose(actual[5], expected[5], rtol=1e-8)
+
+    # The table is not used with a different solar-system ephemeris than it was built with
+    table = copy.copy(ephemeris_table)
+    table.ephemeris = 'de432s'
+    assert table._lookup(['earth_x'], times) is None
+
+
+def test_ephemeris_table_fallback(ephemeris_table, mocker):
+    spy = mocker.spy(ephemeris_table, '_lookup')
+    time = Time('2020-01-02')
+    observer = get_earth(time)
+    with ephemeris_table:
+        # Outside of the time span, for a body that is not tabulated, or with an observer
+        outside = get_earth(Time(['2020-01-02', '2020-02-01']))
+        venus = get_body_heliographic_stonyhurst('venus', time)
+        earth = get_body_heliographic_stonyhurst('earth', time, observer=observer, quiet=True)
+    assert all(value is None for value in spy.spy_return_list)
+
+    assert_array_equal(outside.lat, get_earth(Time(['2020-01-02', '2020-02-01'])).lat)
+    assert venus == get_body_heliographic_stonyhurst('venus', time)
+    assert earth == get_body_heliographic_stonyhurst('earth', time, observer=observer, quiet=True)
+
+
+def test_ephemeris_table_read_write(ephemeris_table, tmp_path):
+    filename = tmp_path / 'table.npz'
+    ephemeris_table.write(filename)
+    table = EphemerisTable.read(filename)
+
+    assert repr(table) == repr(ephemeris_table)
+    assert table.errors == ephemeris_table.errors
+    times = Time('2020-01-01') + np.linspace(0, 10, 101) * u.day
+    with ephemeris_table:
+        expected = sun.L0(times)
+    with table:
+        assert_array_equal(sun.L0(times), expected)
+
+
+def test_ephemeris_table_thread(ephemeris_table, mocker):
+    spy = mocker.spy(ephemeris_table, '_lookup')
+    time = Time('2020-01-02')
+    with ephemeris_table:
+        # The table is not used in other threads
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(sun.L0, time).result()
+        assert spy.call_count == 0
+        sun.L0(time)
+        assert spy.call_count > 0
+
+
+def test_ephemeris_table_errors():
+    with pytest.raises(ValueError, match="must be after its start"):
+        EphemerisTable('2020-01-02', '2020-01-01')
@@ -0,0 +1,41 @@
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import sunpy
+import sunpy.coordinates
+
+
+def _modules_after_import(module):
+    # Import the module in a new process, so that the modules imported by other tests are excluded
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join([str(Path(sunpy.__file__).parents[1]),
+                                         env.get('PYTHONPATH', '')])
+    result = subprocess.run([sys.executable, '-c', f"import sys, {module}; print(*sys.modules)"],
+                            capture_output=True, text=True, check=True, env=env)
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize('lazy_module', ['pandas', 'requests', 'sunpy.coordinates.sun',
+                                         'sunpy.coordinates.screens', 'sunpy.coordinates.spice'])
+def test_import_is_lazy(lazy_module):
+    assert lazy_module not in _modules_after_import('sunpy.coordinates')
+
+
+def test_lazy_attributes():
+    from sunpy.coordinates import PlanarScreen, SphericalScreen, screens, sun
+
+    assert sunpy.coordinates.sun is sun
+    assert sunpy.coordinates.SphericalScreen is screens.SphericalScreen
+    assert sunpy.coordinates.PlanarScreen is PlanarScreen
+    assert SphericalScreen is screens.SphericalScreen
+    assert {'sun', 'PlanarScreen', 'SphericalScreen'} <= set(dir(sunpy.coordinates))
+    with pytest.raises(AttributeError, match="has no attribute 'not_an_attribute'"):
+        sunpy.coordinates.not_an_attribute
+
+
+def test_docstring_graph():
+    assert 'HeliographicStonyhurst' in sunpy.coordinates.__doc__
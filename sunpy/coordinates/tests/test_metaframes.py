@@ -1,15 +1,22 @@
 import pickle
 
+import numpy as np
 import pytest
 from hypothesis import given, settings
 
 import astropy.units as u
-from astropy.coordinates import HeliocentricMeanEcliptic, SkyCoord, frame_transform_graph
+from astropy.coordinates import (
+    HeliocentricMeanEcliptic,
+    SkyCoord,
+    SphericalDifferential,
+    SphericalRepresentation,
+    frame_transform_graph,
+)
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.time import Time, TimeDelta
 
 import sunpy.coordinates.frames as f
-from sunpy.coordinates.metaframes import RotatedSunFrame, _rotatedsun_cache
+from sunpy.coordinates.metaframes import RotatedSunFrame, _reduce_data, _rotatedsun_cache
 from sunpy.coordinates.tests.helpers import assert_longitude_allclose
 from sunpy.coordinates.tests.strategies import latitudes, longitudes, times
 from sunpy.sun import constants
@@ -201,6 +208,49 @@ def test_scalar_base_and_array_duration():
     assert_quantity_allclose(r.cartesian[1].xyz, scalar_base.cartesian.xyz)
 
 
+def test_reduce_data():
+    data = SphericalRepresentation([[1], [2]]*u.deg, [[3, 3, 3], [4, 4, 4]]*u.deg, 1*u.AU)
+    assert _reduce_data(data).shape == (2, 1)
+
+    # The positions are constant along the second axis, but the velocities are not
+    d_lon = np.broadcast_to([1, 2, 3], data.shape)*u.deg/u.day
+    data = data.with_differentials(SphericalDifferential(d_lon, 0*d_lon, d_lon.value*u.km/u.s))
+    assert _reduce_data(data).shape == (2, 3)
+
+
+@pytest.mark.parametrize("as_skycoord", [False, True])
+def test_array_base_and_array_duration(as_skycoord):
+    observer = f.HeliographicStonyhurst(10*u.deg, 20*u.deg, 1*u.AU, obstime='2001-01-02')
+    hpc_frame = f.Helioprojective(observer=observer, obstime='2001-01-02')
+    base = hpc_frame.realize_frame(SphericalRepresentation([[-300], [0], [500]]*u.arcsec,
+                                                           [[200], [-100], [0]]*u.arcsec,
+                                                           [[0.99], [0.995], [0.99]]*u.AU))
+    durations = [-2, 0, 1, 3]*u.day
+    rotated = RotatedSunFrame(base=base, duration=durations)
+    if as_skycoord:
+        rotated = SkyCoord(rotated)
+    assert rotated.shape == (3, 4)
+
+    # Tracking every coordinate through every duration at once is the same as tracking
+    # one coordinate through one duration at a time
+    result = rotated.transform_to(hpc_frame)
+    hgs_frame = f.HeliographicStonyhurst(obstime='2001-01-02')
+    base_hgs = SkyCoord(base).transform_to(hgs_frame)
+    rotated_frame = RotatedSunFrame(base=hpc_frame, duration=durations)
+    inverse = base_hgs.transform_to(rotated_frame)
+    assert inverse.shape == (3, 4)
+    for i in range(3):
+        for j in range(4):
+            expected = RotatedSunFrame(base=base[i, 0], duration=durations[j]).transform_to(hpc_frame)
+            assert_quantity_allclose(result[i, j].Tx, expected.Tx)
+            assert_quantity_allclose(result[i, j].Ty, expected.Ty)
+            assert_quantity_allclose(result[i, j].distance, expected.distance)
+
+            expected = base_hgs[i, 0].transform_to(RotatedSunFrame(base=hpc_frame, duration=durations[j]))
+            assert_quantity_allclose(inverse[i, j].Tx, expected.Tx)
+            assert_quantity_allclose(inverse[i, j].Ty, expected.Ty)
+
+
 def test_base_skycoord(rot_hgs):
     # Check that RotatedSunFrame can be instantiated from a SkyCoord
     s = SkyCoord(1*u.deg, 2*u.deg, 3*u.AU, frame=f.HeliographicStonyhurst, obstime='2001-01-01')
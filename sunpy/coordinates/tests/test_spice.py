@@ -240,3 +240,91 @@ def test_ephemeris_time(spice_test):
     # Test the example in the docstring for the SPICE function et2utc()
     utc = parse_time('1983-04-13 12:09:14.274')
     np.testing.assert_allclose(spice._convert_to_et(utc), -527644192.5403653, rtol=0, atol=3e-5)
+
+
+@pytest.fixture
+def local_spk(tmp_path):
+    # Write an SPK with a circular orbit of the Earth around the solar-system barycenter,
+    # so that the SPICE calls can be checked without downloading any kernels
+    filename = str(tmp_path / 'earth.bsp')
+    epochs = np.linspace(-1e8, 1e8, 2001)
+    angle = 2 * np.pi * epochs / 3.15576e7
+    radius, rate = 1.496e8, 2 * np.pi / 3.15576e7
+    states = np.column_stack([radius * np.cos(angle), radius * np.sin(angle), np.zeros_like(angle),
+                              -radius * rate * np.sin(angle), radius * rate * np.cos(angle),
+                              np.zeros_like(angle)])
+    handle = spiceypy.spkopn(filename, 'test', 0)
+    spiceypy.spkw09(handle, 399, 0, 'J2000', epochs[0], epochs[-1], 'earth', 7, len(epochs), states, epochs)
+    spiceypy.spkcls(handle)
+
+    spiceypy.furnsh(filename)
+    # The IAU orientation of the Sun, for the built-in frame IAU_SUN
+    iau_sun = {'BODY10_POLE_RA': [286.13, 0, 0], 'BODY10_POLE_DEC': [63.87, 0, 0], 'BODY10_PM': [84.176, 14.1844, 0]}
+    for name, values in iau_sun.items():
+        spiceypy.pdpool(name, values)
+    spice.clear_cache()
+    yield filename
+    spiceypy.unload(filename)
+    for name in iau_sun:
+        spiceypy.dvpool(name)
+    spice.clear_cache()
+
+
+def test_get_body_cached(local_spk, mocker):
+    spy = mocker.spy(spiceypy, 'spkpos')
+    obstime = parse_time('2001-01-01') + np.tile(np.arange(10), 3) * u.hour
+    et = spice._convert_to_et(obstime)
+
+    earth = spice.get_body('earth', obstime)
+    # SPICE is called only once, with the unique ephemeris times
+    spy.assert_called_once()
+    np.testing.assert_array_equal(spy.call_args.args[1], np.unique(et))
+
+    expected = np.array([spiceypy.spkpos('EARTH', t, 'J2000', 'NONE', 'SOLAR SYSTEM BARYCENTER')[0]
+                         for t in et])
+    assert_quantity_allclose(earth.cartesian.xyz.T, expected * u.km)
+
+    # Repeated and overlapping calls reuse the cached results
+    spy.reset_mock()
+    assert_quantity_allclose(spice.get_body('earth', obstime[::-1])[::-1].cartesian.xyz, earth.cartesian.xyz,
+                             rtol=0)
+    spy.assert_not_called()
+    new_et = spice._convert_to_et(obstime[0] + np.arange(5, 15) * u.hour)
+    spice.get_body('earth', obstime[0] + np.arange(5, 15) * u.hour)
+    np.testing.assert_array_equal(spy.call_args.args[1], np.setdiff1d(new_et, et))
+
+    # A scalar time has a scalar result
+    assert spice.get_body('earth', obstime[3]).isscalar
+
+    spy.reset_mock()
+    spice.clear_cache()
+    spice.get_body('earth', obstime)
+    spy.assert_called_once()
+
+
+def test_cached_spice_call_overflow(monkeypatch):
+    monkeypatch.setattr(spice, '_CACHE_SIZE', 4)
+    spice.clear_cache()
+
+    def func(et):
+        return et * 10
+
+    np.testing.assert_array_equal(spice._cached_spice_call('test', func, [1, 2, 3]), [10, 20, 30])
+    # The cache overflows, but the results for the times that were cached are still correct
+    np.testing.assert_array_equal(spice._cached_spice_call('test', func, [1, 2, 7, 8]), [10, 20, 70, 80])
+    np.testing.assert_array_equal(spice._cached_spice_call('test', func, [8, 7, 1]), [80, 70, 10])
+    spice.clear_cache()
+
+
+def test_get_rotation_matrix_array(local_spk):
+    from_time = parse_time('2024-07-04') + np.arange(4) * u.day
+    to_time = parse_time('2024-07-18')
+    result = spice.get_rotation_matrix('IAU_SUN', 'IAU_SUN', from_time, to_time)
+    assert result.shape == (4, 3, 3)
+    for i in range(4):
+        expected = spiceypy.sxform('J2000', 'IAU_SUN', spice._convert_to_et(to_time))[:3, :3] @ \
+            spiceypy.sxform('IAU_SUN', 'J2000', spice._convert_to_et(from_time[i]))[:3, :3]
+        np.testing.assert_allclose(result[i], expected)
+    # The Sun rotates by about 14.18 degrees per day
+    np.testing.assert_allclose(result[:, 2, 2], 1)
+    np.testing.assert_allclose(result[:, 0, 0], np.cos(np.deg2rad(14.1844 * np.arange(14, 10, -1))))
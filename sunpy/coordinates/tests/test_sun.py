@@ -12,6 +12,7 @@ from astropy.tests.helper import assert_quantity_allclose
 from astropy.time import Time
 
 from sunpy.coordinates import sun
+from sunpy.sun import constants
 from sunpy.sun.constants import radius
 from .helpers import assert_longitude_allclose
 
@@ -516,6 +517,52 @@ def test_carrington_rotation_roundtrip():
     assert_quantity_allclose(dt.to(u.s), 0*u.s, atol=0.11*u.s)
 
 
+@pytest.fixture(scope="module")
+def carrington_table():
+    return sun.CarringtonRotationTable(2200, 2220)
+
+
+def test_carrington_rotation_table_time(carrington_table):
+    crot = np.linspace(2200, 2221, 51)
+    # Stated precision in the docstring is 0.11 seconds
+    dt = carrington_table.time(crot) - sun.carrington_rotation_time(crot)
+    assert_quantity_allclose(dt.to(u.s), 0*u.s, atol=0.11*u.s)
+    dcrot = sun.carrington_rotation_number(carrington_table.time(crot)) - crot
+    assert_quantity_allclose(dcrot * constants.mean_synodic_period, 0*u.s, atol=0.11*u.s)
+
+    assert carrington_table.time(2210, 180*u.deg) == carrington_table.time(2210.5)
+    assert len(carrington_table.start_times) == 22
+    assert_quantity_allclose((carrington_table.start_times[10] - sun.carrington_rotation_time(2210)).to(u.s),
+                             0*u.s, atol=0.11*u.s)
+
+
+def test_carrington_rotation_table_number(carrington_table):
+    t = Time('2018-01-27') + np.linspace(0, 550, 51) * u.day
+    dcrot = carrington_table.number(t) - sun.carrington_rotation_number(t)
+    assert_quantity_allclose(dcrot * constants.mean_synodic_period, 0*u.s, atol=0.11*u.s)
+
+
+def test_carrington_rotation_table_errors(carrington_table):
+    with pytest.raises(ValueError, match="must be within the range of the table"):
+        carrington_table.time([2210, 2230])
+    with pytest.raises(ValueError, match="must be within the range of the table"):
+        carrington_table.number('2010-01-01')
+    # The range in the message is the range that is accepted
+    with pytest.raises(ValueError, match="must be within the range of the table") as excinfo:
+        carrington_table.number('2010-01-01')
+    start, end = Time(re.search(r"table \((.*) to (.*)\)", str(excinfo.value)).groups())
+    assert start < carrington_table.start_times[0]
+    assert end > carrington_table.start_times[-1]
+    # The times in the message are rounded to milliseconds
+    carrington_table.number(Time([start + 1*u.ms, end - 1*u.ms]))
+    with pytest.raises(ValueError, match="must be within the range of the table"):
+        carrington_table.number(end + 1*u.ms)
+    with pytest.raises(ValueError, match="must be integral"):
+        carrington_table.time(2210.5, 180*u.deg)
+    with pytest.raises(ValueError, match="must not be before the first one"):
+        sun.CarringtonRotationTable(2210, 2200)
+
+
 def test_carrington_rotation_str():
     # Check that by default a human parseable string is returned
     t = sun.carrington_rotation_time(2210)
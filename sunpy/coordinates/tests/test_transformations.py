@@ -18,10 +18,12 @@ from astropy.coordinates import (
     SphericalRepresentation,
     get_body_barycentric,
     get_body_barycentric_posvel,
+    solar_system_ephemeris,
 )
 from astropy.tests.helper import assert_quantity_allclose, quantity_allclose
 from astropy.time import Time
 
+import sunpy.coordinates._transformations
 from sunpy.coordinates import (
     GeocentricEarthEquatorial,
     GeocentricSolarEcliptic,
@@ -36,9 +38,11 @@ from sunpy.coordinates import (
     HelioprojectiveRadial,
     SolarMagnetic,
     SphericalScreen,
+    clear_transformation_cache,
     propagate_with_solar_surface,
     sun,
     transform_with_sun_center,
+    transformation_cache_info,
 )
 from sunpy.coordinates.ephemeris import get_body_heliographic_stonyhurst, get_earth
 from sunpy.coordinates.frames import _J2000
@@ -1234,3 +1238,80 @@ def test_propagate_with_solar_surface():
     assert_quantity_allclose(result4.lon, result1.lon)
     assert_quantity_allclose(result4.lat, result1.lat)
     assert_quantity_allclose(result4.distance, result1.distance)
+
+
+def test_transformation_cache():
+    clear_transformation_cache()
+    assert all(info.currsize == 0 for info in transformation_cache_info().values())
+
+    coord = SkyCoord(10*u.deg, 20*u.deg, 1*u.AU, frame=HeliographicStonyhurst(obstime="2001-01-01"))
+    hgc_frame = HeliographicCarrington(observer='earth', obstime="2001-01-01")
+    result1 = coord.transform_to(hgc_frame)
+    misses = transformation_cache_info()['_rotation_matrix_hgs_to_hgc'].misses
+    assert misses > 0
+
+    # Repeating the transformation only uses the cached matrices
+    result2 = coord.transform_to(hgc_frame)
+    info = transformation_cache_info()['_rotation_matrix_hgs_to_hgc']
+    assert info.misses == misses
+    assert info.hits > 0
+    assert_quantity_allclose(result2.lon, result1.lon, rtol=0)
+
+    # The same matrices are used for inverse transformations
+    hits = transformation_cache_info()['_affine_params_hcrs_to_hgs'].hits
+    assert_quantity_allclose(result2.transform_to(HCRS(obstime="2001-01-01")).cartesian.xyz,
+                             coord.transform_to(HCRS(obstime="2001-01-01")).cartesian.xyz)
+    assert transformation_cache_info()['_affine_params_hcrs_to_hgs'].hits > hits
+
+    clear_transformation_cache()
+    info = transformation_cache_info()['_rotation_matrix_hgs_to_hgc']
+    assert info.currsize == info.hits == info.misses == 0
+
+
+def test_transformation_cache_keys():
+    clear_transformation_cache()
+    coord = SkyCoord(10*u.deg, 20*u.deg, 1*u.AU, frame=HeliographicStonyhurst(obstime="2001-01-01"))
+
+    # Array obstimes are not cached
+    obstimes = Time(["2001-01-01", "2001-01-02"])
+    coord.transform_to(HeliocentricInertial(obstime=obstimes))
+    assert transformation_cache_info()['_rotation_matrix_hgs_to_hci'].currsize == 0
+
+    # The ephemeris is part of the key
+    hci = coord.transform_to(HeliocentricInertial(obstime="2001-01-01"))
+    assert transformation_cache_info()['_rotation_matrix_hgs_to_hci'].currsize == 1
+    with solar_system_ephemeris.set('builtin'):
+        coord.transform_to(HeliocentricInertial(obstime="2001-01-01"))
+    # The default ephemeris is also 'builtin'
+    assert transformation_cache_info()['_rotation_matrix_hgs_to_hci'].currsize == 1
+
+    # Ignoring the motion of Sun center changes the HCRS->HGS offset
+    with transform_with_sun_center():
+        hci_fixed = coord.transform_to(HeliocentricInertial(obstime="2001-02-01"))
+    hci_moving = coord.transform_to(HeliocentricInertial(obstime="2001-02-01"))
+    assert not quantity_allclose(hci_fixed.distance, hci_moving.distance)
+    assert_quantity_allclose(hci_fixed.distance, hci.distance)
+
+    # The cached matrices cannot be modified
+    matrix, _ = sunpy.coordinates._transformations._affine_params_hcrs_to_hgs(Time("2001-01-01"),
+                                                                               Time("2001-01-01"))
+    with pytest.raises(ValueError, match="read-only"):
+        matrix[0, 0] = 1
+
+
+def test_hcc_to_hgs_matrix_cache():
+    _transformations = sunpy.coordinates._transformations
+    _transformations._cached_rotation_matrix_hcc_to_hgs.cache_clear()
+    observer = HeliographicStonyhurst(20*u.deg, 10*u.deg, 1*u.AU, obstime="2001-01-01")
+    hcc_in = Heliocentric([0, 1]*u.km, [0, 2]*u.km, [1, 3]*u.km, observer=observer, obstime="2001-01-01")
+    hcc_in.transform_to(HeliographicStonyhurst(obstime="2001-01-01"))
+    hcc_in.transform_to(HeliographicStonyhurst(obstime="2001-01-01"))
+    assert _transformations._cached_rotation_matrix_hcc_to_hgs.cache_info().hits > 0
+
+    # The matrix only depends on the observer angles, so it is not a time-dependent cache
+    assert '_rotation_matrix_hcc_to_hgs' not in transformation_cache_info()
+    matrix = _transformations._rotation_matrix_hcc_to_hgs(observer.lon, observer.lat)
+    np.testing.assert_allclose(matrix, _transformations._compute_rotation_matrix_hcc_to_hgs(observer.lon,
+                                                                                          observer.lat))
+    with pytest.raises(ValueError, match="read-only"):
+        matrix[0, 0] = 1
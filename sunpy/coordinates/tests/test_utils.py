@@ -1,4 +1,6 @@
 import re
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -7,10 +9,22 @@ import astropy.units as u
 from astropy.coordinates import ConvertError, SkyCoord
 from astropy.tests.helper import assert_quantity_allclose
 
-from sunpy.coordinates import frames, get_earth, sun
+from sunpy.coordinates import (
+    _transformations,
+    clear_transformation_cache,
+    frames,
+    get_earth,
+    propagate_with_solar_surface,
+    sun,
+    transform_with_sun_center,
+    transformation_cache_info,
+)
 from sunpy.coordinates.screens import SphericalScreen
 from sunpy.coordinates.utils import (
+    ComposedTransform,
     GreatArc,
+    _clear_vertex_caches,
+    _limb_vertices,
     get_heliocentric_angle,
     get_limb_coordinates,
     get_rectangle_coordinates,
@@ -418,3 +432,126 @@ def test_get_heliocentric_angle_errors():
     bad_skycoord = SkyCoord(0*u.arcsec, 0*u.arcsec, frame='heliographic_stonyhurst', observer="earth")
     with pytest.raises(ConvertError, match="frame needs a specified obstime"):
         get_heliocentric_angle(bad_skycoord)
+
+
+@pytest.fixture
+def composed_frames():
+    from_frame = frames.Helioprojective(observer=get_earth("2023-01-01"), obstime="2023-01-01")
+    observer = SkyCoord(30*u.deg, 10*u.deg, 0.9*u.AU, frame=frames.HeliographicStonyhurst,
+                        obstime="2023-01-02")
+    to_frame = frames.Helioprojective(observer=observer, obstime="2023-01-02")
+    hgs_frame = frames.HeliographicStonyhurst(obstime="2023-01-02")
+    return from_frame, to_frame, hgs_frame
+
+
+@pytest.mark.parametrize("context", [None, transform_with_sun_center, propagate_with_solar_surface])
+def test_composed_transform_hpc_to_hpc(composed_frames, context):
+    from_frame, to_frame, _ = composed_frames
+    Tx, Ty = np.meshgrid(np.linspace(-1200, 1200, 25), np.linspace(-1200, 1200, 25))
+    with context() if context else contextlib.nullcontext():
+        transform = ComposedTransform(from_frame, to_frame)
+        expected = SkyCoord(Tx*u.arcsec, Ty*u.arcsec, frame=from_frame).transform_to(to_frame)
+    # The transformation uses the state of the context managers when it was created
+    lon, lat, distance = transform(Tx*u.arcsec, Ty*u.arcsec)
+
+    assert_quantity_allclose(lon, expected.Tx, atol=1e-6*u.arcsec)
+    assert_quantity_allclose(lat, expected.Ty, atol=1e-6*u.arcsec)
+    assert_quantity_allclose(distance, expected.distance)
+    # Off-disk coordinates do not have a distance
+    assert np.any(np.isnan(distance))
+    assert np.array_equal(np.isnan(distance), np.isnan(expected.distance))
+
+
+def test_composed_transform_hgs(composed_frames):
+    from_frame, _, hgs_frame = composed_frames
+    Tx, Ty = np.linspace(-700, 700, 10), np.linspace(-600, 600, 10)
+
+    lon, lat, radius = ComposedTransform(from_frame, hgs_frame)(Tx*u.arcsec, Ty*u.arcsec)
+    expected = SkyCoord(Tx*u.arcsec, Ty*u.arcsec, frame=from_frame).transform_to(hgs_frame)
+    assert_quantity_allclose(lon, expected.lon.wrap_at(180*u.deg), atol=1e-6*u.arcsec)
+    assert_quantity_allclose(lat, expected.lat, atol=1e-6*u.arcsec)
+    assert_quantity_allclose(radius, expected.radius)
+
+    lon, lat, distance = ComposedTransform(hgs_frame, from_frame)(lon, lat, radius)
+    assert_quantity_allclose(lon, Tx*u.arcsec, atol=1e-6*u.arcsec)
+    assert_quantity_allclose(lat, Ty*u.arcsec, atol=1e-6*u.arcsec)
+
+
+def test_composed_transform_3d(composed_frames):
+    from_frame, to_frame, _ = composed_frames
+    lon, lat, distance = [-10, 0, 20]*u.deg, [5, 0, -30]*u.deg, [1e6, 1e7, 1e8]*u.km
+
+    result = ComposedTransform(to_frame, from_frame)(lon, lat, distance)
+    expected = SkyCoord(lon, lat, distance, frame=to_frame).transform_to(from_frame)
+    assert_quantity_allclose(result[0], expected.Tx, atol=1e-6*u.arcsec)
+    assert_quantity_allclose(result[1], expected.Ty, atol=1e-6*u.arcsec)
+    assert_quantity_allclose(result[2], expected.distance)
+
+
+def test_composed_transform_threaded(composed_frames):
+    from_frame, to_frame, _ = composed_frames
+    with propagate_with_solar_surface():
+        expected = ComposedTransform(from_frame, to_frame)(100*u.arcsec, 200*u.arcsec)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            transforms = list(executor.map(lambda _: ComposedTransform(from_frame, to_frame), range(8)))
+        # Concurrent constructions do not lose the differential-rotation setting
+        assert _transformations._autoapply_diffrot == "howard"
+    assert _transformations._autoapply_diffrot is None
+    for transform in transforms:
+        result = transform(100*u.arcsec, 200*u.arcsec)
+        assert_quantity_allclose(result[0], expected[0])
+        assert_quantity_allclose(result[1], expected[1])
+
+
+def test_composed_transform_errors(composed_frames):
+    from_frame, to_frame, _ = composed_frames
+    with pytest.raises(TypeError, match="must be Helioprojective or HeliographicStonyhurst"):
+        ComposedTransform(frames.Heliocentric(observer="earth", obstime="2023-01-01"), to_frame)
+    with pytest.raises(ValueError, match="need a specified `obstime`"):
+        ComposedTransform(from_frame, frames.HeliographicStonyhurst())
+    with pytest.raises(ValueError, match="need a fully specified `observer`"):
+        ComposedTransform(from_frame, frames.Helioprojective(obstime="2023-01-01"))
+
+    transform = ComposedTransform(from_frame, to_frame)
+    with SphericalScreen(from_frame.observer):
+        with pytest.raises(RuntimeError, match="does not support the screens"):
+            transform(0*u.deg, 0*u.deg)
+    with pytest.raises(TypeError, match="has no 'unit' attribute"):
+        transform(0, 0)
+
+
+def test_limb_vertices(composed_frames):
+    from_frame, to_frame, hgs_frame = composed_frames
+    observer = from_frame.observer
+    _clear_vertex_caches()
+    for frame in (hgs_frame, to_frame):
+        lon, lat, distance = _limb_vertices(observer, constants.radius, 100, frame)
+        expected = get_limb_coordinates(observer, resolution=100).transform_to(frame)
+        assert_quantity_allclose(lon*u.deg, expected.spherical.lon.wrap_at(180*u.deg), atol=1e-6*u.arcsec)
+        assert_quantity_allclose(lat*u.deg, expected.spherical.lat, atol=1e-6*u.arcsec)
+        assert_quantity_allclose(distance*u.m, expected.spherical.distance)
+
+    # The vertices are cached by observer, radius, resolution and frame
+    assert _limb_vertices(observer, constants.radius, 100, to_frame)[0] is lon
+    assert _limb_vertices.cache_info().hits == 1
+    _limb_vertices(observer, constants.radius, 200, to_frame)
+    assert _limb_vertices.cache_info().currsize == 3
+    # These caches are separate from the caches of the transformation matrices
+    assert '_limb_vertices' not in transformation_cache_info()
+    clear_transformation_cache()
+    assert _limb_vertices.cache_info().currsize == 3
+    _clear_vertex_caches()
+    assert _limb_vertices.cache_info().currsize == 0
+
+
+def test_great_arc_coordinates_hgs():
+    observer = get_earth("2023-01-01")
+    start = SkyCoord(-20*u.deg, 10*u.deg, frame=frames.HeliographicStonyhurst, obstime="2023-01-01",
+                     observer=observer)
+    end = SkyCoord(30*u.deg, -40*u.deg, frame=frames.HeliographicStonyhurst, obstime="2023-01-01",
+                   observer=observer)
+    coordinates = GreatArc(start, end).coordinates(10)
+    assert isinstance(coordinates.frame, frames.HeliographicStonyhurst)
+    assert_quantity_allclose(coordinates[[0, -1]].lon, [-20, 30]*u.deg, atol=1e-6*u.arcsec)
+    assert_quantity_allclose(coordinates[[0, -1]].lat, [10, -40]*u.deg, atol=1e-6*u.arcsec)
+    assert_quantity_allclose(coordinates.radius, constants.radius)
@@ -6,12 +6,21 @@ import numpy as np
 
 import astropy.units as u
 from astropy.coordinates import BaseCoordinateFrame, SkyCoord
-from astropy.coordinates.representation import CartesianRepresentation
-
-from sunpy.coordinates import Heliocentric, HeliographicStonyhurst, get_body_heliographic_stonyhurst
+from astropy.coordinates.representation import CartesianRepresentation, SphericalRepresentation
+
+from sunpy.coordinates import (
+    Heliocentric,
+    HeliographicCarrington,
+    HeliographicStonyhurst,
+    Helioprojective,
+    _transformations,
+    get_body_heliographic_stonyhurst,
+    transform_with_sun_center,
+)
 from sunpy.sun import constants
 
-__all__ = ['GreatArc', 'get_rectangle_coordinates', 'solar_angle_equivalency', 'get_limb_coordinates', 'get_heliocentric_angle']
+__all__ = ['GreatArc', 'get_rectangle_coordinates', 'solar_angle_equivalency', 'get_limb_coordinates',
+           'get_heliocentric_angle', 'ComposedTransform']
 
 
 class GreatArc:
@@ -257,6 +266,15 @@ class GreatArc:
                                       self.v3[np.newaxis, :] * np.sin(these_inner_angles) +
                                       self.center_cartesian) * self.distance_unit
 
+        if _frame_key(self.start_frame) is not None and _observer_key(self.observer) is not None:
+            # Transform the Cartesian locations directly to the frame of the
+            # start point, without constructing any intermediate coordinates
+            source = Helioprojective(observer=self.observer, obstime=self.obstime)
+            transform = _cached_composed_transform(source, self.start_frame)
+            lon, lat, distance = transform._transform_cartesian(*great_arc_points_cartesian.to_value(u.m).T)
+            arc = SphericalRepresentation(lon * u.deg, lat * u.deg, (distance * u.m).to(self.distance_unit))
+            return SkyCoord(self.start_frame.realize_frame(arc))
+
         # Return the coordinates of the great arc between the start and end
         # points
         return SkyCoord(great_arc_points_cartesian[:, 0],
@@ -457,7 +475,19 @@ def get_limb_coordinates(observer, rsun: u.m = constants.radius, resolution=1000
     """
     observer = observer.transform_to(
         HeliographicStonyhurst(obstime=observer.obstime))
-    dsun = observer.radius
+    limb_hcr_rho, limb_hcr_psi, limb_hcr_z = _limb_cylindrical(observer.radius, rsun, resolution)
+    limb = SkyCoord(limb_hcr_rho, limb_hcr_psi, limb_hcr_z,
+                    representation_type='cylindrical',
+                    frame='heliocentric',
+                    observer=observer, obstime=observer.obstime)
+    return limb
+
+
+def _limb_cylindrical(dsun, rsun, resolution):
+    """
+    Return the cylindrical components (rho, psi, z) of the limb in Heliocentric Radial
+    coordinates for an observer at a distance ``dsun`` from Sun center.
+    """
     if dsun <= rsun:
         raise ValueError('Observer distance must be greater than rsun')
     # Create the limb coordinate array using Heliocentric Radial
@@ -465,11 +495,7 @@ def get_limb_coordinates(observer, rsun: u.m = constants.radius, resolution=1000
     limb_hcr_rho = limb_radial_distance * rsun / dsun
     limb_hcr_z = dsun - np.sqrt(limb_radial_distance**2 - limb_hcr_rho**2)
     limb_hcr_psi = np.linspace(0, 2*np.pi, resolution+1)[:-1] << u.rad
-    limb = SkyCoord(limb_hcr_rho, limb_hcr_psi, limb_hcr_z,
-                    representation_type='cylindrical',
-                    frame='heliocentric',
-                    observer=observer, obstime=observer.obstime)
-    return limb
+    return limb_hcr_rho, limb_hcr_psi, limb_hcr_z
 
 
 def get_heliocentric_angle(coordinate_on_solar_disk):
@@ -530,3 +556,342 @@ def get_heliocentric_angle(coordinate_on_solar_disk):
     to_observer = CartesianRepresentation(0, 0, 1) * hcc.observer.radius - normal
     heliocentric_angle = np.arctan2(normal.cross(to_observer).norm(), normal.dot(to_observer))
     return heliocentric_angle.to(u.deg)
+
+
+class ComposedTransform:
+    """
+    A transformation between two fixed coordinate frames that operates on arrays of components.
+
+    Transforming a `~astropy.coordinates.SkyCoord` between, e.g., two
+    `~sunpy.coordinates.frames.Helioprojective` frames with different observers
+    goes through several intermediate frames, each of which is fully constructed,
+    and the ephemeris calculations of each step are repeated for every call.
+    This class instead determines the composed affine transformation between the
+    Cartesian representations of the two frames once, and then applies it, together
+    with the non-linear steps of the transformation, directly to the arrays of
+    longitude, latitude and (optionally) distance of the coordinates.
+
+    The source and destination frames can each be either a
+    `~sunpy.coordinates.frames.Helioprojective` or a
+    `~sunpy.coordinates.frames.HeliographicStonyhurst` frame.
+    The state of :func:`~sunpy.coordinates.transform_with_sun_center` and
+    :func:`~sunpy.coordinates.propagate_with_solar_surface` when the transformation
+    is created is used for all later calls.
+
+    Parameters
+    ----------
+    from_frame : `~sunpy.coordinates.frames.Helioprojective`, `~sunpy.coordinates.frames.HeliographicStonyhurst`
+        The frame to transform from.
+        This frame needs to have an ``obstime``, and a ``Helioprojective`` frame also
+        needs an ``observer``.
+    to_frame : `~sunpy.coordinates.frames.Helioprojective`, `~sunpy.coordinates.frames.HeliographicStonyhurst`
+        The frame to transform to, with the same requirements as ``from_frame``.
+
+    Notes
+    -----
+    Any input coordinates without a distance are assumed to be on the surface of the Sun
+    (with the ``rsun`` of ``from_frame``), in the same way as for 2D coordinates in
+    these frames.
+    The screens in `sunpy.coordinates.screens` are not supported.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> from sunpy.coordinates import Helioprojective, get_earth
+    >>> from sunpy.coordinates.utils import ComposedTransform
+    >>> from_frame = Helioprojective(observer=get_earth("2023-01-01"), obstime="2023-01-01")
+    >>> to_frame = Helioprojective(observer=get_earth("2023-01-02"), obstime="2023-01-02")
+    >>> transform = ComposedTransform(from_frame, to_frame)
+    >>> Tx, Ty, distance = transform([0, 360]*u.arcsec, [0, 360]*u.arcsec)
+    >>> Tx.to(u.arcsec)  # doctest: +FLOAT_CMP
+    <Quantity [-17.4807997 , 344.68604457] arcsec>
+    """
+
+    def __init__(self, from_frame, to_frame):
+        for frame in (from_frame, to_frame):
+            if not isinstance(frame, Helioprojective | HeliographicStonyhurst):
+                raise TypeError("The frames must be Helioprojective or HeliographicStonyhurst frames, "
+                                f"not {frame.__class__.__name__}.")
+            if frame.obstime is None:
+                raise ValueError("The frames need a specified `obstime`.")
+            if isinstance(frame, Helioprojective) and not isinstance(frame.observer, BaseCoordinateFrame):
+                raise ValueError("The Helioprojective frames need a fully specified `observer`.")
+        self.from_frame = from_frame
+        self.to_frame = to_frame
+
+        # Hold the lock so that no other construction temporarily disables the rotation model
+        with _transformations._autoapply_diffrot_lock:
+            self._rotation_model = _transformations._autoapply_diffrot
+            if self._rotation_model and np.any(to_frame.obstime != from_frame.obstime):
+                # Solar rotation is applied in the heliographic Stonyhurst frame at the obstime of
+                # the source frame, with the remaining steps following the center of the Sun
+                self._duration = (to_frame.obstime - from_frame.obstime).to(u.day)
+                hgs_frame = HeliographicStonyhurst(obstime=from_frame.obstime, rsun=from_frame.rsun)
+                with _transformations._disable_autoapply_diffrot():
+                    self._affine_in = self._affine_params(from_frame, hgs_frame)
+                    with transform_with_sun_center():
+                        self._affine_out = self._affine_params(hgs_frame, to_frame)
+            else:
+                self._duration = None
+                self._affine_in = self._affine_params(from_frame, to_frame)
+                self._affine_out = None
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} from {self.from_frame.__class__.__name__} "
+                f"(obstime={self.from_frame.obstime}) to {self.to_frame.__class__.__name__} "
+                f"(obstime={self.to_frame.obstime})>")
+
+    @staticmethod
+    def _cartesian_frame(frame):
+        # The frame whose Cartesian representation is used for the affine transformation
+        if isinstance(frame, Helioprojective):
+            return Heliocentric(observer=frame.observer, obstime=frame.obstime)
+        return frame.replicate_without_data()
+
+    @classmethod
+    def _affine_params(cls, from_frame, to_frame):
+        """
+        Return the matrix and offset of the affine transformation between the Cartesian
+        representations of two frames, by transforming the origin and three basis vectors.
+        """
+        scale = constants.radius.to_value(u.m)
+        basis = np.concatenate([np.zeros((3, 1)), np.eye(3)], axis=1) * scale
+        points = SkyCoord(CartesianRepresentation(basis * u.m), frame=cls._cartesian_frame(from_frame))
+        points = points.transform_to(cls._cartesian_frame(to_frame)).cartesian.xyz.to_value(u.m)
+        offset = points[:, 0]
+        matrix = (points[:, 1:] - offset[:, np.newaxis]) / scale
+        return matrix, offset
+
+    @staticmethod
+    def _to_cartesian(frame, lon, lat, distance):
+        """
+        Return the Cartesian coordinates in meters of the Cartesian frame of ``frame``.
+        """
+        if isinstance(frame, Helioprojective):
+            observer_distance = frame.observer.radius.to_value(u.m)
+            if distance is None:
+                if Helioprojective._assumed_screen:
+                    raise RuntimeError("ComposedTransform does not support the screens in "
+                                       "sunpy.coordinates.screens.")
+                # Calculate the distance to the surface of the Sun using the law of cosines,
+                # as in Helioprojective.make_3d()
+                cos_alpha = np.cos(lat) * np.cos(lon)
+                c = observer_distance**2 - frame.rsun.to_value(u.m)**2
+                b = -2 * observer_distance * cos_alpha
+                with np.errstate(invalid='ignore'):
+                    distance = ((-1*b) - np.sqrt(b**2 - 4*c)) / 2
+            return (distance * np.cos(lat) * np.sin(lon),
+                    distance * np.sin(lat),
+                    observer_distance - distance * np.cos(lat) * np.cos(lon))
+
+        if distance is None:
+            distance = frame.rsun.to_value(u.m)
+        return (distance * np.cos(lat) * np.cos(lon),
+                distance * np.cos(lat) * np.sin(lon),
+                distance * np.sin(lat))
+
+    @staticmethod
+    def _from_cartesian(frame, x, y, z):
+        """
+        Return the longitude, latitude (in radians) and distance (in meters) from the
+        Cartesian coordinates in the Cartesian frame of ``frame``.
+        """
+        if isinstance(frame, Helioprojective):
+            z = frame.observer.radius.to_value(u.m) - z
+            x, y, z = z, x, y
+        hypot = np.hypot(x, y)
+        return np.arctan2(y, x), np.arctan2(z, hypot), np.hypot(hypot, z)
+
+    @staticmethod
+    def _apply_affine(params, x, y, z):
+        matrix, offset = params
+        return (matrix[0, 0] * x + matrix[0, 1] * y + matrix[0, 2] * z + offset[0],
+                matrix[1, 0] * x + matrix[1, 1] * y + matrix[1, 2] * z + offset[1],
+                matrix[2, 0] * x + matrix[2, 1] * y + matrix[2, 2] * z + offset[2])
+
+    @u.quantity_input
+    def __call__(self, lon: u.deg, lat: u.deg, distance: u.m = None):
+        """
+        Transform coordinates from ``from_frame`` to ``to_frame``.
+
+        Parameters
+        ----------
+        lon : `~astropy.units.Quantity`
+            The longitude (or ``Tx``) of the coordinates.
+        lat : `~astropy.units.Quantity`
+            The latitude (or ``Ty``) of the coordinates.
+        distance : `~astropy.units.Quantity`, optional
+            The distance (or radius) of the coordinates.
+            If not provided, the coordinates are assumed to be on the surface of the Sun.
+            For a ``Helioprojective`` frame, the coordinates that are not on the
+            solar disk then have a distance of NaN.
+
+        Returns
+        -------
+        lon, lat, distance : `~astropy.units.Quantity`
+            The longitude (or ``Tx``) and latitude (or ``Ty``) in degrees, and the distance
+            (or radius) in meters, of the coordinates in ``to_frame``.
+        """
+        if distance is not None:
+            distance = distance.to_value(u.m)
+        xyz = self._to_cartesian(self.from_frame, lon.to_value(u.rad), lat.to_value(u.rad), distance)
+        lon, lat, distance = self._transform_cartesian(*xyz)
+        return lon * u.deg, lat * u.deg, distance * u.m
+
+    def _transform_cartesian(self, x, y, z):
+        """
+        Transform Cartesian coordinates in meters in the Cartesian frame of ``from_frame``,
+        returning the longitude and latitude in degrees, and the distance in meters, in
+        ``to_frame`` as plain arrays.
+        """
+        xyz = self._apply_affine(self._affine_in, x, y, z)
+
+        if self._affine_out is not None:
+            # Imported here to avoid a circular import
+            from sunpy.sun.models import differential_rotation
+
+            hgs_lon, hgs_lat, radius = self._from_cartesian(HeliographicStonyhurst(), *xyz)
+            hgs_lon = hgs_lon + differential_rotation(self._duration, hgs_lat * u.rad,
+                                                      model=self._rotation_model,
+                                                      frame_time='sidereal').to_value(u.rad)
+            xyz = (radius * np.cos(hgs_lat) * np.cos(hgs_lon),
+                   radius * np.cos(hgs_lat) * np.sin(hgs_lon),
+                   radius * np.sin(hgs_lat))
+            xyz = self._apply_affine(self._affine_out, *xyz)
+
+        lon, lat, distance = self._from_cartesian(self.to_frame, *xyz)
+        return np.rad2deg(lon), np.rad2deg(lat), distance
+
+
+# The caches of the composed transforms and plotting vertices below, by name. These are kept
+# apart from the caches of the transformation matrices in _transformations.
+_vertex_caches = {}
+
+
+def _clear_vertex_caches():
+    for func in _vertex_caches.values():
+        func.cache_clear()
+
+
+def _observer_key(observer):
+    """
+    Return a hashable key for a scalar observer, or `None` if the observer cannot be cached.
+    """
+    if isinstance(observer, SkyCoord):
+        observer = observer.frame
+    if not isinstance(observer, BaseCoordinateFrame) or not observer.has_data or not observer.isscalar:
+        return None
+    if not isinstance(observer, HeliographicStonyhurst):
+        if observer.obstime is None:
+            return None
+        observer = observer.transform_to(HeliographicStonyhurst(obstime=observer.obstime))
+    time_key = _transformations._time_key(observer.obstime)
+    if time_key is None:
+        return None
+    return (time_key,
+            float(observer.lon.to_value(u.deg)),
+            float(observer.lat.to_value(u.deg)),
+            float(observer.radius.to_value(u.m)))
+
+
+def _frame_key(frame):
+    """
+    Return a hashable key for a frame that is supported by `ComposedTransform`, or `None` if
+    the frame is not supported or cannot be cached.
+    """
+    if not isinstance(frame, Helioprojective | HeliographicStonyhurst):
+        return None
+    keys = [frame.__class__.__name__,
+            _transformations._time_key(frame.obstime),
+            _transformations._distance_key(frame.rsun)]
+    if isinstance(frame, Helioprojective):
+        keys.append(_observer_key(frame.observer))
+    if any(key is None for key in keys):
+        return None
+    return tuple(keys)
+
+
+def _state_key():
+    # The state of transform_with_sun_center() and propagate_with_solar_surface()
+    return _transformations._ignore_sun_motion, str(_transformations._autoapply_diffrot)
+
+
+@_transformations._cache_by_time(lambda from_frame, to_frame: (_frame_key(from_frame),
+                                                               _frame_key(to_frame),
+                                                               *_state_key()),
+                                 caches=_vertex_caches)
+def _cached_composed_transform(from_frame, to_frame):
+    """
+    Return a `ComposedTransform` between two frames, which is cached for frames for which
+    `_frame_key` returns a key.
+    """
+    return ComposedTransform(from_frame, to_frame)
+
+
+@_transformations._cache_by_time(lambda observer, rsun, resolution, frame: (_observer_key(observer),
+                                                                            _transformations._distance_key(rsun),
+                                                                            resolution,
+                                                                            _frame_key(frame),
+                                                                            *_state_key()),
+                                 caches=_vertex_caches)
+def _limb_vertices(observer, rsun, resolution, frame):
+    """
+    Return the longitude and latitude in degrees, and the distance in meters, of the limb
+    as seen by ``observer`` in the coordinate frame ``frame``.
+
+    This is equivalent to transforming the output of `get_limb_coordinates` to ``frame``,
+    but does not construct any coordinate objects, and is cached by observer, radius,
+    resolution and frame, which must be supported by `ComposedTransform`.
+    """
+    observer = observer.transform_to(HeliographicStonyhurst(obstime=observer.obstime))
+    rho, psi, z = _limb_cylindrical(observer.radius, rsun, resolution)
+    rho, psi, z = rho.to_value(u.m), psi.to_value(u.rad), z.to_value(u.m)
+    # The Cartesian frame of this frame is the Heliocentric frame of the observer
+    source = Helioprojective(observer=observer, obstime=observer.obstime)
+    transform = _cached_composed_transform(source, frame)
+    return transform._transform_cartesian(rho * np.cos(psi), rho * np.sin(psi),
+                                          np.full(resolution, z))
+
+
+@_transformations._cache_by_time(lambda rsun, resolution, frame: (_transformations._distance_key(rsun),
+                                                                  resolution,
+                                                                  _frame_key(frame),
+                                                                  *_state_key()),
+                                 caches=_vertex_caches)
+def _equator_vertices(rsun, resolution, frame):
+    """
+    Return the longitude and latitude in degrees, and the distance in meters, of the solar
+    equator at the observation time of ``frame`` in that frame.
+    """
+    lon = np.deg2rad(np.linspace(-180, 179, resolution))
+    radius = rsun.to_value(u.m)
+    source = HeliographicStonyhurst(obstime=frame.obstime)
+    transform = _cached_composed_transform(source, frame)
+    return transform._transform_cartesian(radius * np.cos(lon), radius * np.sin(lon),
+                                          np.zeros(resolution))
+
+
+@_transformations._cache_by_time(lambda rsun, resolution, frame: (_transformations._distance_key(rsun),
+                                                                  resolution,
+                                                                  _frame_key(frame)
+                                                                  if isinstance(frame, Helioprojective)
+                                                                  else None,
+                                                                  *_state_key()),
+                                 caches=_vertex_caches)
+def _prime_meridian_vertices(rsun, resolution, frame):
+    """
+    Return the longitude and latitude in degrees, and the distance in meters, of the solar
+    prime meridian (zero Carrington longitude) for the observer of ``frame`` in that frame.
+    """
+    # Carrington longitude differs from Stonyhurst longitude by a rotation about the
+    # solar rotation axis, which is found from a single coordinate
+    source = HeliographicStonyhurst(obstime=frame.obstime)
+    origin = SkyCoord(0*u.deg, 0*u.deg, frame=HeliographicCarrington(observer=frame.observer,
+                                                                     obstime=frame.obstime))
+    lon = origin.transform_to(source).lon.to_value(u.rad)
+    lat = np.deg2rad(np.linspace(-90, 90, resolution))
+    radius = rsun.to_value(u.m)
+    transform = _cached_composed_transform(source, frame)
+    return transform._transform_cartesian(radius * np.cos(lat) * np.cos(lon),
+                                          radius * np.cos(lat) * np.sin(lon),
+                                          radius * np.sin(lat))
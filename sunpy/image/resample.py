@@ -1,14 +1,30 @@
 """
 Image resampling methods.
 """
+from itertools import product
+
 import numpy as np
 import scipy.interpolate
 import scipy.ndimage
 
 from sunpy.util.exceptions import warn_user
 
+try:
+    from dask.array import Array as DaskArray
+    DASK_INSTALLED = True
+except ImportError:
+    DASK_INSTALLED = False
+
 __all__ = ['resample', 'reshape_image_to_4d_superpixel']
 
+# Size (along each axis) of the tiles of original pixels that are resampled at once
+_TILE_SIZE = 1024
+# Approximate number of original pixels that are reduced into superpixels at once
+_SUPERPIXEL_STRIP_SIZE = 2**22
+# The spline prefilter is not local, but the influence of a pixel decays by a factor
+# of ~0.27 per pixel, so beyond this many pixels it is below floating-point precision
+_SPLINE_HALO = 24
+
 
 def resample(orig, dimensions, method='linear', center=False, minusone=False):
     """
@@ -24,7 +40,7 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
 
     Parameters
     ----------
-    orig : `numpy.ndarray`
+    orig : `numpy.ndarray` or `dask.array.Array`
         Original input array.
     dimensions : `tuple`
         Dimensions that new `numpy.ndarray` should have.
@@ -44,8 +60,22 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
 
     Returns
     -------
-    out : `numpy.ndarray`
+    out : `numpy.ndarray` or `dask.array.Array`
         A new `numpy.ndarray` which has been resampled to the desired dimensions.
+        If ``orig`` is a dask array, a dask array is returned, which is computed
+        lazily.
+
+    Notes
+    -----
+    The resampling is performed in tiles, each of which only reads the part of
+    ``orig`` that it needs (plus a halo of surrounding pixels). This means that
+    memory-mapped arrays are never fully loaded into memory, and that each chunk of
+    a dask array is resampled separately. For a dask array, the data are not checked
+    for non-finite values when using ``method='spline'``.
+
+    Since the spline prefilter is not local, the spline interpolation of a tiled
+    array can differ from that of the whole array, but only at the level of
+    floating-point precision.
 
     References
     ----------
@@ -56,85 +86,124 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
     if len(dimensions) != orig.ndim:
         raise UnequalNumDimensions("Number of dimensions must remain the same "
                                    "when calling resample.")
-    if method == 'spline' and not np.isfinite(orig).all():
-        warn_user("Input data contains non-finite values, which may cause the entire output to be NaN when using method='spline'")
-
-    # TODO: Will this be okay for integer (e.g. JPEG 2000) data?
-    if orig.dtype not in [np.float64, np.float32]:
-        orig = orig.astype(np.float64)
-
+    if method not in ['nearest', 'linear', 'spline']:
+        raise UnrecognizedInterpolationMethod(f"Unrecognized interpolation method requested: {method}")
     dimensions = np.asarray(dimensions, dtype=np.float64)
     m1 = np.array(minusone, dtype=np.int64)  # array(0) or array(1)
     offset = np.float64(center * 0.5)       # float64(0.) or float64(0.5)
 
-    # Resample data
-    if method in ['nearest', 'linear']:
-        data = _resample_nearest_linear(orig, dimensions, method,
-                                        offset, m1)
-    elif method == 'spline':
-        data = _resample_spline(orig, dimensions, offset, m1)
+    # The coordinates of the new pixels along each axis, both in terms of the array
+    # indices of the original pixels and in the form used by the interpolation
+    scale = (np.asarray(orig.shape) - m1) / (dimensions - m1)
+    index_coords = [(np.arange(dimensions[i], dtype=float) + offset) * scale[i] - offset
+                    for i in range(orig.ndim)]
+    if method == 'spline':
+        old_coords = [np.arange(n, dtype=float) for n in orig.shape]
+        new_coords = index_coords
+        halo = _SPLINE_HALO
     else:
-        raise UnrecognizedInterpolationMethod(f"Unrecognized interpolation method requested: {method}")
-
+        old_coords = [np.arange(n, dtype=float) + offset for n in orig.shape]
+        new_coords = [(np.arange(dimensions[i], dtype=float) + offset) * scale[i]
+                      for i in range(orig.ndim)]
+        halo = 1
+
+    # Resample the data in tiles, each of which only needs the region of the
+    # original data that it covers (plus a halo)
+    if _is_dask(orig):
+        ntiles = [len(chunks) for chunks in orig.chunks]
+    else:
+        ntiles = [int(np.ceil(n / _TILE_SIZE)) for n in orig.shape]
+    tiles = [_tile_slices(index_coords[i], ntiles[i], orig.shape[i], halo) for i in range(orig.ndim)]
+
+    def tile_arguments(in_slices, out_slices):
+        # The spline coordinates are array indices, so are made relative to the tile
+        shifts = [sl.start if method == 'spline' else 0 for sl in in_slices]
+        return (orig[in_slices],
+                [coords[sl] for coords, sl in zip(old_coords, in_slices)],
+                [coords[sl] - shift for coords, sl, shift in zip(new_coords, out_slices, shifts)],
+                method)
+
+    dtype = _resample_tile(np.zeros((2,) * orig.ndim, dtype=orig.dtype),
+                           [np.arange(2.)] * orig.ndim, [np.array([0.5])] * orig.ndim, method).dtype
+    if _is_dask(orig):
+        import dask
+        import dask.array
+
+        blocks = np.empty([len(tile) for tile in tiles], dtype=object)
+        for index in np.ndindex(blocks.shape):
+            in_slices, out_slices = zip(*[tile[i] for tile, i in zip(tiles, index)])
+            shape = tuple(sl.stop - sl.start for sl in out_slices)
+            blocks[index] = dask.array.from_delayed(
+                dask.delayed(_resample_tile)(*tile_arguments(in_slices, out_slices)),
+                shape=shape, dtype=dtype)
+        return dask.array.block(blocks.tolist())
+
+    data = np.empty([len(coords) for coords in index_coords], dtype=dtype)
+    all_finite = True
+    for tile in product(*tiles):
+        in_slices, out_slices = zip(*tile)
+        tile_orig, *args = tile_arguments(in_slices, out_slices)
+        tile_orig = np.asarray(tile_orig)
+        if method == 'spline':
+            all_finite &= bool(np.isfinite(tile_orig).all())
+        data[out_slices] = _resample_tile(tile_orig, *args)
+    if not all_finite:
+        warn_user("Input data contains non-finite values, which may cause the entire output to be NaN when using method='spline'")
     return data
 
 
-def _resample_nearest_linear(orig, dimensions, method, offset, m1):
-    """
-    Resample Map using either linear or nearest interpolation.
+def _is_dask(array):
+    return DASK_INSTALLED and isinstance(array, DaskArray)
 
-    Parameters
-    ----------
-    orig : array-like
-        Original data.
-    dimensions : `tuple`
-        Dimensions of resampled data.
-    method : `str`
-        Interpolation method passed to `~scipy.interpolate.interpn`
-    offset : `float`
-        Either 0 or 0.5, depending on whether interpolation is at the edge or
-        centers of bins.
-    m1 : 0 or 1
-        For ``orig.shape = (i,j)`` & new dimensions ``= (x,y)``, if set to `False`
-        (default) ``orig`` is resampled by factors of ``(i/x) * (j/y)``,
-        otherwise ``orig`` is resampled by ``(i-1)/(x-1) * (j-1)/(y-1)``.
-        This prevents extrapolation one element beyond bounds of input array.
-    """
-    old_coords = [np.arange(i, dtype=float) + offset for i in orig.shape]
-    scale = (orig.shape - m1) / (dimensions - m1)
-    new_coords = [(np.arange(dimensions[i], dtype=float) + offset) * scale[i] for i in
-                  range(len(dimensions))]
-    new_coords = np.stack(np.meshgrid(*new_coords, indexing='ij'), axis=-1)
-    # fill_value = None extrapolates outside the domain
-    new_data = scipy.interpolate.interpn(old_coords, orig, new_coords,
-                                         method=method, bounds_error=False,
-                                         fill_value=None)
 
-    return new_data
+def _tile_slices(index_coords, ntiles, n_in, halo):
+    """
+    Split the pixels along one axis of the output into ``ntiles`` tiles.
 
+    ``index_coords`` are the positions of the output pixels in terms of the array
+    indices of the ``n_in`` original pixels.
 
-def _resample_spline(orig, dimensions, offset, m1):
+    Returns a list of ``(input_slice, output_slice)`` pairs, where the input slice
+    covers the original pixels needed by the output tile.
     """
-    Resample Map using spline-based interpolation.
+    n_out = len(index_coords)
+    edges = np.linspace(0, n_out, min(ntiles, n_out) + 1).astype(int)
+    slices = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        in_start = max(int(np.floor(index_coords[start])) - halo, 0)
+        in_stop = min(int(np.ceil(index_coords[stop - 1])) + halo + 1, n_in)
+        # A tile that is entirely beyond the original array extrapolates from its edge
+        in_start = min(in_start, n_in - 1)
+        in_stop = max(in_stop, in_start + 1)
+        slices.append((slice(in_start, in_stop), slice(start, stop)))
+    return slices
+
+
+def _resample_tile(orig, old_coords, new_coords, method):
     """
-    nslices = [slice(0, j) for j in list(dimensions)]
-    newcoords = np.mgrid[nslices]
-
-    newcoords_dims = list(range(newcoords.ndim))
+    Resample one tile of the original data.
 
-    # make first index last
-    newcoords_dims.append(newcoords_dims.pop(0))
-    newcoords_tr = newcoords.transpose(newcoords_dims)
-
-    # makes a view that affects newcoords
-    newcoords_tr += offset
-
-    deltas = (np.asarray(orig.shape) - m1) / (dimensions - m1)
-    newcoords_tr *= deltas
-
-    newcoords_tr -= offset
+    Parameters
+    ----------
+    orig : `numpy.ndarray`
+        Original data covered by the tile.
+    old_coords : `list` of `numpy.ndarray`
+        The coordinates of the original pixels along each axis.
+    new_coords : `list` of `numpy.ndarray`
+        The coordinates of the resampled pixels along each axis.
+    method : `str`
+        Interpolation method.
+    """
+    # TODO: Will this be okay for integer (e.g. JPEG 2000) data?
+    if orig.dtype not in [np.float64, np.float32]:
+        orig = orig.astype(np.float64)
 
-    return scipy.ndimage.map_coordinates(orig, newcoords)
+    new_coords = np.meshgrid(*new_coords, indexing='ij')
+    if method == 'spline':
+        return scipy.ndimage.map_coordinates(orig, np.stack(new_coords))
+    # fill_value = None extrapolates outside the domain
+    return scipy.interpolate.interpn(old_coords, orig, np.stack(new_coords, axis=-1),
+                                     method=method, bounds_error=False, fill_value=None)
 
 
 def reshape_image_to_4d_superpixel(img, dimensions, offset):
@@ -204,6 +273,60 @@ def reshape_image_to_4d_superpixel(img, dimensions, offset):
                 int(offset[1]):int(offset[1] + nb * dimensions[1])]).reshape(na, dimensions[0], nb, dimensions[1])
 
 
+def _reduce_superpixels(img, dimensions, offset, func):
+    """
+    Apply ``func`` over the superpixels of a two-dimensional image.
+
+    This gives the same result as
+    ``func(func(reshape_image_to_4d_superpixel(img, dimensions, offset), axis=3), axis=1)``,
+    but without reshaping (and hence copying) the whole image at once. A
+    `numpy.ndarray` (including a masked or memory-mapped array) is processed in
+    strips of superpixels, and a dask array is processed lazily, chunk by chunk.
+
+    Parameters
+    ----------
+    img : `numpy.ndarray` or `dask.array.Array`
+        A two-dimensional array of the form ``(y, x)``.
+    dimensions : array-like
+        A two element array-like object containing integers that describe the
+        superpixel summation in the ``(y, x)`` directions.
+    offset : array-like
+        A two element array-like object containing integers that describe
+        where in the input image the superpixels begin in the ``(y, x)``
+        directions.
+    func : callable
+        The function applied over each axis of the superpixels, which must support
+        the ``axis`` keyword.
+    """
+    dimensions = [int(dim) for dim in dimensions]
+    offset = [int(off) for off in offset]
+    na = int(np.floor((img.shape[0] - offset[0]) / dimensions[0]))
+    nb = int(np.floor((img.shape[1] - offset[1]) / dimensions[1]))
+    img = img[offset[0]:offset[0] + na * dimensions[0], offset[1]:offset[1] + nb * dimensions[1]]
+
+    def reduce(block):
+        block = block.reshape(block.shape[0] // dimensions[0], dimensions[0],
+                              block.shape[1] // dimensions[1], dimensions[1])
+        return func(func(block, axis=3), axis=1)
+
+    if img.size == 0:
+        return reduce(img)
+
+    if _is_dask(img):
+        # Align the chunks with the superpixels, so that each chunk can be reduced separately
+        img = img.rechunk([max(size // dim, 1) * dim for size, dim in zip(img.chunksize, dimensions)])
+        dtype = reduce(np.zeros(dimensions, dtype=img.dtype)).dtype
+        chunks = [tuple(size // dim for size in sizes) for sizes, dim in zip(img.chunks, dimensions)]
+        return img.map_blocks(reduce, chunks=chunks, dtype=dtype)
+
+    rows = max(_SUPERPIXEL_STRIP_SIZE // (dimensions[0] * img.shape[1]), 1) * dimensions[0]
+    strips = [reduce(img[start:start + rows]) for start in range(0, img.shape[0], rows)]
+    if len(strips) == 1:
+        return strips[0]
+    concatenate = np.ma.concatenate if isinstance(img, np.ma.MaskedArray) else np.concatenate
+    return concatenate(strips)
+
+
 class UnrecognizedInterpolationMethod(ValueError):
     """
     Unrecognized interpolation method specified.
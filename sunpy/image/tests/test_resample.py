@@ -4,7 +4,8 @@ import pytest
 
 import astropy.units as u
 
-from sunpy.image.resample import reshape_image_to_4d_superpixel
+import sunpy.image.resample
+from sunpy.image.resample import _reduce_superpixels, resample, reshape_image_to_4d_superpixel
 from sunpy.util.exceptions import SunpyUserWarning
 
 
@@ -95,3 +96,59 @@ def test_reshape(aia171_test_map, shape):
     im = reshape_image_to_4d_superpixel(aia171_test_map.data, d, o)
     assert im.shape == (_n(shape[0], o[0], d[0]), d[0],
                         _n(shape[1], o[1], d[1]), d[1])
+
+
+@pytest.mark.parametrize('method', ['nearest', 'linear', 'spline'])
+@pytest.mark.parametrize('dimensions', [(50, 70), (128, 128), (300, 200)])
+def test_resample_tiled(aia171_test_map, monkeypatch, method, dimensions):
+    expected = resample(aia171_test_map.data, dimensions, method=method, center=True)
+    monkeypatch.setattr(sunpy.image.resample, '_TILE_SIZE', 30)
+    tiled = resample(aia171_test_map.data, dimensions, method=method, center=True)
+    # Only the spline prefilter can differ between tiles, and only by rounding errors
+    np.testing.assert_allclose(tiled, expected, rtol=0,
+                               atol=1e-12 * np.abs(expected).max() if method == 'spline' else 0)
+
+
+@pytest.mark.parametrize('method', ['nearest', 'linear', 'spline'])
+def test_resample_dask(aia171_test_map, method):
+    dask_array = pytest.importorskip('dask.array')
+    data = dask_array.from_array(aia171_test_map.data, chunks=40)
+    resampled = resample(data, (100, 150), method=method)
+    assert isinstance(resampled, dask_array.Array)
+    expected = resample(aia171_test_map.data, (100, 150), method=method)
+    np.testing.assert_allclose(resampled.compute(), expected, rtol=0,
+                               atol=1e-12 * np.abs(expected).max() if method == 'spline' else 0)
+
+
+@pytest.mark.parametrize(('dimensions', 'offset'), [((2, 2), (0, 0)), ((9, 7), (1, 4)), ((5, 3), (4, 0))])
+@pytest.mark.parametrize('func', [np.sum, np.mean, np.median, np.max])
+def test_reduce_superpixels(aia171_test_map, monkeypatch, dimensions, offset, func):
+    data = aia171_test_map.data
+    expected = func(func(reshape_image_to_4d_superpixel(data, dimensions, offset), axis=3), axis=1)
+    np.testing.assert_array_equal(_reduce_superpixels(data, dimensions, offset, func), expected)
+
+    # Reduce the image a few rows at a time
+    monkeypatch.setattr(sunpy.image.resample, '_SUPERPIXEL_STRIP_SIZE', 1000)
+    np.testing.assert_array_equal(_reduce_superpixels(data, dimensions, offset, func), expected)
+
+
+@pytest.mark.parametrize('func', [np.sum, np.mean])
+def test_reduce_superpixels_masked(aia171_test_map, monkeypatch, func):
+    monkeypatch.setattr(sunpy.image.resample, '_SUPERPIXEL_STRIP_SIZE', 1000)
+    dimensions, offset = (9, 7), (1, 4)
+    masked = np.ma.array(aia171_test_map.data, mask=aia171_test_map.data > 1000)
+    expected = func(func(reshape_image_to_4d_superpixel(masked, dimensions, offset), axis=3), axis=1)
+    reduced = _reduce_superpixels(masked, dimensions, offset, func)
+    np.testing.assert_array_equal(np.ma.getmaskarray(reduced), np.ma.getmaskarray(expected))
+    np.testing.assert_array_equal(reduced, expected)
+
+
+@pytest.mark.parametrize('func', [np.sum, np.median])
+def test_reduce_superpixels_dask(aia171_test_map, func):
+    dask_array = pytest.importorskip('dask.array')
+    data = dask_array.from_array(aia171_test_map.data, chunks=(30, 50))
+    reduced = _reduce_superpixels(data, (9, 7), (1, 4), func)
+    assert isinstance(reduced, dask_array.Array)
+    expected = _reduce_superpixels(aia171_test_map.data, (9, 7), (1, 4), func)
+    assert reduced.shape == expected.shape
+    np.testing.assert_array_equal(reduced.compute(), expected)
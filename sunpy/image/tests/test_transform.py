@@ -4,6 +4,7 @@ from matplotlib.figure import Figure
 
 from astropy.coordinates.matrix_utilities import rotation_matrix
 
+import sunpy.image.transform
 from sunpy.data.test import get_test_filepath
 from sunpy.image.transform import _rotation_registry, affine_transform
 from sunpy.tests.helpers import figure_test, skip_opencv, skip_skimage
@@ -351,3 +352,48 @@ def test_endian(method, order, rot30):
     rot_swapped = affine_transform(swapped, rot30, order=order, method=method, missing=0)
 
     assert compare_results(rot_native, rot_swapped)
+
+
+@pytest.mark.parametrize('order', range(6))
+@pytest.mark.parametrize(('angle', 'scale'), [(0, 1.0), (30, 1.0), (-75, 0.5), (200, 1.7)])
+@pytest.mark.parametrize('missing', [np.nan, -1.0])
+def test_scipy_threaded_identical(original, monkeypatch, order, angle, scale, missing):
+    # Use small tiles so that the image is split into many tiles
+    monkeypatch.setattr(sunpy.image.transform, '_ROTATION_TILE_SIZE', 37)
+    image = original.copy()
+    image[100:110, 200:230] = np.nan
+    rmatrix = rotation_matrix(angle)[0:2, 0:2]
+    kwargs = {'order': order, 'scale': scale, 'missing': missing, 'image_center': (200.3, 311.7)}
+
+    expected = affine_transform(image, rmatrix, method='scipy', **kwargs)
+    result = affine_transform(image, rmatrix, method='scipy-threaded', **kwargs)
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize('dtype', ['>f8', 'float32', 'int16'])
+def test_scipy_threaded_dtype(original, monkeypatch, rot30, dtype):
+    monkeypatch.setattr(sunpy.image.transform, '_ROTATION_TILE_SIZE', 37)
+    image = original.astype(dtype)
+
+    expected = affine_transform(image, rot30, method='scipy', missing=0, clip=False)
+    result = affine_transform(image, rot30, method='scipy-threaded', missing=0, clip=False)
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_scipy_threaded_rotation_threads(original, monkeypatch, rot30):
+    recorded = []
+
+    class RecordingExecutor(sunpy.image.transform.ThreadPoolExecutor):
+        def __init__(self, max_workers=None, **kwargs):
+            recorded.append(max_workers)
+            super().__init__(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(sunpy.image.transform, 'ThreadPoolExecutor', RecordingExecutor)
+    sunpy.config.set('general', 'rotation_threads', '3')
+    try:
+        result = affine_transform(original, rot30, method='scipy-threaded')
+    finally:
+        sunpy.config.remove_option('general', 'rotation_threads')
+    assert recorded == [3]
+    np.testing.assert_array_equal(result, affine_transform(original, rot30, method='scipy'))
@@ -1,17 +1,19 @@
 """
 Functions for geometrical image transformation and warping.
 """
+import os
 import sys
 import time
 import numbers
-from functools import wraps
+from functools import wraps, partial
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import scipy.ndimage
 from scipy.signal import convolve2d
 
-from sunpy import log
+from sunpy import config, log
 from sunpy.util.exceptions import warn_user
 
 __all__ = ['add_rotation_function', 'affine_transform']
@@ -273,6 +275,9 @@ def add_rotation_function(name, *, allowed_orders,
 _rotation_method = namedtuple('_rotation_method', ['function', 'allowed_orders'])
 _rotation_registry = {}
 
+# Size of the tiles of the output image for the 'scipy-threaded' rotation method
+_ROTATION_TILE_SIZE = 256
+
 
 @add_rotation_function("scipy", allowed_orders=range(6),
                        handles_clipping=False, handles_image_nans=False, handles_nan_missing=True)
@@ -290,6 +295,106 @@ def _rotation_scipy(image, matrix, shift, order, missing, clip):
     return rotated_image
 
 
+@add_rotation_function("scipy-threaded", allowed_orders=range(6),
+                       handles_clipping=False, handles_image_nans=False, handles_nan_missing=True)
+def _rotation_scipy_threaded(image, matrix, shift, order, missing, clip):
+    """
+    * Rotates using :func:`scipy.ndimage.map_coordinates`, splitting the output
+      image into tiles that are computed concurrently using a pool of threads
+    * The number of threads is set by the ``rotation_threads`` option in the
+      ``[general]`` section of the sunpy configuration file, and defaults to the
+      number of CPUs
+    * Each tile only reads the window of the input image that it maps to
+    * The output image is identical to that of the ``'scipy'`` method
+    * The ``order`` parameter is the order of the spline interpolation, and ranges
+      from 0 to 5.
+    * The ``mode`` parameter for :func:`~scipy.ndimage.map_coordinates` is fixed to
+      be ``'constant'``
+    """
+    # Work on the transposed image, as the 'scipy' method does
+    image = image.T
+    # scipy.ndimage.affine_transform returns the input dtype in native byte order
+    output = np.empty(image.shape, dtype=image.dtype.name)
+    tiles = [(slice(row, min(row + _ROTATION_TILE_SIZE, image.shape[0])),
+              slice(col, min(col + _ROTATION_TILE_SIZE, image.shape[1])))
+             for row in range(0, image.shape[0], _ROTATION_TILE_SIZE)
+             for col in range(0, image.shape[1], _ROTATION_TILE_SIZE)]
+
+    nthreads = config.getint('general', 'rotation_threads', fallback=None) or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=nthreads) as executor:
+        # The spline prefilter is not local, so it is applied to the whole image
+        filtered = _spline_filter_threaded(image, order, executor, nthreads) if order > 1 else image
+        rotate_tile = partial(_rotate_tile, filtered=filtered, output=output, matrix=matrix,
+                              shift=shift, order=order, missing=missing)
+        # Consume the results to raise any exceptions
+        for _ in executor.map(rotate_tile, tiles):
+            pass
+
+    return output.T
+
+
+def _rotate_tile(tile, *, filtered, output, matrix, shift, order, missing):
+    """
+    Compute one tile of the output image for the 'scipy-threaded' rotation method.
+    """
+    # Compute the coordinates in the same way as scipy.ndimage.affine_transform
+    index = np.meshgrid(*[np.arange(sl.start, sl.stop, dtype=float) for sl in tile], indexing='ij')
+    coords = [shift[i] + index[0] * matrix[i, 0] + index[1] * matrix[i, 1] for i in range(2)]
+
+    # The neighboring pixels that are used for the spline interpolation
+    halo = order // 2 + 2
+    window = tuple(_source_window(coord, length, halo) for coord, length in zip(coords, filtered.shape))
+    # Shifting the coordinates by whole pixels to the start of the window is exact
+    coords = np.stack([coord - sl.start for coord, sl in zip(coords, window)])
+
+    output[tile] = scipy.ndimage.map_coordinates(filtered[window], coords, output=output.dtype,
+                                                 order=order, mode='constant', cval=missing,
+                                                 prefilter=False)
+
+
+def _source_window(coords, length, halo):
+    """
+    The slice of an input axis of length ``length`` that is needed to interpolate at
+    ``coords``.
+
+    The window always extends at least ``halo`` pixels beyond the coordinates (or to
+    the edge of the input), so that interpolation is the same as for the whole input.
+    """
+    start = int(np.floor(coords.min())) - halo
+    stop = int(np.ceil(coords.max())) + halo + 1
+    start = min(max(start, 0), max(length - 1 - halo, 0))
+    stop = max(min(stop, length), min(halo + 1, length))
+    return slice(start, stop)
+
+
+def _spline_filter_threaded(image, order, executor, nblocks):
+    """
+    Equivalent to ``scipy.ndimage.spline_filter(image, order, mode='constant')``.
+
+    The one-dimensional filter along each axis is applied to ``nblocks`` blocks of
+    the other axis concurrently.
+    """
+    output = np.empty(image.shape, dtype=np.float64)
+    source = image
+    for axis in range(2):
+        length = image.shape[1 - axis]
+        edges = np.linspace(0, length, min(nblocks, length) + 1).astype(int)
+        blocks = [(slice(None),) * (1 - axis) + (slice(start, stop),)
+                  for start, stop in zip(edges[:-1], edges[1:])]
+        filter_block = partial(_spline_filter_block, source=source, output=output,
+                               order=order, axis=axis)
+        for _ in executor.map(filter_block, blocks):
+            pass
+        # The filter along the second axis is applied to the output of the first
+        source = output
+    return output
+
+
+def _spline_filter_block(block, *, source, output, order, axis):
+    scipy.ndimage.spline_filter1d(source[block], order, axis=axis, output=output[block],
+                                  mode='constant')
+
+
 @add_rotation_function("scikit-image", allowed_orders=range(6),
                        handles_clipping=False, handles_image_nans=False, handles_nan_missing=False)
 def _rotation_skimage(image, matrix, shift, order, missing, clip):
@@ -25,11 +25,14 @@ Notes
 import os
 import re
 import sys
+import copy
 import math
 import traceback
 import collections
 import collections.abc
 
+import numpy as np
+
 from astropy.io import fits
 
 from sunpy.io._header import FileHeader
@@ -93,6 +96,134 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     return pairs
 
 
+def read_deferred(filepath, memmap=None, **kwargs):
+    """
+    Read the headers of the image HDUs in a fits file, without reading their data.
+
+    Parameters
+    ----------
+    filepath : `str`
+        The fits file to be read.
+    memmap : `bool`, optional
+        Passed to `~sunpy.io._fits.read` when the data are loaded.
+    **kwargs : `dict`, optional
+        Passed to `astropy.io.fits.open` when the headers are read, and to
+        `~sunpy.io._fits.read` when the data are loaded.
+
+    Returns
+    -------
+    `list`
+        A list of (`~sunpy.io._fits.DeferredHDUData`, header) tuples.
+    """
+    with fits.open(filepath, ignore_blank=True, **kwargs) as hdulist:
+        hdulist.verify('silentfix')
+        headers = get_header(hdulist)
+        # Table HDUs are never read as maps, so only image HDUs are kept
+        return [HDPair(DeferredHDUData(filepath, i, header, memmap=memmap,
+                                       compressed=isinstance(hdu, fits.CompImageHDU), **kwargs), header)
+                for i, (hdu, header) in enumerate(zip(hdulist, headers))
+                if isinstance(hdu, fits.PrimaryHDU | fits.ImageHDU | fits.CompImageHDU)]
+
+
+class DeferredHDUData:
+    """
+    A placeholder for the data array of a FITS HDU which has not been read yet.
+
+    The shape and dtype are derived from the header, so that they can be
+    inspected without reading (or decompressing) the data. The data are read
+    from disk by `~sunpy.io._fits.DeferredHDUData.load`.
+
+    Parameters
+    ----------
+    filepath : `str`
+        The FITS file containing the HDU.
+    hdu : `int`
+        The index of the HDU in the file.
+    header : `sunpy.io._header.FileHeader`
+        The header of the HDU, as returned by `~sunpy.io._fits.get_header`.
+    memmap : `bool`, optional
+        Passed to `~sunpy.io._fits.read` when the data are loaded.
+    compressed : `bool`, optional
+        Whether the HDU is a `~astropy.io.fits.CompImageHDU`, in which case
+        ``header`` is the header of the uncompressed image.
+    **kwargs : `dict`, optional
+        Passed to `~sunpy.io._fits.read` when the data are loaded.
+    """
+
+    def __init__(self, filepath, hdu, header, memmap=None, compressed=False, **kwargs):
+        self.filepath = filepath
+        self.hdu = hdu
+        self.memmap = memmap
+        self.kwargs = kwargs
+        naxis = header.get('NAXIS', 0)
+        self.shape = tuple(header[f'NAXIS{i}'] for i in range(naxis, 0, -1))
+        self.dtype = _dtype_from_header(header, primary=hdu == 0, compressed=compressed)
+        # Indexing is applied after loading, so that slicing does not trigger a read
+        self._keys = []
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} shape={self.shape} dtype={self.dtype} "
+                f"from HDU {self.hdu} of {self.filepath}>")
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __getitem__(self, key):
+        new = copy.copy(self)
+        # Index a zero-stride array to work out the new shape without allocating any memory
+        new.shape = np.broadcast_to(np.empty((), dtype=bool), self.shape)[key].shape
+        new._keys = [*self._keys, key]
+        return new
+
+    def __array__(self, dtype=None, copy=None):
+        data = self.load()
+        if copy:
+            return np.array(data, dtype=dtype)
+        return np.asarray(data, dtype=dtype)
+
+    def load(self):
+        """
+        Read the data array from the file.
+        """
+        (data, _), = read(self.filepath, hdus=[self.hdu], memmap=self.memmap, **self.kwargs)
+        for key in self._keys:
+            data = data[key]
+        return data
+
+
+def _dtype_from_header(header, primary=False, compressed=False):
+    """
+    The dtype that `astropy.io.fits` will return for the data described by a header.
+
+    This follows the scaling, ``BLANK`` and "pseudo-unsigned" integer conventions
+    used by `astropy.io.fits` (with ``uint=True``) when the data are read with
+    ``ignore_blank=True``, which only applies to the primary HDU.
+    Compressed HDUs (where ``header`` is the header of the uncompressed image)
+    are decompressed into native byte order.
+    """
+    bitpix = header['BITPIX']
+    bscale = header.get('BSCALE', 1)
+    bzero = header.get('BZERO', 0)
+    # BLANK is only used for valid integer values in integer data
+    blank = not primary and bitpix > 0 and isinstance(header.get('BLANK'), int)
+    raw_dtype = np.dtype(fits.hdu.base.BITPIX2DTYPE[bitpix])
+    if not compressed:
+        raw_dtype = raw_dtype.newbyteorder('>')
+    if bscale == 1 and bzero == 0 and not blank:
+        return raw_dtype
+    if bscale == 1:
+        if bitpix == 8 and bzero == -128:
+            return np.dtype('int8')
+        if bitpix > 8 and bzero == 1 << (bitpix - 1):
+            return np.dtype(f'uint{bitpix}')
+    if bitpix > 16:
+        return np.dtype('float64')
+    if bitpix > 0:
+        return np.dtype('float32')
+    return raw_dtype
+
+
 def get_header(afile):
     """
     Read a fits file and return just the headers for all HDU's.
@@ -34,6 +34,80 @@ def test_read_hdus(fname, hdus, length):
     assert len(pairs) == length
 
 
+@pytest.mark.parametrize('fname', [TEST_RHESSI_IMAGE, TEST_AIA_IMAGE,
+                                   get_test_filepath('EIT/efz20040301.000010_s.fits')])
+def test_deferred_hdu_data(fname):
+    header = _fits.get_header(fname)[0]
+    deferred = _fits.DeferredHDUData(fname, 0, header)
+    (data, _), = _fits.read(fname, hdus=0)
+    # The shape and dtype are known without reading the data
+    assert deferred.shape == data.shape
+    assert deferred.ndim == data.ndim
+    assert deferred.dtype == data.dtype
+
+    sliced = deferred[10:20, 5]
+    assert isinstance(sliced, _fits.DeferredHDUData)
+    assert sliced.shape == (10,)
+    np.testing.assert_array_equal(np.asarray(sliced), data[10:20, 5])
+    np.testing.assert_array_equal(deferred.load(), data)
+
+
+@pytest.mark.parametrize(('bitpix', 'bscale', 'bzero', 'blank', 'dtype'), [
+    (8, 1, 0, None, np.uint8),
+    (8, 1, -128, None, np.int8),
+    (16, 1, 0, None, '>i2'),
+    (16, 1, 0, -32768, '>i2'),
+    (16, 1, 32768, None, np.uint16),
+    (16, 1, 32768, 0, np.uint16),
+    (16, 2, 0, None, np.float32),
+    (32, 1, 2**31, None, np.uint32),
+    (32, 1, 10, None, np.float64),
+    (32, 1, 0, -1, '>i4'),
+    (-32, 1, 0, None, '>f4'),
+    (-64, 2, 0, None, '>f8'),
+])
+def test_deferred_hdu_data_dtype(tmp_path, bitpix, bscale, bzero, blank, dtype):
+    hdu = fits.PrimaryHDU(np.zeros((4, 3), dtype=fits.hdu.base.BITPIX2DTYPE[bitpix]))
+    hdu.header['BSCALE'] = bscale
+    hdu.header['BZERO'] = bzero
+    if blank is not None:
+        hdu.header['BLANK'] = blank
+    fname = tmp_path / 'test.fits'
+    # Write the array as is, rather than scaling it to match BSCALE and BZERO
+    hdu.writeto(fname)
+    header = _fits.get_header(str(fname))[0]
+    deferred = _fits.DeferredHDUData(str(fname), 0, header)
+    assert deferred.dtype == np.dtype(dtype)
+    assert deferred.load().dtype == np.dtype(dtype)
+
+
+@pytest.mark.parametrize('hdu_type', [fits.ImageHDU, fits.CompImageHDU])
+@pytest.mark.parametrize(('dtype', 'blank'), [
+    (np.int16, None),
+    (np.int16, -32768),
+    (np.int32, -1),
+    (np.uint16, 0),
+    (np.float32, None),
+])
+def test_read_deferred_dtype(tmp_path, hdu_type, dtype, blank):
+    fname = str(tmp_path / 'test.fits')
+    header = {} if blank is None else {'BLANK': blank}
+    _fits.write(fname, np.arange(12, dtype=dtype).reshape(4, 3), MetaDict(header), hdu_type=hdu_type)
+    deferred, _ = _fits.read_deferred(fname)[-1]
+    assert deferred.hdu == 1
+    assert deferred.shape == (4, 3)
+    assert deferred.dtype == deferred.load().dtype
+
+
+def test_read_deferred_kwargs(mocker):
+    spy = mocker.spy(_fits.fits, 'open')
+    deferred, _ = _fits.read_deferred(TEST_AIA_IMAGE, memmap=False, lazy_load_hdus=False)[0]
+    assert spy.call_args.kwargs['lazy_load_hdus'] is False
+    deferred.load()
+    assert spy.call_args.kwargs['lazy_load_hdus'] is False
+    assert spy.call_args.kwargs['memmap'] is False
+
+
 @pytest.mark.parametrize(
     ('fname', 'waveunit'),
     [(TEST_RHESSI_IMAGE, None),
@@ -13,5 +13,6 @@ from sunpy.map import sources
 from sunpy.map.header_helper import *
 from sunpy.map.map_factory import Map
 from sunpy.map.maputils import *
+from sunpy.map.reprojection import *
 from .compositemap import CompositeMap
 from .mapsequence import MapSequence
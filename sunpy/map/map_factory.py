@@ -1,8 +1,11 @@
 import os
+import inspect
 import pathlib
-from functools import singledispatchmethod
+from functools import partial, singledispatchmethod
+from contextlib import closing
 from collections import OrderedDict
 from urllib.request import Request
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 import fsspec
 import numpy as np
@@ -14,6 +17,7 @@ from astropy.wcs import WCS
 from sunpy import log
 from sunpy.data import cache
 from sunpy.io._file_tools import detect_filetype, read_file
+from sunpy.io._fits import read_deferred
 from sunpy.io._header import FileHeader
 from sunpy.map.compositemap import CompositeMap
 from sunpy.map.mapbase import GenericMap, MapMetaValidationError
@@ -40,6 +44,60 @@ except ImportError:
 __all__ = ["Map", "MapFactory"]
 
 
+def _run_tasks(tasks, workers=None):
+    """
+    Run a list of zero-argument callables, optionally concurrently.
+
+    This yields one callable per task which returns the result of that task (or
+    raises its exception), in the same order as ``tasks``, so that the caller can
+    handle errors for each task in turn regardless of the order they finish in.
+
+    Parameters
+    ----------
+    tasks : `list` of callable
+        The tasks to run. These must be picklable if a process pool is used.
+    workers : `int` or `concurrent.futures.Executor`, optional
+        If an `int`, the tasks are run in a thread pool with that many threads.
+        If an executor, the tasks are submitted to it and it is not shut down afterwards.
+        If `None` (the default), the tasks are run serially as they are consumed.
+    """
+    if workers is None:
+        yield from tasks
+        return
+    if isinstance(workers, Executor):
+        futures = [workers.submit(task) for task in tasks]
+        for future in futures:
+            yield future.result
+        return
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(task) for task in tasks]
+        for future in futures:
+            yield future.result
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _collect_results(results, n):
+    """
+    Return the combined (data, header) pairs of the next ``n`` results from `_run_tasks`.
+
+    All ``n`` results are consumed before a `~sunpy.util.exceptions.NoMapsInFileError` from
+    any of them is raised, so that a file without maps drops all the files of the argument
+    it came from (e.g., a directory), as it does when they are read serially.
+    """
+    pairs = []
+    error = None
+    for _ in range(n):
+        try:
+            pairs += next(results)()
+        except NoMapsInFileError as e:
+            error = error or e
+    if error is not None:
+        raise error
+    return pairs
+
+
 class MapFactory(BasicRegistrationFactory):
     """
     A factory for generating coordinate aware 2D images.
@@ -95,9 +153,12 @@ class MapFactory(BasicRegistrationFactory):
     >>> mymap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE)  # doctest: +REMOTE_DATA +IGNORE_WARNINGS
     """
 
-    def _read_file(self, fname, **kwargs):
+    def _read_file(self, fname, lazy=False, **kwargs):
         """
         Read in a file name and return the list of (data, meta) pairs in that file.
+
+        If ``lazy`` is `True`, only the headers of a FITS file are read and the
+        data of each HDU is represented by a `~sunpy.io._fits.DeferredHDUData`.
         """
         # File gets read here. This needs to be generic enough to seamlessly
         # call a fits file or a jpeg2k file, etc
@@ -115,6 +176,8 @@ class MapFactory(BasicRegistrationFactory):
                 with asdf.open(fname,** _NO_MEMMAP_KWARGS) as af:
                     pairs = [value for value in af.tree.values() if isinstance(value, GenericMap)]
                     return pairs
+            elif lazy and filetype == "fits":
+                pairs = read_deferred(os.fspath(fname), **kwargs)
             else:
                 pairs = read_file(os.fspath(fname), filetype=filetype, **kwargs)
         except Exception as e:
@@ -151,7 +214,7 @@ class MapFactory(BasicRegistrationFactory):
         else:
             return False
 
-    def _parse_args(self, *args, allow_errors=False, **kwargs):
+    def _parse_args(self, *args, allow_errors=False, workers=None, **kwargs):
         """
         Parses an args list into data-header pairs.
 
@@ -210,16 +273,35 @@ class MapFactory(BasicRegistrationFactory):
             else:
                 parsed_args.append(arg)
 
+        # Expand directories and globs so that each file is read as a separate task.
+        # Only the inputs which need to be read from a file are handed to the workers,
+        # everything else is parsed in place (marked by None).
+        read_tasks = []
+        for arg in parsed_args:
+            if isinstance(arg, pathlib.Path):
+                files = parse_path(arg, lambda path, **kwargs: [path])
+                read_tasks.append([partial(self._read_file, afile, allow_errors=allow_errors, **kwargs)
+                                   for afile in files])
+            elif isinstance(arg, Request | fsspec.core.OpenFile):
+                read_tasks.append([partial(self._parse_arg, arg, allow_errors=allow_errors, **kwargs)])
+            else:
+                read_tasks.append(None)
+
         # Parse the arguments
         # Note that this list can also contain GenericMaps if they are directly given to the factory
         data_header_pairs = []
-        for arg in parsed_args:
-            try:
-                data_header_pairs += self._parse_arg(arg, allow_errors=allow_errors, **kwargs)
-            except NoMapsInFileError as e:
-                if not allow_errors:
-                    raise
-                warn_user(f"One of the arguments failed to parse with error: {e}")
+        # Closing the generator shuts down its thread pool, even if an error is raised
+        with closing(_run_tasks([task for tasks in read_tasks if tasks for task in tasks], workers)) as results:
+            for arg, tasks in zip(parsed_args, read_tasks):
+                try:
+                    if tasks is None:
+                        data_header_pairs += self._parse_arg(arg, allow_errors=allow_errors, **kwargs)
+                    else:
+                        data_header_pairs += _collect_results(results, len(tasks))
+                except NoMapsInFileError as e:
+                    if not allow_errors:
+                        raise
+                    warn_user(f"One of the arguments failed to parse with error: {e}")
 
         return data_header_pairs
 
@@ -264,7 +346,7 @@ class MapFactory(BasicRegistrationFactory):
         # use fsspec for everything, but for now we parse the URI through
         return self._read_file(arg.full_name, **kwargs)
 
-    def __call__(self, *args, composite=False, sequence=False, allow_errors=False, **kwargs):
+    def __call__(self, *args, composite=False, sequence=False, allow_errors=False, workers=None, **kwargs):
         """Method for running the factory. Takes arbitrary arguments and
         keyword arguments and passes them to a sequence of pre-registered types
         to determine which is the correct Map-type to build.
@@ -284,27 +366,42 @@ class MapFactory(BasicRegistrationFactory):
         allow_errors : `bool`, optional
             If set, bypass data-header pairs or files which cause an exception and warn instead.
             Defaults to `False`.
+        workers : `int` or `concurrent.futures.Executor`, optional
+            If given, files are read and maps are constructed concurrently.
+            An `int` specifies the number of threads to use, otherwise the work is submitted
+            to the given executor (e.g., a `~concurrent.futures.ProcessPoolExecutor`).
+            The maps are always returned in the same order as the inputs, and
+            ``allow_errors`` behaves as it does when reading serially.
+            Defaults to `None`, which reads all inputs serially.
+        lazy : `bool`, optional
+            If `True`, only the headers of FITS files are read, and the data array of
+            each map is read from disk the first time `~sunpy.map.GenericMap.data`
+            is accessed. This makes it cheap to filter large numbers of files on their
+            metadata. If ``sequence=True``, this also makes the
+            `~sunpy.map.MapSequence` lazy, which requires dask. Other file types are always read in full.
+            Defaults to `False`.
 
         Notes
         -----
         Extra keyword arguments are passed through to `sunpy.io._file_tools.read_file` such as
         ``memmap`` for FITS files.
+        If ``sequence=True``, the ``sortby`` keyword is also passed to
+        `~sunpy.map.MapSequence`.
         """
-        data_header_pairs = self._parse_args(*args, allow_errors=allow_errors, **kwargs)
+        data_header_pairs = self._parse_args(*args, allow_errors=allow_errors, workers=workers, **kwargs)
         new_maps = list()
 
         # Loop over each registered type and check to see if WidgetType
         # matches the arguments. If it does, use that type.
+        tasks = [partial(self._check_registered_widgets, pair[0], MetaDict(pair[1]), **kwargs)
+                 for pair in data_header_pairs if not isinstance(pair, GenericMap)]
+        results = _run_tasks(tasks, workers)
         for pair in data_header_pairs:
             if isinstance(pair, GenericMap):
                 new_maps.append(pair)
                 continue
-            data, header = pair
-            meta = MetaDict(header)
-
             try:
-                new_map = self._check_registered_widgets(data, meta, **kwargs)
-                new_maps.append(new_map)
+                new_maps.append(next(results)())
             except (NoMatchError, MultipleMatchError, ValidationFunctionError, MapMetaValidationError) as e:
                 if not allow_errors:
                     raise
@@ -315,7 +412,11 @@ class MapFactory(BasicRegistrationFactory):
 
         # If the list is meant to be a sequence, instantiate a map sequence
         if sequence:
-            return MapSequence(new_maps, **kwargs)
+            # Only pass on the keywords that MapSequence understands, as the remaining
+            # ones (e.g., memmap) are meant for the file readers
+            params = inspect.signature(MapSequence).parameters
+            sequence_kwargs = {x: kwargs[x] for x in params & kwargs.keys()}
+            return MapSequence(new_maps, **sequence_kwargs)
 
         # If the list is meant to be a composite map, instantiate one
         if composite:
@@ -6,13 +6,15 @@ import copy
 import html
 import inspect
 import numbers
+import weakref
 import textwrap
 import warnings
 import itertools
+import threading
 import webbrowser
 from typing import Literal
 from tempfile import NamedTemporaryFile
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 import matplotlib
 import matplotlib.pyplot as plt
@@ -29,7 +31,13 @@ except ImportError:
 
 import astropy.units as u
 import astropy.wcs
-from astropy.coordinates import BaseCoordinateFrame, Longitude, SkyCoord, UnitSphericalRepresentation
+from astropy.coordinates import (
+    BaseCoordinateFrame,
+    Longitude,
+    SkyCoord,
+    UnitSphericalRepresentation,
+    solar_system_ephemeris,
+)
 from astropy.nddata import NDData
 from astropy.utils.metadata import MetaData
 from astropy.visualization import HistEqStretch, ImageNormalize
@@ -40,12 +48,13 @@ import sunpy.coordinates
 import sunpy.visualization.colormaps
 from sunpy import config, log
 from sunpy.coordinates import HeliographicCarrington, get_earth, sun
+from sunpy.coordinates._transformations import _dependent_cache_clears
 from sunpy.coordinates.utils import get_rectangle_coordinates
+from sunpy.image.resample import _reduce_superpixels
 from sunpy.image.resample import resample as sunpy_image_resample
-from sunpy.image.resample import reshape_image_to_4d_superpixel
 from sunpy.image.transform import _get_transform_method, _rotation_function_names, affine_transform
 from sunpy.io._file_tools import write_file
-from sunpy.io._fits import extract_waveunit, header_to_fits
+from sunpy.io._fits import DeferredHDUData, extract_waveunit, header_to_fits
 from sunpy.map.maputils import _clip_interval, _handle_norm
 from sunpy.sun import constants
 from sunpy.time import is_time, parse_time
@@ -57,7 +66,7 @@ from sunpy.util.decorators import (
 )
 from sunpy.util.exceptions import SunpyUserWarning, warn_deprecated, warn_metadata, warn_user
 from sunpy.util.functools import seconddispatch
-from sunpy.util.util import _figure_to_base64, fix_duplicate_notes
+from sunpy.util.util import _figure_to_base64, _make_readonly, fix_duplicate_notes
 from sunpy.visualization import axis_labels_from_ctype, peek_show, wcsaxes_compat
 from sunpy.visualization.colormaps import cm as sunpy_cm
 from sunpy.visualization.visualization import _PrecomputedPixelCornersTransform
@@ -68,6 +77,48 @@ SpatialPair = namedtuple('SpatialPair', 'axis1 axis2')
 _NUMPY_COPY_IF_NEEDED = False if np.__version__.startswith("1.") else None
 _META_FIX_URL = 'https://docs.sunpy.org/en/stable/how_to/fix_map_metadata.html'
 
+# Observer coordinates are shared between maps with the same observer metadata. The
+# observer in HGS is kept for the most recently used observers, so that it does not
+# need to be recalculated, and the observer coordinate of a map (which also depends on
+# the solar radius) is kept for as long as any map uses it.
+_OBSERVER_CACHE_SIZE = 1024
+_observer_hgs_cache = OrderedDict()
+_observer_coordinates = weakref.WeakValueDictionary()
+_observer_cache_lock = threading.Lock()
+
+
+def _clear_observer_cache():
+    with _observer_cache_lock:
+        _observer_hgs_cache.clear()
+        _observer_coordinates.clear()
+
+
+# The observers in HGS depend on the transformations, so are cleared with their caches
+_dependent_cache_clears.append(_clear_observer_cache)
+
+
+def _observer_cache_key(obstime, kwargs):
+    """
+    Return a hashable key for an observer specified by an observation time and the keyword
+    arguments to `~astropy.coordinates.SkyCoord`, or `None` if the observer should not be cached.
+
+    As for the transformation caches, the current solar-system ephemeris is part of the key.
+    """
+    if not obstime.isscalar:
+        return None
+    items = []
+    for name, value in sorted(kwargs.items()):
+        if isinstance(value, u.Quantity):
+            if not value.isscalar:
+                return None
+            value = (float(value.value), value.unit.to_string())
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        items.append((name, value))
+    return (solar_system_ephemeris.get(), obstime.scale, float(obstime.jd1), float(obstime.jd2), *items)
+
 # Manually specify the ``.meta`` docstring. This is assigned to the .meta
 # class attribute in GenericMap.__init__()
 _meta_doc = """
@@ -142,7 +193,7 @@ class GenericMap(NDData):
     +===================+====================================+
     | `reproject_to`    | No                                 |
     +-------------------+------------------------------------+
-    | `resample`        | No                                 |
+    | `resample`        | Yes                                |
     +-------------------+------------------------------------+
     | `rotate`          | No                                 |
     +-------------------+------------------------------------+
@@ -287,6 +338,18 @@ class GenericMap(NDData):
         except Exception:
             pass
 
+    @property
+    def data(self):
+        """
+        `~numpy.ndarray`-like : The stored dataset.
+
+        For a map created with ``lazy=True`` (see `~sunpy.map.Map`), the data are
+        read from disk the first time this property is accessed.
+        """
+        if isinstance(self._data, DeferredHDUData):
+            self._data = self._data.load()
+        return self._data
+
     def __getitem__(self, key):
         """ This should allow indexing by physical coordinate """
         raise NotImplementedError(
@@ -602,11 +665,13 @@ class GenericMap(NDData):
         return self._new_instance_from_op(new_data)
 
     @property
-    def _meta_hash(self):
-        return self.meta.item_hash()
+    def _meta_version(self):
+        # This changes whenever the metadata is modified, and is used to invalidate
+        # the cached properties derived from the metadata
+        return self.meta._version
 
     @property
-    @cached_property_based_on('_meta_hash')
+    @cached_property_based_on('_meta_version')
     def wcs(self):
         """
         The `~astropy.wcs.WCS` property of the map.
@@ -672,13 +737,15 @@ class GenericMap(NDData):
             sunpy.coordinates.wcs_utils._set_wcs_aux_obs_coord(w2, obs_coord)
 
         # Set the shape of the data array
-        w2.array_shape = self.data.shape
+        # (this uses _data so that the array of a lazy map is not read from disk)
+        w2.array_shape = self._data.shape
 
         # Validate the WCS here.
         w2.wcs.set()
         return w2
 
     @property
+    @cached_property_based_on('_meta_version')
     def coordinate_frame(self):
         """
         An `astropy.coordinates.BaseCoordinateFrame` instance created from the coordinate
@@ -728,21 +795,21 @@ class GenericMap(NDData):
         """
         The dimensions of the array (x axis first, y axis second).
         """
-        return PixelPair(*u.Quantity(np.flipud(self.data.shape), 'pixel'))
+        return PixelPair(*u.Quantity(np.flipud(self._data.shape), 'pixel'))
 
     @property
     def dtype(self):
         """
         The `numpy.dtype` of the array of the map.
         """
-        return self.data.dtype
+        return self._data.dtype
 
     @property
     def ndim(self):
         """
         The value of `numpy.ndarray.ndim` of the data array of the map.
         """
-        return self.data.ndim
+        return self._data.ndim
 
     def std(self, *args, **kwargs):
         """
@@ -1315,7 +1382,7 @@ class GenericMap(NDData):
             self.meta.pop(key)
 
     @property
-    @cached_property_based_on('_meta_hash')
+    @cached_property_based_on('_meta_version')
     def observer_coordinate(self):
         """
         The Heliographic Stonyhurst Coordinate of the observer.
@@ -1324,24 +1391,47 @@ class GenericMap(NDData):
         -----
         The ``obstime`` for this coordinate uses the `.reference_date` property, which
         may be different from the `.date` property.
+
+        Maps with the same observer metadata share the same coordinate object, so
+        this coordinate should not be modified in place.
         """
         warning_message = []
         for keys, kwargs in self._supported_observer_coordinates:
             missing_keys = set(keys) - self.meta.keys()
             if not missing_keys:
-                sc = SkyCoord(obstime=self.reference_date, **kwargs)
-                # If the observer location is supplied in Carrington coordinates,
-                # the coordinate's `observer` attribute should be set to "self"
-                if isinstance(sc.frame, HeliographicCarrington):
-                    sc.frame._observer = "self"
+                key = _observer_cache_key(self.reference_date, kwargs)
+                with _observer_cache_lock:
+                    sc = _observer_hgs_cache.get(key)
+                    if sc is not None:
+                        _observer_hgs_cache.move_to_end(key)
+                if sc is None:
+                    sc = SkyCoord(obstime=self.reference_date, **kwargs)
+                    # If the observer location is supplied in Carrington coordinates,
+                    # the coordinate's `observer` attribute should be set to "self"
+                    if isinstance(sc.frame, HeliographicCarrington):
+                        sc.frame._observer = "self"
+                    sc = sc.heliographic_stonyhurst
+                    if key is not None:
+                        with _observer_cache_lock:
+                            _observer_hgs_cache[key] = sc
+                            if len(_observer_hgs_cache) > _OBSERVER_CACHE_SIZE:
+                                _observer_hgs_cache.popitem(last=False)
 
-                sc = sc.heliographic_stonyhurst
                 # We set rsun after constructing the coordinate, as we need
                 # the observer-Sun distance (sc.radius) to calculate this, which
                 # may not be provided directly in metadata (if e.g. the
                 # observer coordinate is specified in a cartesian
                 # representation)
-                return SkyCoord(sc.replicate(rsun=self._rsun_meters(sc.radius)))
+                rsun = self._rsun_meters(sc.radius)
+                if key is None:
+                    return SkyCoord(sc.replicate(rsun=rsun))
+                key = (key, float(rsun.to_value(u.m)))
+                with _observer_cache_lock:
+                    observer = _observer_coordinates.get(key)
+                    if observer is None:
+                        observer = SkyCoord(sc.replicate(rsun=rsun))
+                        _observer_coordinates[key] = observer
+                return observer
             elif missing_keys != keys:
                 frame = kwargs['frame'] if isinstance(kwargs['frame'], str) else kwargs['frame'].name
                 warning_message.append(f"For frame '{frame}' the following metadata is missing: "
@@ -1372,18 +1462,21 @@ class GenericMap(NDData):
         return self.observer_coordinate.lon
 
     @property
-    def carrington_latitude(self):
-        """Observer Carrington latitude."""
+    @cached_property_based_on('_meta_version')
+    def _observer_carrington(self):
         hgc_frame = HeliographicCarrington(observer=self.observer_coordinate, obstime=self.reference_date,
                                            rsun=self.rsun_meters)
-        return self.observer_coordinate.transform_to(hgc_frame).lat
+        return self.observer_coordinate.transform_to(hgc_frame)
+
+    @property
+    def carrington_latitude(self):
+        """Observer Carrington latitude."""
+        return self._observer_carrington.lat
 
     @property
     def carrington_longitude(self):
         """Observer Carrington longitude."""
-        hgc_frame = HeliographicCarrington(observer=self.observer_coordinate, obstime=self.reference_date,
-                                           rsun=self.rsun_meters)
-        return self.observer_coordinate.transform_to(hgc_frame).lon
+        return self._observer_carrington.lon
 
     @property
     def dsun(self):
@@ -1418,8 +1511,8 @@ class GenericMap(NDData):
         The pixel returned uses zero-based indexing, so will be 1 pixel less
         than the FITS CRPIX values.
         """
-        naxis1 = self.meta.get('naxis1', self.data.shape[1])
-        naxis2 = self.meta.get('naxis2', self.data.shape[0])
+        naxis1 = self.meta.get('naxis1', self._data.shape[1])
+        naxis2 = self.meta.get('naxis2', self._data.shape[0])
         return PixelPair((self.meta.get('crpix1', (naxis1 + 1) / 2.) - 1) * u.pixel,
                          (self.meta.get('crpix2', (naxis2 + 1) / 2.) - 1) * u.pixel)
 
@@ -1455,6 +1548,7 @@ class GenericMap(NDData):
         return SpatialPair(units[0], units[1])
 
     @property
+    @cached_property_based_on('_meta_version')
     def rotation_matrix(self):
         r"""
         Matrix describing the transformation needed to align the reference
@@ -1470,9 +1564,11 @@ class GenericMap(NDData):
         In many cases this is a simple rotation matrix, hence the property name.
         It general it does not have to be a pure rotation matrix, and can encode
         other transformations e.g., skews for non-orthogonal coordinate systems.
+
+        The returned array is shared between calls, so it is read-only.
         """
         if any(key in self.meta for key in ['PC1_1', 'PC1_2', 'PC2_1', 'PC2_2']):
-            return np.array(
+            matrix = np.array(
                 [
                     [self.meta.get('PC1_1', 1), self.meta.get('PC1_2', 0)],
                     [self.meta.get('PC2_1', 0), self.meta.get('PC2_2', 1)]
@@ -1489,9 +1585,10 @@ class GenericMap(NDData):
             cdelt = u.Quantity(self.scale).value
 
             # Divide each row by each CDELT
-            return cd / np.expand_dims(cdelt, axis=1)
+            matrix = cd / np.expand_dims(cdelt, axis=1)
         else:
-            return self._rotation_matrix_from_crota()
+            matrix = self._rotation_matrix_from_crota()
+        return _make_readonly(matrix)
 
     @staticmethod
     def _pc_matrix(lam, angle):
@@ -1688,7 +1785,9 @@ class GenericMap(NDData):
         as IDL''s congrid routine, which apparently originally came from a
         VAX/VMS routine of the same name.
 
-        This method **does not** preserve dask arrays.
+        This method **does** preserve dask arrays. The data are resampled in
+        tiles, so neither dask arrays nor memory-mapped arrays are fully loaded
+        into memory at once.
 
         Parameters
         ----------
@@ -1719,8 +1818,8 @@ class GenericMap(NDData):
         # Note: "center" defaults to True in this function because data
         #   coordinates in a Map are at pixel centers
 
-        # Make a copy of the original data and perform resample
-        new_data = sunpy_image_resample(self.data.copy().T, dimensions,
+        # Perform resample (the original data are not modified, so are not copied)
+        new_data = sunpy_image_resample(self.data.T, dimensions,
                                         method, center=True)
         new_data = new_data.T
 
@@ -2194,7 +2293,9 @@ class GenericMap(NDData):
         """Returns a new map consisting of superpixels formed by applying
         'func' to the original map data.
 
-        This method **does** preserve dask arrays.
+        This method **does** preserve dask arrays. The superpixels are computed a
+        part of the data at a time, so neither dask arrays nor memory-mapped arrays
+        are fully loaded into memory at once.
 
         Parameters
         ----------
@@ -2236,20 +2337,19 @@ class GenericMap(NDData):
         if (offset.value[0] < 0) or (offset.value[1] < 0):
             raise ValueError("Offset is strictly non-negative.")
 
-        # These are rounded by int() in reshape_image_to_4d_superpixel,
+        # These are rounded by int() in _reduce_superpixels,
         # so round here too for use in constructing metadata later.
         dimensions = [int(dim) for dim in dimensions.to_value(u.pix)]
         offset = [int(off) for off in offset.to_value(u.pix)]
 
-        # Make a copy of the original data, perform reshaping, and apply the
-        # function.
+        # Apply the function over the superpixels. This works through the data a
+        # part at a time, so the original data are not copied.
         if self.mask is not None:
-            data = np.ma.array(self.data.copy(), mask=self.mask)
+            data = np.ma.array(self.data, mask=self.mask)
         else:
-            data = self.data.copy()
+            data = self.data
 
-        reshaped_data = reshape_image_to_4d_superpixel(data, [dimensions[1], dimensions[0]], [offset[1], offset[0]])
-        new_array = func(func(reshaped_data, axis=3), axis=1)
+        new_array = _reduce_superpixels(data, [dimensions[1], dimensions[0]], [offset[1], offset[0]], func)
 
         if self.mask is not None:
             if conservative_mask ^ (func in [np.sum, np.prod]):
@@ -2260,8 +2360,8 @@ class GenericMap(NDData):
                     )
 
             if conservative_mask:
-                reshaped_mask = reshape_image_to_4d_superpixel(self.mask, [dimensions[1], dimensions[0]], [offset[1], offset[0]])
-                new_mask = np.any(reshaped_mask, axis=(3, 1))
+                new_mask = _reduce_superpixels(self.mask, [dimensions[1], dimensions[0]],
+                                               [offset[1], offset[0]], np.any)
             else:
                 new_mask = np.ma.getmaskarray(new_array)
         else:
@@ -3099,6 +3199,10 @@ class GenericMap(NDData):
         ``"all"``, but at the risk of potentially not including the entire reprojected
         map.
 
+        When reprojecting many maps with the same geometry onto the same target WCS,
+        a `~sunpy.map.ReprojectionPlan` avoids recomputing the mapping
+        between the two WCSs for every map.
+
         .. minigallery:: sunpy.map.GenericMap.reproject_to
         """
         if not isinstance(target_wcs, astropy.wcs.WCS):
@@ -3129,6 +3233,16 @@ class GenericMap(NDData):
         if return_footprint:
             output_array, footprint = output_array
 
+        outmap = self._reprojected_map(output_array, target_wcs, preserve_date_obs=preserve_date_obs)
+
+        if return_footprint:
+            return outmap, footprint
+        return outmap
+
+    def _reprojected_map(self, output_array, target_wcs, *, preserve_date_obs=False):
+        """
+        Create the map for the result of reprojecting this map onto ``target_wcs``.
+        """
         target_header = target_wcs.to_header()
         if preserve_date_obs:
             # Explicitly not using _set_date or _set_reference_date. We do not know whether
@@ -3152,8 +3266,6 @@ class GenericMap(NDData):
                       f"{self.name}.rsun_meters={self.rsun_meters}; {outmap.name}.rsun_meters={outmap.rsun_meters}. "
                       "This might cause unexpected results during reprojection.")
 
-        if return_footprint:
-            return outmap, footprint
         return outmap
 
 
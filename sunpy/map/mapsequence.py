@@ -9,8 +9,15 @@ from tempfile import NamedTemporaryFile
 import matplotlib.animation
 import numpy as np
 
+try:
+    from dask.array import Array as DaskArray
+    DASK_INSTALLED = True
+except ImportError:
+    DASK_INSTALLED = False
+
 from astropy.visualization import ImageNormalize
 
+from sunpy.io._fits import DeferredHDUData
 from sunpy.map import GenericMap
 from sunpy.map.maputils import _clip_interval, _handle_norm
 from sunpy.util import expand_list
@@ -34,6 +41,15 @@ class MapSequence:
         Method by which the MapSequence should be sorted along the z-axis.
         Defaults to sorting by: "date" and is the only supported sorting strategy.
         Passing `None` will disable sorting.
+    lazy : `bool`, optional
+        If `True`, `~sunpy.map.MapSequence.data` and `~sunpy.map.MapSequence.mask`
+        are returned as `dask.array.Array` cubes which reference the data of each
+        map without stacking them into a new array in memory.
+        This is most useful when the maps are lazily loaded or backed by memory-mapped
+        files (e.g., ``sunpy.map.Map(files, sequence=True, lazy=True)``), as each frame
+        is then only read from disk when that part of the cube is computed.
+        Requires dask to be installed. Defaults to `False`, although a sequence in which
+        any map holds a `dask.array.Array` is always treated as lazy.
 
     Attributes
     ----------
@@ -55,10 +71,13 @@ class MapSequence:
     >>> mapsequence = sunpy.map.Map('images/*.fits', sequence=True)   # doctest: +SKIP
     """
 
-    def __init__(self, *args, sortby='date'):
+    def __init__(self, *args, sortby='date', lazy=False):
         """Creates a new Map instance"""
 
         self.maps = expand_list(args)
+        if lazy and not DASK_INSTALLED:
+            raise ImportError("dask is required for a lazy MapSequence.")
+        self._lazy = lazy
 
         for m in self.maps:
             if not isinstance(m, GenericMap):
@@ -85,7 +104,7 @@ class MapSequence:
         if isinstance(self.maps[key], GenericMap):
             return self.maps[key]
         else:
-            return MapSequence(self.maps[key])
+            return MapSequence(self.maps[key], lazy=self._lazy)
 
     def __len__(self):
         """Return the number of maps in a mapsequence."""
@@ -328,11 +347,13 @@ class MapSequence:
         def updatefig(i, im, annotate, ani_data, removes):
             while removes:
                 removes.pop(0).remove()
-            im.set_array(ani_data[i].data)
+            # Only this frame is read if the map data is lazy
+            frame = np.asarray(ani_data[i].data)
+            im.set_array(frame)
             im.set_cmap(kwargs.get('cmap', ani_data[i].plot_settings.get('cmap')) or "grey")
             norm = deepcopy(kwargs.get('norm', ani_data[i].plot_settings.get('norm')))
             if clip_interval is not None:
-                vmin, vmax = _clip_interval(ani_data[i].data, clip_interval)
+                vmin, vmax = _clip_interval(frame, clip_interval)
                 if norm is None:
                     norm = ImageNormalize()
                 norm.vmin=vmin
@@ -417,8 +438,26 @@ class MapSequence:
         """
         True if the data array of each map has the same shape.
         """
-        return np.all([m.data.shape == self.maps[0].data.shape for m in self.maps])
+        # This uses _data so that the arrays of lazy maps are not read from disk
+        return np.all([m._data.shape == self.maps[0]._data.shape for m in self.maps])
 
+    @property
+    def _is_lazy(self):
+        return self._lazy or (DASK_INSTALLED and any(isinstance(m._data, DaskArray) for m in self.maps))
+
+    @staticmethod
+    def _as_dask_frame(array):
+        """
+        Wrap a single frame as a dask array without copying or hashing its contents.
+        """
+        import dask.array
+
+        if isinstance(array, DaskArray):
+            return array
+        # Reading any part of a deferred FITS array reads the whole HDU, so keep it in one chunk
+        chunks = array.shape if isinstance(array, DeferredHDUData) else 'auto'
+        # name=False avoids tokenizing (and therefore reading) the whole array
+        return dask.array.from_array(array, chunks=chunks, name=False)
 
     @property
     def data(self):
@@ -426,12 +465,20 @@ class MapSequence:
         Data array of shape ``(N_y, N_x, N_t)`` where ``(N_y,N_x)`` is the
         shape of each individual map and ``N_t`` is the number of maps.
 
+        If the sequence is lazy, this is a `dask.array.Array` which is chunked
+        along the time axis with one frame per chunk. No data is read or copied
+        until (part of) the cube is computed.
+
         .. note:: If all maps do not have the same shape, a `ValueError` is raised.
         """
         if not self.all_same_shape:
             raise ValueError('Not all maps have the same shape.')
-        data = np.asarray([m.data for m in self.maps])
-        return np.swapaxes(np.swapaxes(data, 0, 1), 1, 2)
+        if self._is_lazy:
+            import dask.array
+
+            # Each frame of a lazy map is only read when its chunk is computed
+            return dask.array.stack([self._as_dask_frame(m._data) for m in self.maps], axis=-1)
+        return np.stack([m.data for m in self.maps], axis=-1)
 
     @property
     def mask(self):
@@ -441,10 +488,19 @@ class MapSequence:
         If no map in the sequence has a mask, this returns None.
         If at least one map in the sequence has a mask, the layers
         corresponding to those maps without a mask will be all `False`.
+        If the sequence is lazy, this is a `dask.array.Array`.
         """
         if not np.any([m.mask is not None for m in self.maps]):
             return None
-        mask = np.zeros_like(self.data, dtype=bool)
+        if not self.all_same_shape:
+            raise ValueError('Not all maps have the same shape.')
+        if self._is_lazy:
+            import dask.array
+
+            layers = [self._as_dask_frame(m.mask) if m.mask is not None
+                      else dask.array.zeros(m._data.shape, dtype=bool) for m in self.maps]
+            return dask.array.stack(layers, axis=-1)
+        mask = np.zeros(self.maps[0]._data.shape + (len(self.maps),), dtype=bool)
         for i, m in enumerate(self):
             if m.mask is not None:
                 mask[..., i] = m.mask
@@ -474,6 +530,11 @@ class MapSequence:
             Any additional keyword arguments are passed to
             `~sunpy.map.GenericMap.save`.
 
+        Notes
+        -----
+        Each map is written out in turn, so a lazy sequence is saved one frame at a time
+        without loading the whole cube into memory.
+
         Examples
         --------
         >>> from sunpy.map import Map
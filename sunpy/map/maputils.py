@@ -7,14 +7,16 @@ from itertools import product
 import numpy as np
 
 import astropy.units as u
-from astropy.coordinates import SkyCoord
+from astropy.coordinates import CartesianRepresentation, SkyCoord
+from astropy.time import Time
 from astropy.visualization import AsymmetricPercentileInterval
 
-from sunpy.coordinates import Helioprojective, sun
+from sunpy.coordinates import Heliocentric, HeliographicStonyhurst, Helioprojective, _transformations, sun
 
 __all__ = ['all_pixel_indices_from_map', 'all_coordinates_from_map',
            'all_corner_coords_from_map',
            'map_edges', 'solar_angular_radius', 'sample_at_coords',
+           'sample_sequence_at_coords',
            'contains_full_disk', 'is_all_off_disk', 'is_all_on_disk',
            'contains_limb', 'coordinate_is_on_solar_disk',
            'on_disk_bounding_coordinates',
@@ -194,6 +196,189 @@ def sample_at_coords(smap, coordinates):
     return u.Quantity(smap.data[smap.wcs.world_to_array_index(coordinates)], smap.unit)
 
 
+def sample_sequence_at_coords(mapsequence, coordinates, *, method='nearest'):
+    """
+    Samples the data in every map of a sequence at a given series of coordinates.
+
+    This gives the same result as calling `~sunpy.map.sample_at_coords` on each
+    map in turn, but the coordinate transformations for all of the maps are
+    computed together, which is much faster for long sequences of maps (e.g., when
+    extracting light curves).
+
+    An error is raised if any of the coordinates fall outside the bounds of any of
+    the maps.
+
+    Parameters
+    ----------
+    mapsequence : `~sunpy.map.MapSequence` or iterable of `~sunpy.map.GenericMap`
+        The maps to sample.
+    coordinates : `~astropy.coordinates.SkyCoord`
+        Input coordinates.
+    method : {``'nearest'``, ``'bilinear'``}, optional
+        How to sample the data. ``'nearest'`` (the default) uses the value of the
+        pixel containing each coordinate, as `~sunpy.map.sample_at_coords` does.
+        ``'bilinear'`` linearly interpolates between the centers of the four
+        nearest pixels.
+
+    Returns
+    -------
+    `~astropy.units.Quantity`
+        An array of the map data at the input coordinates, with a shape of
+        ``(len(mapsequence),) + coordinates.shape``. The values are in the unit of
+        the first map.
+
+    Notes
+    -----
+    For maps in a `~sunpy.coordinates.frames.Helioprojective` frame, the
+    transformation from the input coordinates to the heliocentric frame of each map
+    is an affine transformation. Instead of transforming all of the coordinates for
+    every map, only four reference points are transformed for each map (for all
+    maps at once), and the resulting affine transformations are then applied to the
+    coordinates as plain arrays. This is not possible when solar differential
+    rotation is being applied to transformations (see
+    `~sunpy.coordinates.propagate_with_solar_surface`), in which case each map is
+    transformed separately.
+    """
+    if method not in ('nearest', 'bilinear'):
+        raise ValueError(f"method must be 'nearest' or 'bilinear', not '{method}'.")
+    maps = list(getattr(mapsequence, 'maps', mapsequence))
+    if not maps:
+        raise ValueError('At least one map must be provided.')
+
+    unit = maps[0].unit
+    values = np.empty((len(maps),) + coordinates.shape)
+    for i, (smap, (x, y)) in enumerate(zip(maps, _sequence_world_to_pixel(maps, coordinates))):
+        ys, xs = smap.wcs.array_shape
+        if not np.all((x >= -0.5) & (x <= xs - 0.5) & (y >= -0.5) & (y <= ys - 0.5)):
+            raise ValueError(f'At least one coordinate is not within the bounds of map {i}.')
+        data = np.asarray(smap.data)
+        if method == 'nearest':
+            # This is the same rounding as used by world_to_array_index()
+            sample = data[np.minimum(np.floor(y + 0.5).astype(int), ys - 1),
+                          np.minimum(np.floor(x + 0.5).astype(int), xs - 1)]
+        else:
+            sample = _bilinear_sample(data, x, y)
+        values[i] = u.Quantity(sample, smap.unit).to_value(unit)
+
+    return u.Quantity(values, unit)
+
+
+def _bilinear_sample(data, x, y):
+    # Pixels beyond the outermost pixel centers take the value at the edge
+    ys, xs = data.shape
+    x0 = np.floor(x)
+    y0 = np.floor(y)
+    fx = x - x0
+    fy = y - y0
+    x0 = x0.astype(int)
+    y0 = y0.astype(int)
+    x1 = np.clip(x0 + 1, 0, xs - 1)
+    y1 = np.clip(y0 + 1, 0, ys - 1)
+    x0 = np.clip(x0, 0, xs - 1)
+    y0 = np.clip(y0, 0, ys - 1)
+    return ((1 - fy) * ((1 - fx) * data[y0, x0] + fx * data[y0, x1]) +
+            fy * ((1 - fx) * data[y1, x0] + fx * data[y1, x1]))
+
+
+def _sequence_world_to_pixel(maps, coordinates):
+    """
+    Returns the pixel coordinates of ``coordinates`` in each of ``maps``.
+
+    The transformations for maps with a helioprojective frame (other than the frame
+    of the coordinates themselves) are batched together.
+    """
+    pixels = [None] * len(maps)
+    batched = []
+    for i, smap in enumerate(maps):
+        frame = smap.coordinate_frame
+        if (isinstance(frame, Helioprojective)
+                and coordinates.obstime is not None
+                and not coordinates.is_equivalent_frame(frame)
+                and not _transformations._autoapply_diffrot):
+            batched.append(i)
+        else:
+            pixels[i] = smap.wcs.world_to_pixel(coordinates)
+
+    if batched:
+        lonlats = _batched_helioprojective_lonlat(coordinates,
+                                                  [maps[i].coordinate_frame for i in batched])
+        for i, (lon, lat) in zip(batched, lonlats):
+            wcs = maps[i].wcs
+            world = [None, None]
+            world[wcs.wcs.lng] = lon.to_value(wcs.wcs.cunit[wcs.wcs.lng])
+            world[wcs.wcs.lat] = lat.to_value(wcs.wcs.cunit[wcs.wcs.lat])
+            pixels[i] = wcs.world_to_pixel_values(*world)
+
+    return pixels
+
+
+def _batched_helioprojective_lonlat(coordinates, frames):
+    """
+    Returns the helioprojective longitude and latitude of ``coordinates`` in each of
+    ``frames``, with a shape of ``(len(frames),) + coordinates.shape``.
+    """
+    # The transformations would make any 2D coordinate 3D in the same way
+    hgs = coordinates.transform_to(HeliographicStonyhurst(obstime=coordinates.obstime))
+    hgs = hgs.frame.make_3d()
+    points = hgs.cartesian.xyz.to_value(u.m).reshape(3, -1)
+
+    origin, matrices, observer_distance = _heliocentric_transforms(hgs.replicate_without_data(),
+                                                                   frames)
+    x, y, z = np.moveaxis(origin[:, np.newaxis] + np.einsum('kp,nkj->npj', points, matrices), -1, 0)
+    lon, lat = _heliocentric_to_helioprojective(x, y, z, observer_distance[:, np.newaxis])
+    shape = (len(frames),) + coordinates.shape
+    return zip((lon * u.rad).reshape(shape), (lat * u.rad).reshape(shape))
+
+
+def _heliocentric_transforms(hgs_frame, frames):
+    """
+    Returns the affine transformations from Cartesian coordinates (in meters) in the
+    heliographic Stonyhurst frame ``hgs_frame`` to the heliocentric frame of the
+    observer of each of ``frames``.
+
+    The transformations are returned as the heliocentric position of the origin,
+    with shape ``(N, 3)``, and the matrices that multiply a row vector of
+    coordinates, with shape ``(N, 3, 3)``, along with the distance of each
+    observer from the center of the Sun in meters, with shape ``(N,)``.
+    """
+    # HCC->HPC uses the observer at the obstime of the frame
+    obstimes = Time([frame.obstime for frame in frames])
+    observers = [frame.observer for frame in frames]
+    observers = HeliographicStonyhurst(u.Quantity([obs.lon for obs in observers]),
+                                       u.Quantity([obs.lat for obs in observers]),
+                                       u.Quantity([obs.radius for obs in observers]),
+                                       obstime=Time([obs.obstime for obs in observers]))
+    if np.any(observers.obstime != obstimes):
+        observers = observers.transform_to(HeliographicStonyhurst(obstime=obstimes))
+
+    # Transform the origin and three basis vectors into the heliocentric frame of
+    # every map at once, which fully describes each (affine) transformation
+    scale = hgs_frame.rsun.to_value(u.m)
+    basis = np.concatenate([np.zeros((3, 1)), np.eye(3)], axis=1) * scale
+    nframes = len(frames)
+    basis = SkyCoord(CartesianRepresentation(np.tile(basis, nframes) * u.m),
+                     frame=HeliographicStonyhurst, obstime=hgs_frame.obstime)
+    repeat = np.repeat(np.arange(nframes), 4)
+    hcc_frame = Heliocentric(observer=observers[repeat], obstime=obstimes[repeat])
+    basis = basis.transform_to(hcc_frame).cartesian.xyz.to_value(u.m)
+    basis = basis.T.reshape(nframes, 4, 3)
+    origin = basis[:, 0]
+    matrices = (basis[:, 1:] - origin[:, np.newaxis]) / scale
+    return origin, matrices, observers.radius.to_value(u.m)
+
+
+def _heliocentric_to_helioprojective(x, y, z, observer_distance):
+    """
+    Returns the helioprojective longitude and latitude, in radians, of heliocentric
+    Cartesian coordinates.
+    """
+    # Shift the origin from the Sun to the observer
+    distance = observer_distance - z
+    lon = np.arctan2(x, distance)
+    lat = np.arctan2(y, np.hypot(x, distance))
+    return lon, lat
+
+
 def _edge_coordinates(smap):
     # Calculate all the edge pixels
     edges = map_edges(smap)
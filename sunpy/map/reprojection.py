@@ -0,0 +1,215 @@
+"""
+This module provides reusable reprojection plans for `sunpy.map.GenericMap`.
+"""
+import numpy as np
+
+import astropy.wcs
+from astropy.wcs.utils import pixel_to_pixel
+
+__all__ = ['ReprojectionPlan']
+
+
+_ORDERS = {'nearest-neighbor': 0, 'bilinear': 1, 0: 0, 1: 1}
+
+
+class ReprojectionPlan:
+    """
+    A precomputed interpolation reprojection onto a fixed target WCS.
+
+    Reprojecting a map with :func:`~reproject.reproject_interp` requires
+    transforming the coordinates of every pixel of the target WCS into the
+    pixel frame of the input map.
+    For many maps with the same (or nearly the same) geometry, e.g., a series
+    of images from a fixed-pointing instrument reprojected onto a synoptic
+    grid, this transformation dominates the cost of the reprojection.
+    A plan computes the mapping and the interpolation weights once and
+    reuses them for every subsequent map whose WCS produces the same
+    mapping, so that reprojecting each map is reduced to a gather of its data.
+
+    The plan checks every map that it is applied to against the WCS it was
+    built for.
+    The mapping is recomputed automatically if the shape of the map array
+    differs or if the input pixel positions of a grid of sample points in the
+    target WCS move by more than ``tolerance`` pixels.
+
+    Parameters
+    ----------
+    target_wcs : `dict` or `~astropy.wcs.WCS`
+        The destination FITS WCS header or WCS instance.
+    shape_out : `tuple`, optional
+        The array shape of the output.
+        Defaults to the array shape of ``target_wcs``, which then must be set.
+    order : {'bilinear', 'nearest-neighbor'}, optional
+        The interpolation order.
+        Defaults to ``'bilinear'``.
+    tolerance : `float`, optional
+        The largest shift, in input pixels, of the sampled mapping for which
+        the cached mapping is reused.
+        Defaults to 0.01 pixels.
+    roundtrip_coords : `bool`, optional
+        If ``True``, output pixels whose coordinates do not round-trip through
+        the input WCS are excluded, as in :func:`~reproject.reproject_interp`.
+        Defaults to ``True``.
+
+    Notes
+    -----
+    The output of `~sunpy.map.ReprojectionPlan.apply` matches
+    ``smap.reproject_to(target_wcs, algorithm='interpolation', order=order)``
+    to within floating-point precision.
+    Only the two lowest interpolation orders are supported, as higher orders
+    require spline prefiltering of each data array.
+
+    Examples
+    --------
+    >>> from sunpy.map import ReprojectionPlan
+    >>> plan = ReprojectionPlan(target_header)  # doctest: +SKIP
+    >>> reprojected = [plan.apply(m) for m in maps]  # doctest: +SKIP
+    """
+
+    def __init__(self, target_wcs, *, shape_out=None, order='bilinear', tolerance=0.01,
+                 roundtrip_coords=True):
+        if not isinstance(target_wcs, astropy.wcs.WCS):
+            target_wcs = astropy.wcs.WCS(target_wcs)
+        if shape_out is None:
+            shape_out = target_wcs.array_shape
+        if shape_out is None:
+            raise ValueError("The output shape must be specified either as shape_out or "
+                             "as the array shape of the target WCS.")
+        if order not in _ORDERS:
+            raise ValueError(f"The interpolation order must be one of: {list(_ORDERS.keys())}")
+
+        self.target_wcs = target_wcs
+        self.shape_out = tuple(shape_out)
+        self.order = _ORDERS[order]
+        self.tolerance = tolerance
+        self.roundtrip_coords = roundtrip_coords
+
+        # A sparse grid of output pixels, used for checking whether a new input
+        # WCS produces the same mapping as the cached one
+        ny, nx = self.shape_out
+        self._sample_pixels = np.meshgrid(np.linspace(0, nx - 1, min(nx, 16)),
+                                          np.linspace(0, ny - 1, min(ny, 16)))
+        self.clear()
+
+    def __repr__(self):
+        order = {0: 'nearest-neighbor', 1: 'bilinear'}[self.order]
+        return (f"<{self.__class__.__name__} shape_out={self.shape_out} order='{order}' "
+                f"cached={self._shape_in is not None}>")
+
+    def clear(self):
+        """
+        Discard the cached mapping.
+        """
+        self._shape_in = None
+        self._sample_in = None
+        self._valid = None
+        self._index = None
+        self._weights = None
+
+    def _pixel_to_pixel(self, wcs_in, x, y):
+        x_in, y_in = pixel_to_pixel(self.target_wcs, wcs_in, x, y)
+        if self.roundtrip_coords:
+            x_back, y_back = pixel_to_pixel(wcs_in, self.target_wcs, x_in, y_in)
+            reset = (np.abs(x_back - x) > 1) | (np.abs(y_back - y) > 1)
+            x_in = np.where(reset, np.nan, x_in)
+            y_in = np.where(reset, np.nan, y_in)
+        return x_in, y_in
+
+    def _is_valid_for(self, wcs_in, shape_in):
+        """
+        Check whether the cached mapping can be used for a map with this WCS and shape.
+        """
+        if self._shape_in != shape_in:
+            return False
+        sample_in = np.array(self._pixel_to_pixel(wcs_in, *self._sample_pixels))
+        finite = np.isfinite(sample_in)
+        if not np.array_equal(finite, np.isfinite(self._sample_in)):
+            return False
+        return np.all(np.abs(sample_in[finite] - self._sample_in[finite]) <= self.tolerance)
+
+    def _build(self, wcs_in, shape_in):
+        """
+        Compute the flat input indices and the interpolation weights of every output pixel.
+        """
+        ny, nx = self.shape_out
+        x_out, y_out = np.meshgrid(np.arange(nx, dtype=float), np.arange(ny, dtype=float))
+        coords = np.array(self._pixel_to_pixel(wcs_in, x_out.ravel(), y_out.ravel()))[::-1]
+
+        # Follow the edge handling of reproject: positions in the outer half of
+        # the border pixels are moved to the centers of those pixels, and
+        # anything further out is not valid.
+        shape_in = np.array(shape_in)[:, np.newaxis]
+        with np.errstate(invalid='ignore'):
+            valid = np.all((coords >= -0.5) & (coords <= shape_in - 0.5), axis=0)
+        coords = np.clip(coords[:, valid], 0, shape_in - 1)
+
+        self._shape_in = tuple(shape_in[:, 0])
+        if self.order == 0:
+            index = np.floor(coords + 0.5).astype(np.intp)
+            self._index = np.ravel_multi_index(tuple(index), self._shape_in)
+            self._weights = None
+        else:
+            index = np.floor(coords).astype(np.intp)
+            self._weights = coords - index
+            # On the far edge of the array the next pixel has a weight of zero,
+            # so it is clamped to the edge rather than lying outside of the array
+            following = np.minimum(index + 1, shape_in - 1)
+            (y0, x0), (y1, x1) = index, following
+            self._index = tuple(np.ravel_multi_index((y, x), self._shape_in)
+                                for y, x in [(y0, x0), (y0, x1), (y1, x0), (y1, x1)])
+
+        self._sample_in = np.array(self._pixel_to_pixel(wcs_in, *self._sample_pixels))
+        self._valid = np.flatnonzero(valid)
+
+    def _interpolate(self, data):
+        data = np.asarray(data).ravel()
+        if self.order == 0:
+            return data[self._index]
+
+        i00, i01, i10, i11 = self._index
+        wy, wx = self._weights
+        return ((1 - wy) * ((1 - wx) * data[i00] + wx * data[i01]) +
+                wy * ((1 - wx) * data[i10] + wx * data[i11]))
+
+    def apply(self, smap, *, return_footprint=False, preserve_date_obs=False):
+        """
+        Reproject a map using this plan.
+
+        The mapping is computed on the first call, and recomputed whenever the
+        map differs from the one that the cached mapping was computed for.
+
+        Parameters
+        ----------
+        smap : `~sunpy.map.GenericMap`
+            The map to reproject.
+        return_footprint : `bool`
+            If ``True``, the footprint is returned in addition to the new map.
+            Defaults to ``False``.
+        preserve_date_obs : `bool`
+            If ``True``, the observation time of the reprojected map is set to the
+            observation time of the original map instead of the observation time
+            defined in the target WCS.
+            Defaults to ``False``.
+
+        Returns
+        -------
+        outmap : `~sunpy.map.GenericMap`
+            The reprojected map.
+        footprint : `~numpy.ndarray`
+            Footprint of the input array in the output array. Values of 0 indicate
+            no coverage or valid values in the input image, while values of 1
+            indicate valid values.
+            Only returned if ``return_footprint`` is ``True``.
+        """
+        shape_in = tuple(smap.data.shape)
+        if self._shape_in is None or not self._is_valid_for(smap.wcs, shape_in):
+            self._build(smap.wcs, shape_in)
+
+        output_array = np.full(self.shape_out, np.nan)
+        output_array.flat[self._valid] = self._interpolate(smap.data)
+
+        outmap = smap._reprojected_map(output_array, self.target_wcs,
+                                       preserve_date_obs=preserve_date_obs)
+        if return_footprint:
+            return outmap, (~np.isnan(output_array)).astype(float)
+        return outmap
@@ -1,6 +1,8 @@
 import os
+import shutil
 import pathlib
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -13,7 +15,7 @@ from astropy.wcs import WCS
 import sunpy
 import sunpy.map
 from sunpy.data.test import get_dummy_map_from_header, get_test_data_filenames, get_test_filepath, rootdir
-from sunpy.io._fits import read
+from sunpy.io._fits import DeferredHDUData, read
 from sunpy.tests.helpers import asdf_entry_points, figure_test, skip_glymur
 from sunpy.util.exceptions import NoMapsInFileError, SunpyMetadataWarning, SunpyUserWarning
 
@@ -394,6 +396,70 @@ def test_map_list_of_files_with_one_broken():
         sunpy.map.Map(files, allow_errors=False)
 
 
+@pytest.mark.parametrize('use_executor', [False, True])
+def test_map_workers_preserves_order(use_executor):
+    inputs = [rootdir / "EIT", AIA_171_IMAGE, (AIA_MAP.data, AIA_MAP.meta), AIA_MAP]
+    serial_maps = sunpy.map.Map(*inputs)
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel_maps = sunpy.map.Map(*inputs, workers=executor)
+    else:
+        parallel_maps = sunpy.map.Map(*inputs, workers=2)
+    assert len(parallel_maps) == len(serial_maps)
+    for serial_map, parallel_map in zip(serial_maps, parallel_maps):
+        assert type(serial_map) is type(parallel_map)
+        assert serial_map.date == parallel_map.date
+        np.testing.assert_array_equal(serial_map.data, parallel_map.data)
+
+
+def test_map_workers_with_one_broken():
+    files = [AIA_171_IMAGE, get_test_filepath('not_actually_fits.fits'), AIA_171_IMAGE]
+    with pytest.warns(SunpyUserWarning, match='Failed to read'):
+        amap = sunpy.map.Map(files, allow_errors=True, workers=2)
+    assert len(amap) == 2
+
+    with pytest.raises(OSError, match='Failed to read'):
+        sunpy.map.Map(files, allow_errors=False, workers=2)
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_map_directory_with_no_maps_file(tmp_path, workers):
+    # A file without any maps drops the whole directory it is in, however it is read
+    with fits.open(AIA_171_IMAGE, ignore_blank=True) as hdul:
+        fits.writeto(tmp_path / 'data_1d.fits', np.arange(100), hdul[0].header)
+    shutil.copy(AIA_171_IMAGE, tmp_path / 'data_2d.fits')
+
+    with pytest.warns(SunpyUserWarning, match='Found no HDUs with >= 2D data'):
+        amap = sunpy.map.Map(tmp_path, AIA_171_IMAGE, allow_errors=True, workers=workers)
+    assert isinstance(amap, sunpy.map.sources.AIAMap)
+
+    with pytest.raises(NoMapsInFileError, match='Found no HDUs with >= 2D data'):
+        sunpy.map.Map(tmp_path, AIA_171_IMAGE, workers=workers)
+
+
+def test_map_lazy():
+    lazy_map = sunpy.map.Map(AIA_171_IMAGE, lazy=True)
+    assert isinstance(lazy_map, sunpy.map.sources.AIAMap)
+    # Metadata-derived properties do not read the data
+    assert lazy_map.date == AIA_MAP.date
+    assert lazy_map.wcs.array_shape == AIA_MAP.data.shape
+    assert lazy_map.dimensions == AIA_MAP.dimensions
+    assert lazy_map.dtype == AIA_MAP.dtype
+    assert isinstance(lazy_map._data, DeferredHDUData)
+    # The data is read on first access
+    np.testing.assert_array_equal(lazy_map.data, AIA_MAP.data)
+    assert isinstance(lazy_map._data, np.ndarray)
+
+
+def test_map_lazy_sequence():
+    pytest.importorskip('dask.array')
+    sequence = sunpy.map.Map(rootdir / "EIT", sequence=True, lazy=True)
+    assert all(isinstance(m._data, DeferredHDUData) for m in sequence.maps)
+    data = sequence.data
+    assert all(isinstance(m._data, DeferredHDUData) for m in sequence.maps)
+    np.testing.assert_array_equal(data[..., 0].compute(), sequence.maps[0].data)
+
+
 def test_eitmap_does_not_match_level1_header_regression():
     # Regression test for operator-precedence bug in EITMap.is_datasource_for
     header = {"instrume": "EIT", "level": "L1"}
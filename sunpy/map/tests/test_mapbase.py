@@ -26,7 +26,7 @@ import sunpy
 import sunpy.coordinates
 import sunpy.map
 import sunpy.sun
-from sunpy.coordinates import HeliographicCarrington, HeliographicStonyhurst, sun
+from sunpy.coordinates import HeliographicCarrington, HeliographicStonyhurst, clear_transformation_cache, sun
 from sunpy.data.test import get_dummy_map_from_header, get_test_filepath
 from sunpy.image.resample import reshape_image_to_4d_superpixel
 from sunpy.image.transform import _rotation_registry
@@ -152,6 +152,82 @@ def test_obs_coord_cache(aia171_test_map):
     assert new_coord.radius != coord2.radius
 
 
+def test_obs_coord_shared(aia171_test_map):
+    # Maps with the same observer metadata share the same observer coordinate
+    other_map = aia171_test_map._new_instance(aia171_test_map.data, deepcopy(aia171_test_map.meta))
+    coord = aia171_test_map.observer_coordinate
+    assert other_map.observer_coordinate is coord
+
+    # Changing the metadata of one map does not affect the other map
+    other_map.meta['haex_obs'] += 10
+    assert other_map.observer_coordinate is not coord
+    assert aia171_test_map.observer_coordinate is coord
+
+    # The solar radius is part of the coordinate, so it must be taken into account
+    other_map = aia171_test_map._new_instance(aia171_test_map.data, deepcopy(aia171_test_map.meta))
+    other_map.meta['rsun_ref'] = 700e6
+    assert other_map.observer_coordinate is not coord
+    assert other_map.observer_coordinate.rsun == 700e6 * u.m
+    assert_quantity_allclose(other_map.observer_coordinate.radius, coord.radius)
+
+
+def test_obs_coord_cache_ephemeris(aia171_test_map, monkeypatch):
+    key = sunpy.map.mapbase._observer_cache_key(aia171_test_map.reference_date, {'frame': 'heliographic_stonyhurst'})
+    monkeypatch.setattr(sunpy.map.mapbase.solar_system_ephemeris, 'get', lambda: 'de440')
+    other_key = sunpy.map.mapbase._observer_cache_key(aia171_test_map.reference_date, {'frame': 'heliographic_stonyhurst'})
+    assert other_key != key
+
+
+def test_obs_coord_cache_clear(aia171_test_map):
+    coord = aia171_test_map.observer_coordinate
+    assert sunpy.map.mapbase._observer_hgs_cache
+    clear_transformation_cache()
+    assert not sunpy.map.mapbase._observer_hgs_cache
+    other_map = aia171_test_map._new_instance(aia171_test_map.data, deepcopy(aia171_test_map.meta))
+    assert other_map.observer_coordinate is not coord
+
+
+def test_carrington_coordinates_cache(aia171_test_map):
+    lon = aia171_test_map.carrington_longitude
+    lat = aia171_test_map.carrington_latitude
+    aia171_test_map.meta['haex_obs'] += 1e9
+    assert aia171_test_map.carrington_longitude != lon
+    assert aia171_test_map.carrington_latitude != lat
+
+
+def test_cached_properties_independent(aia171_test_map):
+    # Accessing one cached property after a change to the metadata must not stop
+    # the other cached properties from being recomputed
+    wcs = aia171_test_map.wcs
+    frame = aia171_test_map.coordinate_frame
+    aia171_test_map.meta['crval1'] = 100
+    aia171_test_map.meta['pc1_2'] = 0.1
+
+    _ = aia171_test_map.observer_coordinate
+    assert aia171_test_map.wcs is not wcs
+    assert_quantity_allclose(aia171_test_map.wcs.wcs.crval[0] * aia171_test_map.wcs.wcs.cunit[0],
+                             100 * u.arcsec)
+    assert aia171_test_map.coordinate_frame is not frame
+    assert aia171_test_map.rotation_matrix[0, 1] == 0.1
+
+
+@pytest.mark.parametrize('prop', ['coordinate_frame', 'rotation_matrix'])
+def test_meta_derived_property_cache(aia171_test_map, prop):
+    value = getattr(aia171_test_map, prop)
+    assert getattr(aia171_test_map, prop) is value
+
+    # Replacing the metadata also invalidates the cache
+    aia171_test_map.meta = aia171_test_map.meta.copy()
+    assert getattr(aia171_test_map, prop) is not value
+
+
+def test_rotation_matrix_readonly(aia171_test_map):
+    matrix = aia171_test_map.rotation_matrix.copy()
+    with pytest.raises(ValueError, match="read-only"):
+        aia171_test_map.rotation_matrix[0, 1] = 1
+    np.testing.assert_array_equal(aia171_test_map.rotation_matrix, matrix)
+
+
 def test_header_immutability(aia171_test_map):
     # Check that accessing the wcs of a map doesn't modify the meta data
     assert 'KEYCOMMENTS' in aia171_test_map.meta
@@ -42,7 +42,7 @@ with pytest.warns(VerifyWarning, match="Invalid 'BLANK' keyword in header."):  #
     ("mean", {}),
     ("min", {}),
     pytest.param("reproject_to", {"wcs": aia_wcs}, marks=pytest.mark.xfail(reason="reproject is not dask aware")),
-    pytest.param("resample", {"dimensions": (100, 100)*u.pix}, marks=pytest.mark.xfail()),
+    ("resample", {"dimensions": (100, 100)*u.pix}),
     pytest.param("rotate", {}, marks=pytest.mark.xfail(reason="nanmedian is not implemented in Dask")),
     ("std", {}),
     ("superpixel", {"dimensions": (10, 10)*u.pix}),
@@ -13,6 +13,7 @@ import sunpy
 import sunpy.data.test
 import sunpy.map
 from sunpy.data.test import get_test_filepath
+from sunpy.io._fits import DeferredHDUData
 from sunpy.tests.helpers import figure_test, skip_glymur
 from sunpy.util.metadata import MetaDict
 
@@ -85,6 +86,66 @@ def test_as_array_some_masks(mapsequence_all_the_same_some_have_masks):
     assert np.all(np.logical_not(mask[0:2, 0:3, 2]))
 
 
+def test_as_array_lazy(mapsequence_all_the_same):
+    dask_array = pytest.importorskip('dask.array')
+    lazy_sequence = sunpy.map.MapSequence(mapsequence_all_the_same.maps, lazy=True)
+    data = lazy_sequence.data
+    assert isinstance(data, dask_array.Array)
+    assert data.shape == (128, 128, 2)
+    assert data.chunks[-1] == (1, 1)
+    np.testing.assert_array_equal(data.compute(), mapsequence_all_the_same.data)
+    assert lazy_sequence.mask is None
+    # Slicing the sequence preserves laziness
+    assert isinstance(lazy_sequence[0:2].data, dask_array.Array)
+
+
+def test_lazy_requires_dask(mapsequence_all_the_same, monkeypatch):
+    monkeypatch.setattr(sunpy.map.mapsequence, 'DASK_INSTALLED', False)
+    with pytest.raises(ImportError, match="dask is required"):
+        sunpy.map.MapSequence(mapsequence_all_the_same.maps, lazy=True)
+
+
+def test_as_array_lazy_some_masks(mapsequence_all_the_same_some_have_masks):
+    dask_array = pytest.importorskip('dask.array')
+    lazy_sequence = sunpy.map.MapSequence(mapsequence_all_the_same_some_have_masks.maps, lazy=True)
+    mask = lazy_sequence.mask
+    assert isinstance(mask, dask_array.Array)
+    np.testing.assert_array_equal(mask.compute(), mapsequence_all_the_same_some_have_masks.mask)
+
+
+def test_as_array_dask_maps(aia171_test_map):
+    dask_array = pytest.importorskip('dask.array')
+    dask_map = aia171_test_map._new_instance(dask_array.from_array(aia171_test_map.data),
+                                             aia171_test_map.meta)
+    sequence = sunpy.map.Map([dask_map, aia171_test_map], sequence=True)
+    assert isinstance(sequence.data, dask_array.Array)
+
+
+def test_lazy_memmap_sequence(aia171_test_map, tmp_path):
+    dask_array = pytest.importorskip('dask.array')
+    filepath = tmp_path / "map.fits"
+    aia171_test_map.save(filepath)
+    sequence = sunpy.map.Map([filepath, filepath], sequence=True, memmap=True, lazy=True)
+    # The base of an array that owns its memory is None
+    assert sequence.maps[0].data.base is not None
+    data = sequence.data
+    assert isinstance(data, dask_array.Array)
+    np.testing.assert_array_equal(data[..., 1].compute(), sequence.maps[1].data)
+
+
+def test_lazy_sequence_properties_do_not_load(aia171_test_map, tmp_path):
+    pytest.importorskip('dask.array')
+    filepath = tmp_path / "map.fits"
+    aia171_test_map.save(filepath)
+    maps = sunpy.map.Map([filepath, filepath], lazy=True)
+    sequence = sunpy.map.MapSequence(maps)
+    assert sequence.all_same_shape
+    assert not sequence._is_lazy
+    assert sequence.mask is None
+    assert sunpy.map.MapSequence(maps, lazy=True).data.shape == aia171_test_map.data.shape + (2,)
+    assert all(isinstance(m._data, DeferredHDUData) for m in maps)
+
+
 def test_all_meta(mapsequence_all_the_same):
     meta = mapsequence_all_the_same.meta
     assert len(meta) == 2
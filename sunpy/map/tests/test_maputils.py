@@ -8,7 +8,7 @@ from astropy.coordinates import BaseCoordinateFrame, SkyCoord
 from astropy.tests.helper import assert_quantity_allclose
 
 import sunpy.map
-from sunpy.coordinates import HeliographicStonyhurst
+from sunpy.coordinates import HeliographicStonyhurst, propagate_with_solar_surface
 from sunpy.coordinates.frames import HeliographicCarrington
 from sunpy.coordinates.utils import GreatArc
 from sunpy.map.maputils import (
@@ -27,6 +27,7 @@ from sunpy.map.maputils import (
     on_disk_bounding_coordinates,
     pixelate_coord_path,
     sample_at_coords,
+    sample_sequence_at_coords,
     solar_angular_radius,
 )
 
@@ -69,6 +70,18 @@ def non_helioprojective_skycoord():
     return SkyCoord(0 * u.rad, 0 * u.rad, frame="icrs")
 
 
+@pytest.fixture
+def aia171_test_sequence(aia171_test_map):
+    # Maps with different observation times and observer locations
+    maps = []
+    for i in range(4):
+        meta = aia171_test_map.meta.copy()
+        meta['date-obs'] = (aia171_test_map.date + i * u.hour).isot
+        meta['haex_obs'] += 1e7 * i
+        maps.append(aia171_test_map._new_instance(aia171_test_map.data + i, meta))
+    return sunpy.map.Map(maps, sequence=True)
+
+
 @pytest.fixture
 def aia_test_arc(aia171_test_map):
     start = SkyCoord(735 * u.arcsec, -471 * u.arcsec, frame=aia171_test_map.coordinate_frame)
@@ -225,6 +238,55 @@ def test_sample_out_of_bounds(aia171_test_map):
         sample_at_coords(aia171_test_map, point)
 
 
+@pytest.mark.parametrize('frame', ['heliographic_stonyhurst', 'first_map', 'last_map'])
+def test_sample_sequence_at_coords(aia171_test_sequence, frame):
+    if frame == 'heliographic_stonyhurst':
+        coords = SkyCoord(np.linspace(-20, 20, 10)*u.deg, np.linspace(-10, 10, 10)*u.deg,
+                          frame=frame, obstime=aia171_test_sequence[0].date)
+    else:
+        smap = aia171_test_sequence[0 if frame == 'first_map' else -1]
+        coords = smap.pixel_to_world(np.linspace(30, 90, 10)*u.pix, np.linspace(40, 80, 10)*u.pix)
+    expected = u.Quantity([sample_at_coords(smap, coords) for smap in aia171_test_sequence])
+    data = sample_sequence_at_coords(aia171_test_sequence, coords)
+    assert data.shape == (4, 10)
+    assert_quantity_allclose(data, expected)
+
+    # A list of maps works in the same way as a sequence
+    assert_quantity_allclose(sample_sequence_at_coords(aia171_test_sequence.maps, coords), expected)
+
+
+def test_sample_sequence_at_coords_diffrot(aia171_test_sequence):
+    coords = SkyCoord([0, 10]*u.deg, [0, 10]*u.deg, frame='heliographic_stonyhurst',
+                      obstime=aia171_test_sequence[0].date)
+    with propagate_with_solar_surface():
+        expected = u.Quantity([sample_at_coords(smap, coords) for smap in aia171_test_sequence])
+        data = sample_sequence_at_coords(aia171_test_sequence, coords)
+    assert_quantity_allclose(data, expected)
+
+
+def test_sample_sequence_at_coords_bilinear(aia171_test_sequence):
+    # Replace the data with its own column index, so that bilinear interpolation
+    # must return the pixel position of each coordinate
+    maps = [smap._new_instance(np.broadcast_to(np.arange(smap.data.shape[1], dtype=float), smap.data.shape),
+                               smap.meta) for smap in aia171_test_sequence]
+    coords = SkyCoord(np.linspace(-20, 20, 10)*u.deg, np.linspace(-10, 10, 10)*u.deg,
+                      frame='heliographic_stonyhurst', obstime=maps[0].date)
+    data = sample_sequence_at_coords(maps, coords, method='bilinear')
+    expected = [smap.wcs.world_to_pixel(coords)[0] for smap in maps]
+    np.testing.assert_allclose(data.value, expected, atol=1e-6)
+    nearest = sample_sequence_at_coords(maps, coords)
+    np.testing.assert_allclose(nearest.value, np.floor(np.asarray(expected) + 0.5))
+
+
+def test_sample_sequence_out_of_bounds(aia171_test_sequence):
+    point = SkyCoord([0, 90]*u.deg, [0, 0]*u.deg, [1, 3]*u.R_sun, frame='heliographic_stonyhurst',
+                     obstime=aia171_test_sequence[0].date)
+    with pytest.raises(ValueError, match='At least one coordinate is not within the bounds of map 0.'):
+        sample_sequence_at_coords(aia171_test_sequence, point)
+    with pytest.raises(ValueError, match="method must be 'nearest' or 'bilinear'"):
+        sample_sequence_at_coords(aia171_test_sequence, point, method='cubic')
+
+
 def test_contains_solar_center(aia171_test_map, all_off_disk_map, all_on_disk_map, straddles_limb_map, sub_smap):
     assert contains_solar_center(aia171_test_map)
     assert not contains_solar_center(all_off_disk_map)
@@ -0,0 +1,116 @@
+"""
+Test the `sunpy.map.ReprojectionPlan` class
+"""
+import numpy as np
+import pytest
+
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+
+import sunpy.map
+from sunpy.map import ReprojectionPlan
+
+
+@pytest.fixture
+def hpc_header(aia171_test_map):
+    new_observer = SkyCoord(45*u.deg, 0*u.deg, 1*u.AU,
+                            frame='heliographic_stonyhurst',
+                            obstime=aia171_test_map.date)
+    return sunpy.map.make_fitswcs_header(
+        aia171_test_map.data.shape,
+        SkyCoord(0*u.arcsec, 0*u.arcsec,
+                 frame='helioprojective',
+                 obstime=aia171_test_map.date,
+                 observer=new_observer,
+                 rsun=aia171_test_map.coordinate_frame.rsun),
+        scale=u.Quantity(aia171_test_map.scale),
+        projection_code='TAN'
+    )
+
+
+@pytest.fixture
+def nan_map(aia171_test_map):
+    data = aia171_test_map.data.astype(float)
+    data[60:62, 70:75] = np.nan
+    return aia171_test_map._new_instance(data, aia171_test_map.meta)
+
+
+@pytest.mark.parametrize('order', ['bilinear', 'nearest-neighbor'])
+def test_plan_matches_reproject_to(nan_map, hpc_header, order):
+    expected, expected_footprint = nan_map.reproject_to(hpc_header, order=order, return_footprint=True)
+    plan = ReprojectionPlan(hpc_header, order=order)
+    outmap, footprint = plan.apply(nan_map, return_footprint=True)
+
+    np.testing.assert_allclose(outmap.data, expected.data, rtol=1e-12, equal_nan=True)
+    np.testing.assert_array_equal(footprint, expected_footprint)
+    assert outmap.wcs.wcs.compare(expected.wcs.wcs)
+
+
+@pytest.mark.parametrize('order', ['bilinear', 'nearest-neighbor'])
+def test_plan_identity(aia171_test_map, order):
+    # Every pixel maps onto itself, including those on the far edges of the array
+    expected = aia171_test_map.reproject_to(aia171_test_map.wcs, order=order)
+    outmap = ReprojectionPlan(aia171_test_map.wcs, order=order).apply(aia171_test_map)
+
+    assert not np.any(np.isnan(expected.data))
+    np.testing.assert_allclose(outmap.data, expected.data, rtol=1e-12, equal_nan=True)
+
+
+def test_plan_reused(aia171_test_map, hpc_header):
+    plan = ReprojectionPlan(hpc_header)
+    plan.apply(aia171_test_map)
+    index = plan._index
+
+    # Same geometry, different data
+    other = aia171_test_map._new_instance(aia171_test_map.data * 2, aia171_test_map.meta)
+    outmap = plan.apply(other)
+    assert plan._index is index
+    np.testing.assert_allclose(outmap.data, other.reproject_to(hpc_header).data,
+                               rtol=1e-12, equal_nan=True)
+
+
+def test_plan_invalidated(aia171_test_map, hpc_header):
+    plan = ReprojectionPlan(hpc_header)
+    plan.apply(aia171_test_map)
+    index = plan._index
+
+    shifted = aia171_test_map.shift_reference_coord(10*u.arcsec, 0*u.arcsec)
+    outmap = plan.apply(shifted)
+    assert plan._index is not index
+    np.testing.assert_allclose(outmap.data, shifted.reproject_to(hpc_header).data,
+                               rtol=1e-12, equal_nan=True)
+
+    index = plan._index
+    plan.apply(shifted.superpixel((2, 2)*u.pix))
+    assert plan._index is not index
+
+
+def test_plan_tolerance(aia171_test_map, hpc_header):
+    plan = ReprojectionPlan(hpc_header, tolerance=2)
+    plan.apply(aia171_test_map)
+    index = plan._index
+
+    # A shift of 10 arcsec is less than 2 pixels of the test map
+    plan.apply(aia171_test_map.shift_reference_coord(10*u.arcsec, 0*u.arcsec))
+    assert plan._index is index
+
+    plan.clear()
+    assert plan._index is None
+
+
+def test_plan_preserve_date_obs(aia171_test_map, hpc_header):
+    hpc_header['date-obs'] = '2020-01-01T00:00:00'
+    plan = ReprojectionPlan(hpc_header)
+    assert plan.apply(aia171_test_map).date.isot == '2020-01-01T00:00:00.000'
+    assert plan.apply(aia171_test_map, preserve_date_obs=True).date == aia171_test_map.date
+
+
+def test_plan_invalid_arguments(aia171_test_map, hpc_header):
+    with pytest.raises(ValueError, match='The interpolation order must be one of'):
+        ReprojectionPlan(hpc_header, order='biquadratic')
+
+    wcs = aia171_test_map.wcs.deepcopy()
+    wcs.pixel_shape = None
+    with pytest.raises(ValueError, match='The output shape must be specified'):
+        ReprojectionPlan(wcs)
+    assert ReprojectionPlan(wcs, shape_out=(10, 20)).shape_out == (10, 20)
@@ -12,6 +12,7 @@ import re
 from pathlib import Path
 from textwrap import dedent
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import numpy as np
 import parfive
@@ -73,6 +74,8 @@ class UnifiedResponse(Sequence):
     def _getitem_string(self, aslice):
         ret = []
         for res in self._list:
+            if res.client is None:
+                continue
             clientname = res.client.__class__.__name__
             if aslice.lower() == clientname.lower().split('client')[0]:
                 ret.append(res)
@@ -150,6 +153,8 @@ class UnifiedResponse(Sequence):
         """
         ret = []
         for res in self._list:
+            if res.client is None:
+                continue
             clientname = res.client.__class__.__name__.lower().split('client')[0]
             if clientname not in ret:
                 ret.append(clientname)
@@ -169,6 +174,13 @@ class UnifiedResponse(Sequence):
         """
         return [res.errors for res in self._list if res.errors]
 
+    @staticmethod
+    def _block_caption(block):
+        # The results of a search which timed out or could not create its client have no client
+        if block.client is None:
+            return f"{len(block)} Results:"
+        return f"{len(block)} Results from the {block.client.__class__.__name__}:"
+
     def _repr_html_(self):
         nprov = len(self)
         if nprov == 1:
@@ -176,7 +188,7 @@ class UnifiedResponse(Sequence):
         else:
             ret = f'Results from {len(self)} Providers:</br></br>'
         for block in self:
-            ret += f"{len(block)} Results from the {block.client.__class__.__name__}:</br>"
+            ret += f"{self._block_caption(block)}</br>"
             if block.errors:
                 ret += f"Errors: {block.errors}</br>"
             ret += block._repr_html_()
@@ -194,8 +206,8 @@ class UnifiedResponse(Sequence):
         else:
             ret = f'Results from {len(self)} Providers:\n\n'
         for block in self:
-            ret += f"{len(block)} Results from the {block.client.__class__.__name__}:\n"
-            if block.client.info_url is not None:
+            ret += f"{self._block_caption(block)}\n"
+            if block.client is not None and block.client.info_url is not None:
                 ret += f'Source: {block.client.info_url}\n'
             size = block.total_size()
 
@@ -265,9 +277,9 @@ class UnifiedResponse(Sequence):
 
         for i , table in enumerate(self._list):
             block = self[i]
-            caption = f"{len(block)} Results from the {block.client.__class__.__name__}:\n"
+            caption = f"{self._block_caption(block)}\n"
 
-            if block.client.info_url is not None:
+            if block.client is not None and block.client.info_url is not None:
                 caption += f'Source: {block.client.info_url}\n'
             size = block.total_size()
 
@@ -301,19 +313,20 @@ class UnifiedResponse(Sequence):
 
 query_walker = attr.AttrWalker()
 """
-We construct an `AttrWalker` which calls `_make_query_to_client` for each
+We construct an `AttrWalker` which calls `_make_query_tasks` for each
 logical component of the query, i.e. any block which are ANDed together.
+The resulting searches are then run by `_run_searches`.
 """
 
 
 @query_walker.add_creator(attr.DataAttr)
 def _create_data(walker, query, factory):
-    return factory._make_query_to_client(query)
+    return factory._make_query_tasks(query)
 
 
 @query_walker.add_creator(attr.AttrAnd)
 def _create_and(walker, query, factory):
-    return factory._make_query_to_client(*query.attrs)
+    return factory._make_query_tasks(*query.attrs)
 
 
 @query_walker.add_creator(attr.AttrOr)
@@ -337,10 +350,14 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
 
     """
 
-    def search(self, *query):
+    def search(self, *query, timeout=None, max_workers=None):
         """
         Query for data in form of multiple parameters.
 
+        The searches of all the clients which can handle the query, and of
+        all the blocks of a query which are ORed together, are run
+        concurrently.
+
         Examples
         --------
         Query for LYRA timeseries data for the time range ('2012/3/4','2012/3/6')
@@ -370,6 +387,17 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
             requested data. The query is specified using attributes from the
             VSO and the JSOC. The query can mix attributes from the VSO and
             the JSOC.
+        timeout : `float`, optional
+            The number of seconds to wait for the search of each client.
+            A client which has not returned results in this time is reported
+            with a `TimeoutError` in `~sunpy.net.fido_factory.UnifiedResponse.errors`,
+            and the results of the other clients are still returned.
+            Defaults to `None`, which waits for all clients to finish.
+        max_workers : `int`, optional
+            The maximum number of client searches to run at the same time.
+            Defaults to `None`, which runs all the searches at the same time.
+            If this is smaller than the number of searches, the ``timeout``
+            includes the time that a search spends waiting to start.
 
         Returns
         -------
@@ -382,9 +410,14 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
         ie. query is now of form A & B or ((A & B) | (C & D))
         This helps in modularising query into parts and handling each of the
         parts individually.
+
+        Errors raised by the search of a client, including timeouts, do not
+        stop the other searches. They are stored on the results of that
+        client instead.
         """
         query = attr.and_(*query)
-        results = query_walker.create(query, self)
+        tasks = query_walker.create(query, self)
+        results = self._run_searches(tasks, timeout=timeout, max_workers=max_workers)
 
         # If we have searched the VSO but no results were returned, but another
         # client generated results, we drop the empty VSO results for tidiness.
@@ -497,6 +530,9 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
                 raise ValueError(f"Query result has an unrecognized type: {type(query_result)} "
                                  "Allowed types are QueryResponseRow, QueryResponseTable or UnifiedResponse.")
             for block in responses:
+                # A search which timed out or could not create its client has nothing to fetch
+                if block.client is None:
+                    continue
                 result = block.client.fetch(block, path=path,
                                             downloader=downloader,
                                             wait=False, **kwargs)
@@ -532,33 +568,59 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
 
         return candidate_widget_types
 
-    def _make_query_to_client(self, *query):
+    def _make_query_tasks(self, *query):
         """
-        Given a query, look up the client and perform the query.
-
-        This method is called by ``search`` and the results are fed into a
-        `~sunpy.net.UnifiedResponse` object.
+        Given a query, look up the clients which can handle it.
 
         Parameters
         ----------
         *query : collection of `~sunpy.net.vso.attr` objects
 
+        Returns
+        -------
+        `list` of `tuple`
+            A ``(client class, query)`` pair for each client.
+        """
+        return [(client, query) for client in self._check_registered_widgets(*query)]
+
+    @staticmethod
+    def _search_client(client_class, query):
+        client = None
+        try:
+            # The client is created here so that a slow or failing constructor
+            # is subject to the timeout and does not stop the other searches
+            client = client_class()
+            return client.search(*query)
+        except Exception as err:
+            return QueryResponseTable([], client=client, errors=err)
+
+    def _run_searches(self, tasks, *, timeout=None, max_workers=None):
+        """
+        Run the searches of the ``(client class, query)`` pairs in ``tasks`` concurrently.
+
         Returns
         -------
         results : `list`
-        client : `object`
-            Instance of client class
+            The results of each search, in the same order as ``tasks``.
         """
-        candidate_widget_types = self._check_registered_widgets(*query)
-        results = []
-        for client in candidate_widget_types:
-            tmpclient = client()
-            try:
-                res = tmpclient.search(*query)
-            except Exception as err:
-                res = QueryResponseTable([], client=tmpclient, errors=err)
-            results.append(res)
+        if len(tasks) == 1 and timeout is None:
+            return [self._search_client(*tasks[0])]
 
+        executor = ThreadPoolExecutor(max_workers=max_workers or len(tasks),
+                                      thread_name_prefix='sunpy-fido-search')
+        try:
+            futures = [executor.submit(self._search_client, client, query) for client, query in tasks]
+            wait(futures, timeout=timeout)
+            results = []
+            for (client, _), future in zip(tasks, futures):
+                if future.done():
+                    results.append(future.result())
+                    continue
+                err = TimeoutError(f"{client.__name__} did not respond within {timeout} seconds.")
+                results.append(QueryResponseTable([], client=None, errors=err))
+        finally:
+            # Do not wait for the searches which have timed out
+            executor.shutdown(wait=False, cancel_futures=True)
         return results
 
     def __repr__(self):
@@ -6,6 +6,10 @@ import codecs
 import urllib
 import inspect
 from itertools import chain
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 import astropy.table
 from astropy.table import Row
@@ -22,13 +26,36 @@ from sunpy.net.hek.utils import (
     _map_columns_to_times,
     _map_event_coord_columns_to_coordinates,
 )
-from sunpy.util import dict_keys_same, unique
 from sunpy.util.xml import xml_to_dict
 
 __all__ = ['HEKClient', 'HEKTable', 'HEKRow']
 
 DEFAULT_URL = 'https://www.lmsal.com/hek/her?'
 
+
+def _extend_columns(columns, n_rows, rows):
+    """
+    Append a page of results, a list of dicts, to a dict of columns.
+
+    Missing values, including whole columns which first appear in this page,
+    are filled with `None`.
+
+    Returns
+    -------
+    `int`
+        The new number of rows.
+    """
+    keys = dict.fromkeys(chain.from_iterable(rows))
+    for key in keys:
+        if key not in columns:
+            columns[key] = [None] * n_rows
+        columns[key] += [row.get(key) for row in rows]
+    for key, column in columns.items():
+        if key not in keys:
+            column += [None] * len(rows)
+    return n_rows + len(rows)
+
+
 class HEKClient(BaseClient):
     """
     Provides access to the Heliophysics Event Knowledgebase (HEK).
@@ -70,39 +97,63 @@ class HEKClient(BaseClient):
     }
     # Default to full disk.
     attrs.walker.apply(attrs.SpatialRegion(), {}, default)
+    # The number of pages of results which are downloaded at the same time
+    max_connections = 4
 
     def __init__(self, url=DEFAULT_URL):
         self.url = url
 
     def _download(self, data):
-        """ Download all data, even if paginated. """
-        page = 1
-        results = []
+        """
+        Download all data, even if paginated.
+
+        After the first page, up to ``max_connections`` of the following pages are
+        fetched at the same time, until a page which is not ``overmax`` is found.
+        """
         new_data = data.copy()
         # Override the default name of the operatorX, where X is a number.
         for key in data.keys():
             if "operator" in key:
                 new_data[f"op{key.split('operator')[-1]}"] = new_data.pop(key)
-        while True:
-            new_data['page'] = page
-            url = self.url + urllib.parse.urlencode(new_data)
-            log.debug(f'Opening {url}')
-            fd = urllib.request.urlopen(url)
-            try:
-                result = codecs.decode(fd.read(), encoding='utf-8', errors='replace')
-                result = json.loads(result)
-            except Exception as e:
-                raise OSError("Failed to load return from the HEKClient.") from e
-            finally:
-                fd.close()
-            results.extend(result['result'])
-            if not result['overmax']:
-                if len(results) > 0:
-                    return astropy.table.Table(dict_keys_same(results))
-                else:
-                    return astropy.table.Table()
-            page += 1
 
+        columns = {}
+        result = self._download_page(new_data, 1)
+        n_rows = _extend_columns(columns, 0, result['result'])
+        if result['overmax']:
+            with ThreadPoolExecutor(max_workers=self.max_connections,
+                                    thread_name_prefix='sunpy-hek') as executor:
+                pages = deque(executor.submit(self._download_page, new_data, page)
+                              for page in range(2, 2 + self.max_connections))
+                next_page = 2 + self.max_connections
+                try:
+                    # The pages are added to the table in order, so that the
+                    # pages after the last one can be discarded
+                    while True:
+                        result = pages.popleft().result()
+                        n_rows = _extend_columns(columns, n_rows, result['result'])
+                        if not result['overmax']:
+                            break
+                        pages.append(executor.submit(self._download_page, new_data, next_page))
+                        next_page += 1
+                finally:
+                    for future in pages:
+                        future.cancel()
+        return astropy.table.Table(columns)
+
+    def _download_page(self, data, page):
+        """
+        Download a single page of results.
+        """
+        url = self.url + urllib.parse.urlencode({**data, 'page': page})
+        log.debug(f'Opening {url}')
+        fd = urllib.request.urlopen(url)
+        try:
+            result = codecs.decode(fd.read(), encoding='utf-8', errors='replace')
+            return json.loads(result)
+        except Exception as e:
+            raise OSError("Failed to load return from the HEKClient.") from e
+        finally:
+            fd.close()
 
     def search(self, *args, **kwargs):
         """
@@ -141,8 +192,25 @@ class HEKClient(BaseClient):
             return HEKTable._from_search(self._merge(self._download(data) for data in ndata), client=self)
 
     def _merge(self, responses):
-        """ Merge responses, removing duplicates. """
-        return astropy.table.vstack(list(unique(chain.from_iterable(responses), _freeze)))
+        """
+        Merge responses, removing duplicates.
+
+        Events are identified by their ``kb_archivid`` if every event has one,
+        otherwise by all of their values.
+        """
+        tables = [table for table in responses if len(table) > 0]
+        if not tables:
+            return astropy.table.Table()
+        table = astropy.table.vstack(tables)
+        ids = table['kb_archivid'] if 'kb_archivid' in table.colnames else None
+        if ids is not None and not np.ma.is_masked(ids) and None not in ids.tolist():
+            keys = ids.tolist()
+        else:
+            keys = [_freeze([_freeze(value) for value in row]) for row in table.iterrows()]
+        first = {}
+        for i, key in enumerate(keys):
+            first.setdefault(key, i)
+        return table[list(first.values())]
 
     def fetch(self, *args, **kwargs):
         """
@@ -1,4 +1,10 @@
 
+import io
+import copy
+import json
+import urllib
+from urllib.parse import parse_qs, urlsplit
+
 import numpy as np
 import pytest
 
@@ -10,6 +16,7 @@ from astropy.time import Time
 from sunpy.coordinates import Helioprojective, get_earth
 from sunpy.net import Fido, attr, attrs, hek
 from sunpy.net.hek.utils import _get_coord_attributes, _get_unit_attributes
+from sunpy.util import dict_keys_same
 
 
 @pytest.fixture
@@ -356,3 +363,59 @@ def test_raw_hek_result_preserved(hek_result):
             assert np.issubdtype(column_dtype, np.float64) | np.issubdtype(column_dtype, np.object_)
         elif unit_attr.get('is_unit_prop', False):
             assert np.issubdtype(column_dtype, np.str_)
+
+
+@pytest.fixture
+def hek_pages(monkeypatch):
+    """
+    Replaces the HEK with 45 events, returned in pages of 10 events.
+    """
+    events = [{'kb_archivid': f'ivo://helio-informatics.org/FL_{i}', 'fl_peakflux': float(i)}
+              for i in range(45)]
+    # A column which only appears part way through the results
+    for event in events[25:30]:
+        event['fl_goescls'] = 'M1.0'
+    requested = []
+
+    def urlopen(url):
+        page = int(parse_qs(urlsplit(url).query)['page'][0])
+        requested.append(page)
+        result = {'result': events[10 * (page - 1):10 * page], 'overmax': 10 * page < len(events)}
+        return io.BytesIO(json.dumps(result).encode())
+
+    monkeypatch.setattr(urllib.request, 'urlopen', urlopen)
+    return events, requested
+
+
+def test_download_pages(hek_pages):
+    events, requested = hek_pages
+    client = hek.HEKClient()
+    client.max_connections = 2
+    table = client._download({'event_type': 'FL'})
+    expected = Table(dict_keys_same(copy.deepcopy(events)))
+    assert len(table) == 45
+    assert set(table.colnames) == set(expected.colnames)
+    for name in expected.colnames:
+        assert table[name].tolist() == expected[name].tolist()
+    # The pages after the last page may be requested, but are not used
+    assert set(range(1, 6)) <= set(requested) <= set(range(1, 8))
+
+
+def test_merge_removes_duplicates(hek_pages):
+    client = hek.HEKClient()
+    table = client._merge([client._download({'event_type': 'FL'}),
+                           client._download({'event_type': 'FL'})[20:35]])
+    assert len(table) == 45
+    assert table['kb_archivid'].tolist() == [event['kb_archivid'] for event in hek_pages[0]]
+
+    # Without the event IDs, events are compared by all of their values
+    table.remove_column('kb_archivid')
+    merged = client._merge([table, table[5:10], table[40:]])
+    assert len(merged) == 45
+    assert merged['fl_peakflux'].tolist() == table['fl_peakflux'].tolist()
+    assert len(client._merge([Table(), Table()])) == 0
+
+    # Events with a missing ID are not merged with each other
+    table = Table({'kb_archivid': np.array(['a', None, None], dtype=object), 'fl_peakflux': [1, 2, 3]})
+    merged = client._merge([table, table[:1]])
+    assert merged['fl_peakflux'].tolist() == [1, 2, 3]
@@ -3,20 +3,26 @@ This module provides a web scraper.
 """
 import os
 import re
-from time import sleep
+import html
+import functools
+import threading
+from time import monotonic
 from ftplib import FTP
 from datetime import datetime
 from urllib.error import URLError, HTTPError
 from urllib.parse import urlsplit
 from urllib.request import urlopen
+from concurrent.futures import ThreadPoolExecutor
 
-from bs4 import BeautifulSoup
+import numpy as np
 
 from astropy.time import Time
 
-from sunpy import log
-from sunpy.extern.parse import parse
-from sunpy.net.scraper_utils import date_floor, extract_timestep, get_timerange_from_exdict
+from sunpy import config, log
+from sunpy.extern.parse import compile as compile_parser
+from sunpy.net.scraper_utils import date_floor, extract_timestep, get_interval_from_exdict
+from sunpy.util.config import CACHE_DIR
+from sunpy.util.exceptions import warn_user
 
 __all__ = ['Scraper']
 
@@ -45,6 +51,79 @@ PARSE_TIME_CONVERSIONS = {
     "{week_number:2d}": "%W",
 }
 
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern):
+    """
+    Returns a parser for a ``parse`` format, which converts the format into a regular expression once.
+    """
+    return compile_parser(pattern)
+
+
+def _intersects(starts, ends, timerange):
+    """
+    Whether each of the time intervals from ``starts`` to ``ends`` intersects with ``timerange``.
+    """
+    return (starts <= timerange.end.datetime64) & (ends >= timerange.start.datetime64)
+
+
+# The target of the href attribute of every link in an html page
+_LINK_HREF = re.compile(r"""<a\s(?:[^>]*?\s)?href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""",
+                        re.IGNORECASE)
+# Comments and scripts, which can contain text that looks like links (unterminated ones run to the end)
+_COMMENTS_AND_SCRIPTS = re.compile(r"<!--.*?(?:-->|\Z)|<script\b.*?(?:</script\s*>|\Z)",
+                                   re.IGNORECASE | re.DOTALL)
+
+
+def _extract_links(content, encoding=None):
+    """
+    Returns the targets of all the links in an html page.
+    """
+    if isinstance(content, bytes):
+        content = content.decode(encoding or 'utf-8', errors='replace')
+    content = _COMMENTS_AND_SCRIPTS.sub('', content)
+    return [html.unescape(''.join(match)) for match in _LINK_HREF.findall(content)
+            if any(match)]
+
+
+class _HostBackoff:
+    """
+    The times until which no requests should be made to each host.
+
+    This is shared between the threads which crawl an archive, so that when
+    a server asks for requests to be slowed down, all of the threads wait.
+    """
+
+    def __init__(self):
+        self._until = {}
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    def delay(self, host, seconds):
+        with self._lock:
+            self._until[host] = max(self._until.get(host, 0), monotonic() + seconds)
+
+    def wait(self, host):
+        """
+        Wait until requests can be made to ``host``.
+
+        Returns `False` if the crawl has been cancelled in the meantime.
+        """
+        while not self._cancelled.is_set():
+            with self._lock:
+                remaining = self._until.get(host, 0) - monotonic()
+            if remaining <= 0:
+                return True
+            self._cancelled.wait(remaining)
+        return False
+
+    def cancel(self):
+        """
+        Stop waiting, e.g. because the crawl has failed.
+        """
+        self._cancelled.set()
+
+
 class Scraper:
     """
     A scraper to scrap web data archives based on dates.
@@ -71,6 +150,13 @@ class Scraper:
     now : `datetime.datetime`
         The pattern with the actual date.
         This is not checking if there is an existent file, but just how the ``pattern`` looks with the current time.
+    max_connections : `int`
+        The maximum number of directories of an http archive that are fetched at the same time.
+        Defaults to 5.
+    listing_cache : `~sunpy.net.scraper_cache.ListingCache` or `None`
+        The cache for the listings of the directories of http archives, shared by all scrapers.
+        Defaults to `None`, i.e. no caching, unless ``cache_scraper_listings`` is enabled
+        in the ``[downloads]`` section of the sunpy configuration.
 
     Examples
     --------
@@ -89,6 +175,9 @@ class Scraper:
     >>> print(swap.now)  # doctest: +SKIP
     https://proba2.sidc.be/swap/data/bsd/2022/12/21/swap_lv1_20221221_112433.fits
     """
+    max_connections = 5
+    listing_cache = None
+
     def __init__(self, format, **kwargs):
         pattern = format.format(**kwargs)
         datetime_pattern = pattern
@@ -126,7 +215,7 @@ class Scraper:
         `bool`
             `True` if the given filepath matches with the calculated one for given date, else `False`.
         """
-        return parse(date.strftime(self.datetime_pattern), filepath) is not None
+        return _compile_pattern(date.strftime(self.datetime_pattern)).parse(filepath) is not None
 
     def range(self, timerange):
         """
@@ -231,12 +320,9 @@ class Scraper:
                 except Exception as e:
                     log.debug(f"FTP CWD: {e}")
                     continue
-                for file_i in ftp.nlst():
-                    fullpath = directory + file_i
-                    if self._url_follows_pattern(fullpath):
-                        if self._check_timerange(fullpath, timerange):
-                            filesurls.append(fullpath)
+                filesurls += [directory + file_i for file_i in ftp.nlst()]
 
+        filesurls = self._filter_by_timerange(filesurls, timerange)
         filesurls = ['ftp://' + f"{urlsplit(url).netloc}{urlsplit(url).path}"
                      for url in filesurls]
 
@@ -263,14 +349,10 @@ class Scraper:
         filepaths = list()
         for directory in directories:
             try:
-                for file_i in os.listdir(directory):
-                    fullpath = directory + file_i
-                    if self._url_follows_pattern(fullpath):
-                        if self._check_timerange(fullpath, timerange):
-                            filepaths.append(fullpath)
+                filepaths += [directory + file_i for file_i in os.listdir(directory)]
             except FileNotFoundError:
                 log.debug(f"Local directory not found: {directory}.")
-        filepaths = [prefix + path for path in filepaths]
+        filepaths = [prefix + path for path in self._filter_by_timerange(filepaths, timerange)]
         # Set them back to their original values
         self.pattern, self.datetime_pattern = pattern, datetime_pattern
         return filepaths
@@ -278,37 +360,107 @@ class Scraper:
     def _httpfilelist(self, timerange):
         """
         Goes over http archives hosted on the web, to return list of files in the given timerange.
+
+        Up to ``max_connections`` directories are fetched at the same time.
         """
         directories = self.range(timerange)
+        listings = {}
+        cached = {}
+        if self.listing_cache is not None:
+            for directory in directories:
+                cached[directory] = self.listing_cache.lookup(directory, self._directory_end(directory))
+                if cached[directory] is not None and not cached[directory].expired:
+                    listings[directory] = cached[directory].links
+        to_fetch = [directory for directory in directories if directory not in listings]
+
+        backoff = _HostBackoff()
+        if len(to_fetch) == 1:
+            listings[to_fetch[0]] = self._fetch_http_listing(to_fetch[0], backoff, cached.get(to_fetch[0]))
+        elif to_fetch:
+            with ThreadPoolExecutor(max_workers=self.max_connections,
+                                    thread_name_prefix='sunpy-scraper') as executor:
+                futures = [executor.submit(self._fetch_http_listing, directory, backoff, cached.get(directory))
+                           for directory in to_fetch]
+                try:
+                    # Errors are raised in the order of the directories
+                    for directory, future in zip(to_fetch, futures):
+                        listings[directory] = future.result()
+                except BaseException:
+                    backoff.cancel()
+                    for future in futures:
+                        future.cancel()
+                    raise
+
         filesurls = list()
-        retry_counts = {}
-        while directories:
-            directory = directories.pop(0)
+        for directory in directories:
+            filesurls += [self.domain + href[1:] if href[0] == '/' else directory + href
+                          for href in listings[directory]]
+        return self._filter_by_timerange(filesurls, timerange)
+
+    def _directory_end(self, directory):
+        """
+        Returns the end of the interval of time covered by a directory, or `None` if unknown.
+        """
+        directorypattern = '/'.join(self.datetime_pattern.split('/')[:-1]) + '/'
+        timestep = extract_timestep(directorypattern)
+        if timestep is None:
+            return None
+        try:
+            return datetime.strptime(directory, directorypattern) + timestep
+        except ValueError:
+            return None
+
+    def _fetch_http_listing(self, directory, backoff, cached=None):
+        """
+        Fetches the links of an http directory and stores them in the listing cache.
+
+        If fetching fails and there is a ``cached`` listing, the cached listing is
+        returned instead.
+        """
+        try:
+            links = self._http_directory_links(directory, backoff)
+        except Exception as e:
+            if cached is None:
+                raise
+            warn_user(f"{e!r} \nDue to the above error, you will be working with a stale listing "
+                      f"of {directory} from {cached.age} ago.")
+            return cached.links
+        if self.listing_cache is not None:
+            self.listing_cache.store(directory, links)
+        return links
+
+    def _http_directory_links(self, directory, backoff):
+        """
+        Returns the targets of all the links in the page of an http directory.
+
+        A missing directory has no links. If the server asks us to back off,
+        the request is retried and no requests are made to that host in the
+        meantime.
+        """
+        host = urlsplit(directory).netloc
+        retry_count = 0
+        while True:
+            if not backoff.wait(host):
+                return []
             try:
                 opn = urlopen(directory)
                 try:
-                    soup = BeautifulSoup(opn, "html.parser")
-                    for link in soup.find_all("a"):
-                        href = link.get("href")
-                        if href is not None:
-                            if href[0] == '/':
-                                fullpath = self.domain + href[1:]
-                            else:
-                                fullpath = directory + href
-                            if self._url_follows_pattern(fullpath):
-                                if self._check_timerange(fullpath, timerange):
-                                    filesurls.append(fullpath)
+                    return _extract_links(opn.read(), opn.headers.get_content_charset())
                 finally:
                     opn.close()
             except HTTPError as http_err:
                 # Ignore missing directories (issue #2684).
                 if http_err.code == 404:
                     log.debug(f"Directory {directory} not found.")
-                    continue
+                    return []
                 if http_err.code in [400, 403]:
                     log.debug(f"Got error {http_err.code} while scraping {directory} : {http_err.reason}")
                     raise
                 if http_err.code in [429, 504]:
+                    if retry_count > 4:
+                        log.debug(f"Exceeded maximum retry limit for {directory}")
+                        raise
+                    retry_count += 1
                     # See if the server has told us how long to back off for
                     retry_after = http_err.hdrs.get('Retry-After', 2)
                     try:
@@ -320,20 +472,16 @@ class Scraper:
                     log.debug(
                         f"Got {http_err.code} while scraping {directory}, waiting for {retry_after} seconds before retrying."
                     )
-                    sleep(retry_after)
-                    if retry_counts.get(directory, 0) > 4:
-                        log.debug(f"Exceeded maximum retry limit for {directory}")
-                        raise
-                    retry_counts[directory] = retry_counts.get(directory, 0) + 1
-                    directories.insert(0, directory)
+                    backoff.delay(host, retry_after)
                     continue
+                log.debug(f"Got error {http_err.code} while scraping {directory} : {http_err.reason}")
+                return []
             except URLError as url_err:
                 log.debug(f"Failed to parse content from {directory}: {url_err}")
                 raise
             except Exception as e:
                 log.debug(f"Failed to parse: {e}")
                 raise
-        return filesurls
 
     def _check_timerange(self, url, timerange):
         """
@@ -352,7 +500,16 @@ class Scraper:
         `bool`
             `True` if URL's valid time range overlaps the given timerange, else `False`.
         """
-        exdict = parse(self.pattern, url).named
+        start, end = self._interval_from_exdict(_compile_pattern(self.pattern).parse(url).named)
+        return bool(_intersects(np.array([start], dtype='datetime64[ns]'),
+                                np.array([end], dtype='datetime64[ns]'), timerange)[0])
+
+    @staticmethod
+    def _interval_from_exdict(exdict):
+        """
+        Returns the start and end of the time interval of a file from the metadata
+        extracted from its url.
+        """
         if exdict['year'] < 100:
             exdict['year'] = 2000 + exdict['year']
         if 'month' not in exdict:
@@ -360,14 +517,34 @@ class Scraper:
                 exdict['month'] = datetime.strptime(exdict['month_name'], '%B').month
             elif 'month_name_abbr' in exdict:
                 exdict['month'] = datetime.strptime(exdict['month_name_abbr'], '%b').month
-        tr = get_timerange_from_exdict(exdict)
-        return tr.intersects(timerange)
+        return get_interval_from_exdict(exdict)
+
+    def _filter_by_timerange(self, urls, timerange):
+        """
+        Returns the urls which follow the pattern and whose time range intersects
+        with the given time range, in their original order.
+        """
+        if not urls:
+            return []
+        parser = _compile_pattern(self.pattern)
+        matched, starts, ends = [], [], []
+        for url in urls:
+            result = parser.parse(url)
+            if result is None:
+                continue
+            start, end = self._interval_from_exdict(result.named)
+            matched.append(url)
+            starts.append(start)
+            ends.append(end)
+        keep = _intersects(np.array(starts, dtype='datetime64[ns]'),
+                           np.array(ends, dtype='datetime64[ns]'), timerange)
+        return [url for url, keep_url in zip(matched, keep) if keep_url]
 
     def _url_follows_pattern(self, url):
         """
         Check whether the url provided follows the pattern.
         """
-        return parse(self.pattern, url)
+        return _compile_pattern(self.pattern).parse(url)
 
 
     def _extract_date(self, url):
@@ -450,8 +627,9 @@ class Scraper:
         """
         urls = self.filelist(timerange)
         metalist = []
+        parser = _compile_pattern(self.pattern)
         for url in urls:
-            metadict = parse(self.pattern, url)
+            metadict = parser.parse(url)
             if metadict is not None:
                 append = True
                 metadict = metadict.named
@@ -470,3 +648,10 @@ class Scraper:
                 if append:
                     metalist.append(metadict)
         return metalist
+
+
+if config.getboolean('downloads', 'cache_scraper_listings', fallback=False):
+    # Imported here to avoid importing sunpy.data unless the cache is used
+    from sunpy.net.scraper_cache import ListingCache, ListingStorage
+
+    Scraper.listing_cache = ListingCache(ListingStorage(CACHE_DIR + '/scraper_listings.db'))
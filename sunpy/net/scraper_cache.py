@@ -0,0 +1,157 @@
+"""
+This module provides an on-disk cache of the listings of remote directories
+searched by `~sunpy.net.Scraper`.
+"""
+import json
+from datetime import UTC, datetime
+from collections import namedtuple
+
+import astropy.units as u
+from astropy.time import TimeDelta
+
+from sunpy import log
+from sunpy.data.data_manager.storage import SqliteStorage
+
+__all__ = ['ListingCache', 'ListingStorage']
+
+
+_CachedListing = namedtuple('CachedListing', ['links', 'age', 'expired'])
+
+
+def _utcnow():
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class ListingStorage(SqliteStorage):
+    """
+    A sqlite backend for storing directory listings.
+
+    Parameters
+    ----------
+    path : `str`
+        Path to the database file.
+    """
+    COLUMN_NAMES = [
+        'url',
+        'links',
+        'time',
+    ]
+
+
+class ListingCache:
+    """
+    A cache of the listings of remote directories.
+
+    Archives are commonly organised in directories which each cover an
+    interval of time, e.g., a day.
+    Once that interval is over, the contents of the directory rarely change,
+    so a listing fetched more than ``settle_time`` after the end of that
+    interval never expires.
+    Other listings, including those of directories which do not cover a known
+    interval, expire after ``expiry``.
+
+    Parameters
+    ----------
+    storage : `~sunpy.data.data_manager.storage.StorageProviderBase`
+        Storage for the listings, with the columns of
+        `~sunpy.net.scraper_cache.ListingStorage`.
+    expiry : `~astropy.units.Quantity`, optional
+        The time after which the listing of a directory that may still change
+        is fetched again.
+        Defaults to 1 hour.
+    settle_time : `~astropy.units.Quantity`, optional
+        The time after the end of the interval of a directory for which its
+        listing may still change.
+        Defaults to 1 day.
+
+    Attributes
+    ----------
+    hits : `int`
+        The number of directories whose listing was taken from the cache.
+    misses : `int`
+        The number of directories whose listing was not cached or had expired.
+
+    Examples
+    --------
+    >>> from sunpy.net import Scraper
+    >>> from sunpy.net.scraper_cache import ListingCache, ListingStorage
+    >>> Scraper.listing_cache = ListingCache(ListingStorage('listings.db'))  # doctest: +SKIP
+    """
+
+    def __init__(self, storage, expiry=1*u.hour, settle_time=1*u.day):
+        self._storage = storage
+        self._expiry = TimeDelta(expiry).to_datetime()
+        self._settle_time = TimeDelta(settle_time).to_datetime()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} hits={self.hits} misses={self.misses}>"
+
+    def lookup(self, url, end=None):
+        """
+        Look up the listing of a directory.
+
+        Parameters
+        ----------
+        url : `str`
+            The URL of the directory.
+        end : `datetime.datetime`, optional
+            The end of the interval of time that the directory covers, in UTC.
+
+        Returns
+        -------
+        `tuple` or `None`
+            A named tuple of the targets of the links in the directory page
+            (``links``), the time since the listing was fetched (``age``) and
+            whether it has expired (``expired``), or `None` if the directory is
+            not in the cache.
+            An expired listing is still returned, so that it can be used if
+            fetching the directory again fails.
+        """
+        details = self._storage.find_by_key('url', url)
+        if details is None:
+            self.misses += 1
+            log.debug(f"Listing of {url} is not cached.")
+            return None
+        fetched = datetime.fromisoformat(details['time'])
+        age = _utcnow() - fetched
+        # A listing fetched before the interval settled may be incomplete
+        settled = end is not None and end + self._settle_time < fetched
+        expired = not settled and age > self._expiry
+        if expired:
+            self.misses += 1
+            log.debug(f"Cached listing of {url} has expired, it is {age} old.")
+        else:
+            self.hits += 1
+            log.debug(f"Using cached listing of {url}, it is {age} old.")
+        return _CachedListing(json.loads(details['links']), age, expired)
+
+    def store(self, url, links):
+        """
+        Store the listing of a directory, replacing any existing listing.
+
+        Parameters
+        ----------
+        url : `str`
+            The URL of the directory.
+        links : `list` of `str`
+            The targets of the links in the directory page.
+        """
+        self._storage.delete_by_key('url', url)
+        self._storage.store({
+            'url': url,
+            'links': json.dumps(list(links)),
+            'time': _utcnow().isoformat(),
+        })
+
+    def delete(self, url):
+        """
+        Remove the listing of a directory from the cache.
+
+        Parameters
+        ----------
+        url : `str`
+            The URL of the directory.
+        """
+        self._storage.delete_by_key('url', url)
@@ -1,5 +1,6 @@
 import os
 import pathlib
+import threading
 from stat import S_IREAD, S_IRGRP, S_IROTH
 from unittest import mock
 
@@ -16,7 +17,7 @@ from sunpy import config
 from sunpy.net import Fido, attr
 from sunpy.net import attrs as a
 from sunpy.net import jsoc
-from sunpy.net.base_client import QueryResponseColumn, QueryResponseRow, QueryResponseTable
+from sunpy.net.base_client import BaseClient, QueryResponseColumn, QueryResponseRow, QueryResponseTable
 from sunpy.net.dataretriever.client import GenericClient, QueryResponse
 from sunpy.net.fido_factory import UnifiedResponse
 from sunpy.net.tests.helpers import mock_query_object
@@ -510,3 +511,94 @@ def test_fido_stereo_extent_type():
     res = Fido.search(a.Time('2008/01/14', '2008/01/14 01:00:00'), a.Instrument.secchi, a.Source('STEREO_A'), a.ExtentType('CORONA'))
     assert len(res[0]) == 123
     assert not all(res[0].columns["Extent Type"] == "CORONA")
+
+
+class StubClientAttr(attr.SimpleAttr):
+    """
+    The name of the stub client which should handle a query.
+    """
+
+
+@pytest.fixture
+def stub_clients():
+    """
+    Clients which only handle queries for their own name and are removed from Fido afterwards.
+    """
+    barrier = threading.Barrier(2, timeout=10)
+    release = threading.Event()
+
+    class StubClient(BaseClient):
+        def search(self, *query):
+            return QueryResponseTable({'Client': [type(self).__name__]}, client=self)
+
+        def fetch(self, *query_results, **kwargs):
+            pass
+
+        @classmethod
+        def _can_handle_query(cls, *query):
+            return any(isinstance(q, StubClientAttr) and q.value == cls.__name__ for q in query)
+
+    class BarrierClient(StubClient):
+        def search(self, *query):
+            # Only passes if another search is running at the same time
+            barrier.wait()
+            return super().search(*query)
+
+    class OtherBarrierClient(BarrierClient):
+        pass
+
+    class HangingClient(StubClient):
+        def search(self, *query):
+            release.wait(10)
+            return super().search(*query)
+
+    class FailingClient(StubClient):
+        def search(self, *query):
+            raise ConnectionError('Stub is down')
+
+    class UnreachableClient(StubClient):
+        def __init__(self):
+            raise ConnectionError('Stub cannot connect')
+
+    clients = {cls.__name__: cls for cls in
+               [StubClient, BarrierClient, OtherBarrierClient, HangingClient, FailingClient,
+                UnreachableClient]}
+    yield clients
+    release.set()
+    for cls in clients.values():
+        Fido.registry.pop(cls, None)
+
+
+def test_fido_search_concurrent(stub_clients):
+    results = Fido.search(StubClientAttr('BarrierClient') | StubClientAttr('OtherBarrierClient'))
+    assert len(results) == 2
+    assert not results.errors
+    # The results are in the order of the query
+    assert results[0]['Client'][0] == 'BarrierClient'
+    assert results[1]['Client'][0] == 'OtherBarrierClient'
+
+
+def test_fido_search_timeout(stub_clients):
+    query = StubClientAttr('StubClient') | StubClientAttr('HangingClient') | StubClientAttr('FailingClient')
+    results = Fido.search(query, timeout=0.5)
+    assert len(results) == 3
+    assert results[0]['Client'][0] == 'StubClient'
+    assert not results[0].errors
+    assert isinstance(results[1].errors, TimeoutError)
+    assert results[1].client is None
+    assert isinstance(results[2].errors, ConnectionError)
+    assert isinstance(results[2].client, stub_clients['FailingClient'])
+    assert "HangingClient did not respond within 0.5 seconds" in str(results)
+    assert results.keys() == ['stub', 'failing']
+
+
+def test_fido_search_client_construction_error(stub_clients):
+    results = Fido.search(StubClientAttr('StubClient') | StubClientAttr('UnreachableClient'))
+    assert len(results) == 2
+    assert results[0]['Client'][0] == 'StubClient'
+    assert isinstance(results[1].errors, ConnectionError)
+    assert results[1].client is None
+    assert "Errors: Stub cannot connect" in str(results)
+    assert "Errors: Stub cannot connect" in results._repr_html_()
+    # Only the results with a client are fetched
+    assert Fido.fetch(results, path="{file}") == []
@@ -1,5 +1,7 @@
 import logging
 import datetime
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from urllib.error import URLError, HTTPError
 from unittest.mock import Mock, patch
 
@@ -7,9 +9,11 @@ import pytest
 
 from sunpy.data.test import rootdir
 from sunpy.extern import parse
-from sunpy.net.scraper import Scraper
+from sunpy.net.scraper import Scraper, _extract_links
+from sunpy.net.scraper_cache import ListingCache, ListingStorage
 from sunpy.net.scraper_utils import get_timerange_from_exdict
 from sunpy.time import TimeRange, parse_time
+from sunpy.util.exceptions import SunpyUserWarning
 
 
 def test_directory_date_pattern():
@@ -327,3 +331,120 @@ def test_local_expected_directory_doesnt_exist(tmp_path):
     meta = s._extract_files_meta(TimeRange("2025-01-01", "2025-01-02"))
     assert len(files) == 1
     assert len(meta) == 1
+
+
+@pytest.fixture
+def http_archive(tmp_path):
+    """
+    A local http server with daily directories of files, which asks for the first
+    request of each directory to be retried.
+    """
+    for day in range(1, 6):
+        path = tmp_path / '2025' / '01' / f'{day:02}'
+        path.mkdir(parents=True)
+        for hour in (0, 12):
+            (path / f'data_202501{day:02}_{hour:02}.txt').write_text('')
+    requests = []
+    lock = threading.Lock()
+
+    class Handler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(tmp_path), **kwargs)
+
+        def do_GET(self):
+            with lock:
+                first = self.path not in requests
+                requests.append(self.path)
+            if first:
+                self.send_response(429)
+                self.send_header('Retry-After', '0')
+                self.end_headers()
+                return
+            super().do_GET()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}/', requests
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_filelist_local_server(http_archive):
+    url, requests = http_archive
+    s = Scraper(format=url + '{{year:4d}}/{{month:2d}}/{{day:2d}}/data_{{year:4d}}{{month:2d}}{{day:2d}}_{{hour:2d}}.txt')
+    # The last directory does not exist
+    files = s.filelist(TimeRange('2025-01-02 06:00', '2025-01-06'))
+    assert files == [f'{url}2025/01/{day:02}/data_202501{day:02}_{hour:02}.txt'
+                     for day, hour in [(2, 12), (3, 0), (3, 12), (4, 0), (4, 12), (5, 0), (5, 12)]]
+    # Each directory is requested twice because of the rate limit
+    assert sorted(requests) == sorted(2 * [f'/2025/01/{day:02}/' for day in range(2, 7)])
+
+
+@pytest.mark.parametrize(('content', 'links'), [
+    ('<a href="file.fits">file.fits</a>', ['file.fits']),
+    ("<A HREF='/dir/'>dir</A><a name='top'>", ['/dir/']),
+    ('<a class="link" href=file.fits>', ['file.fits']),
+    ('<a href="?C=N;O=D&amp;x=1">Name</a>', ['?C=N;O=D&x=1']),
+    (b'<abbr href="no.fits"></abbr><a\nhref="yes.fits">', ['yes.fits']),
+    ('<a data-href="no.fits" href="yes.fits"><a data-href="no.fits">', ['yes.fits']),
+    ('<!-- <a href="no.fits"> --><a href="yes.fits"><!-- <a href="no.fits">', ['yes.fits']),
+    ('<script>s = \'<a href="no.fits">\';</script><a href="yes.fits">', ['yes.fits']),
+])
+def test_extract_links(content, links):
+    assert _extract_links(content) == links
+
+
+def test_http_filelist_listing_cache(http_archive, tmp_path, monkeypatch):
+    url, requests = http_archive
+    cache = ListingCache(ListingStorage(tmp_path / 'listings.db'))
+    monkeypatch.setattr(Scraper, 'listing_cache', cache)
+    s = Scraper(format=url + '{{year:4d}}/{{month:2d}}/{{day:2d}}/data_{{year:4d}}{{month:2d}}{{day:2d}}_{{hour:2d}}.txt')
+    timerange = TimeRange('2025-01-01', '2025-01-02 23:00')
+    files = s.filelist(timerange)
+    assert len(files) == 4
+    assert (cache.hits, cache.misses) == (0, 2)
+    n_requests = len(requests)
+
+    # The directories are in the past, so they are not fetched again
+    assert s.filelist(timerange) == files
+    assert len(requests) == n_requests
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # An expired listing is used if the directory cannot be fetched
+    cache._expiry = datetime.timedelta(0)
+    cache._settle_time = datetime.timedelta(days=1e5)
+    with patch('sunpy.net.scraper.urlopen', side_effect=URLError('connection error')):
+        with pytest.warns(SunpyUserWarning, match='stale listing'):
+            assert s.filelist(timerange) == files
+
+
+@pytest.mark.parametrize(('pattern', 'urls'), [
+    ('{{year:4d}}/{{month:2d}}/{{day:2d}}/data_{{year:4d}}{{month:2d}}{{day:2d}}_{{hour:2d}}{{minute:2d}}.fits',
+     [f'2014/03/{day:02}/data_201403{day:02}_{hour:02}{minute:02}.fits'
+      for day in range(3, 7) for hour in range(0, 24, 5) for minute in (0, 59)]),
+    ('{{year:2d}}{{month_name_abbr:l}}/{{day:2d}}.txt',
+     [f'14{month}/{day:02}.txt' for month in ('Feb', 'Mar', 'Apr') for day in (1, 4, 28)]),
+    ('{{year:4d}}/{{year:4d}}{{month:2d}}.txt', [f'2014/2014{month:02}.txt' for month in range(1, 13)]),
+])
+def test_filter_by_timerange(pattern, urls):
+    s = Scraper(format=pattern)
+    timerange = TimeRange('2014-03-04 12:00', '2014-03-05 10:00:00.001')
+    # Add urls which do not follow the pattern
+    urls = ['index.html', *urls, 'data.fits']
+
+    # The urls are filtered one at a time using astropy for comparison
+    expected = []
+    for url in urls:
+        if result := s._url_follows_pattern(url):
+            exdict = result.named
+            # Normalizes the year and month in place
+            s._interval_from_exdict(exdict)
+            if get_timerange_from_exdict(exdict).intersects(timerange):
+                expected.append(url)
+            assert s._check_timerange(url, timerange) == (url in expected)
+    assert s._filter_by_timerange(urls, timerange) == expected
+    assert 0 < len(expected) < len(urls)
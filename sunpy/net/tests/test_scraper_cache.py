@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import astropy.units as u
+
+from sunpy.net.scraper_cache import ListingCache, ListingStorage, _utcnow
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ListingCache(ListingStorage(tmp_path / 'listings.db'), expiry=1*u.hour, settle_time=1*u.day)
+
+
+def set_age(cache, url, age):
+    details = cache._storage.find_by_key('url', url)
+    cache._storage.delete_by_key('url', url)
+    details['time'] = (_utcnow() - age).isoformat()
+    cache._storage.store(details)
+
+
+def test_miss_and_hit(cache):
+    url = 'https://example.com/2020/01/01/'
+    assert cache.lookup(url) is None
+    assert cache.misses == 1
+
+    cache.store(url, ['a.fits', 'b.fits'])
+    listing = cache.lookup(url)
+    assert listing.links == ['a.fits', 'b.fits']
+    assert not listing.expired
+    assert listing.age < timedelta(minutes=1)
+    assert cache.hits == 1
+
+    # Storing again replaces the listing
+    cache.store(url, ['c.fits'])
+    assert cache.lookup(url).links == ['c.fits']
+
+    cache.delete(url)
+    assert cache.lookup(url) is None
+
+
+@pytest.mark.parametrize(('end', 'age', 'expired'), [
+    # Past directories never expire
+    (datetime(2020, 1, 2), timedelta(days=1000), False),
+    # Listings fetched before the interval settled expire
+    (_utcnow() - timedelta(days=2), timedelta(days=3), True),
+    (_utcnow() - timedelta(days=2), timedelta(days=1, hours=12), True),
+    # Recent directories and directories without a known interval expire
+    (_utcnow(), timedelta(minutes=10), False),
+    (_utcnow(), timedelta(hours=2), True),
+    (_utcnow() - timedelta(hours=12), timedelta(hours=2), True),
+    (None, timedelta(minutes=10), False),
+    (None, timedelta(hours=2), True),
+])
+def test_expiry(cache, end, age, expired):
+    url = 'https://example.com/2020/01/01/'
+    cache.store(url, ['a.fits'])
+    set_age(cache, url, age)
+    listing = cache.lookup(url, end)
+    assert listing.expired is expired
+    assert listing.links == ['a.fits']
+    assert (cache.hits, cache.misses) == ((0, 1) if expired else (1, 0))
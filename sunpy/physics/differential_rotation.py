@@ -1,4 +1,6 @@
+import warnings
 from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -15,6 +17,7 @@ from sunpy.coordinates import (
     transform_with_sun_center,
 )
 from sunpy.map import (
+    MapSequence,
     contains_full_disk,
     coordinate_is_on_solar_disk,
     is_all_off_disk,
@@ -23,11 +26,12 @@ from sunpy.map import (
     on_disk_bounding_coordinates,
 )
 from sunpy.map.header_helper import get_observer_meta
+from sunpy.map.maputils import _heliocentric_to_helioprojective, _heliocentric_transforms
 from sunpy.time import parse_time
 from sunpy.util import expand_list
 from sunpy.util.exceptions import warn_user
 
-__all__ = ['solar_rotate_coordinate', 'differential_rotate']
+__all__ = ['solar_rotate_coordinate', 'differential_rotate', 'differential_rotate_sequence']
 
 
 def _validate_observer_args(initial_obstime, observer, time):
@@ -332,7 +336,6 @@ def _warp_sun_coordinates(xy, smap, new_observer, **diff_rot_kwargs):
     See :func:`~sunpy.coordinates.transform_with_sun_center`.
     """
     # Suppress NaN warnings in coordinate transforms
-    import warnings
     with warnings.catch_warnings():
         warnings.simplefilter('ignore')
 
@@ -384,6 +387,35 @@ def _warp_sun_coordinates(xy, smap, new_observer, **diff_rot_kwargs):
     return xy2
 
 
+def _new_observer_meta(smap, new_observer):
+    """
+    Returns a copy of the metadata of ``smap`` with the observer replaced by ``new_observer``.
+    """
+    out_meta = deepcopy(smap.meta)
+
+    # Need to update the observer location for the output map.
+    # Remove all the possible observer keys
+    all_keys = expand_list([e[0] for e in smap._supported_observer_coordinates])
+    for key in all_keys:
+        out_meta.pop(key)
+
+    # Add a new HGS observer
+    out_meta.update(get_observer_meta(new_observer, smap.rsun_meters))
+    return out_meta
+
+
+def _new_observer_map(smap, out_data, out_meta, new_observer):
+    """
+    Returns a new map observed at the time of ``new_observer``.
+    """
+    outmap = smap._new_instance(out_data, out_meta, smap.plot_settings)
+
+    # Update the meta information with the new date and time.
+    outmap._set_date(new_observer.obstime)
+    outmap._set_reference_date(new_observer.obstime)
+    return outmap
+
+
 def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
     """
     Warp a `~sunpy.map.GenericMap` to take into account both solar differential
@@ -524,16 +556,7 @@ def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
     out_data = transform.warp(smap_data, inverse_map=_warp_sun_coordinates,
                               map_args=warp_args, preserve_range=True, cval=np.nan)
 
-    out_meta = deepcopy(smap.meta)
-
-    # Need to update the observer location for the output map.
-    # Remove all the possible observer keys
-    all_keys = expand_list([e[0] for e in smap._supported_observer_coordinates])
-    for key in all_keys:
-        out_meta.pop(key)
-
-    # Add a new HGS observer
-    out_meta.update(get_observer_meta(new_observer, smap.rsun_meters))
+    out_meta = _new_observer_meta(smap, new_observer)
 
     if is_sub_full_disk:
         # Define a new reference pixel and the value at the reference pixel.
@@ -548,12 +571,182 @@ def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
         out_meta['crpix2'] = 1 + smap.data.shape[0]/2.0 + \
             ((center_rotated.Ty - smap.center.Ty)/smap.scale.axis2).value
 
-    outmap = smap._new_instance(out_data, out_meta, smap.plot_settings)
-
-    # Update the meta information with the new date and time.
-    outmap._set_date(new_observer.obstime)
-    outmap._set_reference_date(new_observer.obstime)
+    outmap = _new_observer_map(smap, out_data, out_meta, new_observer)
 
     if is_sub_full_disk:
         return outmap.submap(rotated_bl, top_right=rotated_tr)
     return outmap
+
+
+def _pixel_grid_key(smap):
+    """
+    Returns a key that identifies the mapping from the pixels of ``smap`` to
+    three-dimensional helioprojective coordinates.
+
+    The distance of each pixel depends on the observer only through the
+    observer-Sun distance.
+    """
+    wcs = smap.wcs.wcs
+    frame = smap.coordinate_frame
+    return (smap.data.shape, tuple(wcs.ctype), tuple(wcs.cunit), wcs.crpix.tobytes(),
+            wcs.cdelt.tobytes(), wcs.crval.tobytes(), wcs.get_pc().tobytes(),
+            frame.rsun.to_value(u.m), frame.observer.radius.to_value(u.m))
+
+
+def _heliographic_pixel_grid(smap, new_observer):
+    """
+    Returns the heliographic Stonyhurst longitude and latitude (in radians) and
+    radius (in meters) of every pixel of ``smap``, as seen by ``new_observer``.
+
+    As in `_warp_sun_coordinates`, the distance of each pixel is found as seen
+    by the observer of ``smap``.
+    """
+    ny, nx = smap.data.shape
+    map_coord = smap.wcs.pixel_to_world(*np.meshgrid(np.arange(nx), np.arange(ny)))
+    output_hpc_coords = SkyCoord(map_coord.Tx, map_coord.Ty, map_coord.distance,
+                                 obstime=new_observer.obstime, observer=new_observer,
+                                 frame=Helioprojective)
+    hgs = output_hpc_coords.transform_to(HeliographicStonyhurst(obstime=new_observer.obstime))
+    return hgs.lon.to_value(u.rad), hgs.lat.to_value(u.rad), hgs.radius.to_value(u.m)
+
+
+def _derotated_pixel_coordinates(smap, new_observer, hgs_grid, hcc_transform, **diff_rot_kwargs):
+    """
+    The equivalent of `_warp_sun_coordinates` for every pixel of the output map,
+    starting from the precomputed heliographic coordinates of those pixels and the
+    affine transformation from heliographic Stonyhurst coordinates at the time of
+    ``new_observer`` to heliocentric coordinates of the map observer.
+
+    Returns the ``(row, column)`` pixel coordinates in ``smap`` of every pixel of
+    the output map, with shape ``(2,) + smap.data.shape``.
+    """
+    lon, lat, radius = hgs_grid
+
+    # The change in longitude is negative because we are mapping from the
+    # new coordinates to the old.
+    interval = (parse_time(new_observer.obstime) - parse_time(smap.date)).to(u.s)
+    drot = sunpy.sun.models.differential_rotation(interval, lat * u.rad, **diff_rot_kwargs)
+    lon = lon - drot.to_value(u.rad)
+
+    points = np.stack([radius * np.cos(lat) * np.cos(lon),
+                       radius * np.cos(lat) * np.sin(lon),
+                       radius * np.sin(lat)], axis=-1)
+    origin, matrix, observer_distance = hcc_transform
+    x, y, z = np.moveaxis(origin + points @ matrix, -1, 0)
+    hpc_lon, hpc_lat = _heliocentric_to_helioprojective(x, y, z, observer_distance)
+
+    wcs = smap.wcs
+    world = [None, None]
+    world[wcs.wcs.lng] = u.Quantity(hpc_lon, u.rad).to_value(wcs.wcs.cunit[wcs.wcs.lng])
+    world[wcs.wcs.lat] = u.Quantity(hpc_lat, u.rad).to_value(wcs.wcs.cunit[wcs.wcs.lat])
+    x2, y2 = wcs.world_to_pixel_values(*world)
+
+    # Set the coordinates that are behind the Sun as seen from the map observer to
+    # NaN so they are not included in the output image.
+    coords = np.stack([y2, x2])
+    coords[:, z < 0] = np.nan
+    return coords
+
+
+def differential_rotate_sequence(mapsequence, observer=None, time=None, **diff_rot_kwargs):
+    """
+    Warp every map of a `~sunpy.map.MapSequence` to take into account both solar
+    differential rotation and the changing location of the observer.
+
+    This is equivalent to calling `~sunpy.physics.differential_rotation.differential_rotate`
+    on each map of the sequence, but the maps are processed in parallel threads and
+    the work that is common to the maps is shared between them.
+    For maps that contain the full disk, the heliographic coordinates of the output
+    pixels are computed once for every unique map geometry (i.e., the same array shape
+    and the same mapping from pixels to helioprojective coordinates) and new observer.
+    Each map then only needs a NumPy evaluation of the differential rotation of those
+    coordinates and of the transformation to its own observer.
+    Maps that do not contain the full disk are passed to
+    `~sunpy.physics.differential_rotation.differential_rotate`.
+
+    Parameters
+    ----------
+    mapsequence : `~sunpy.map.MapSequence`
+        The sequence of maps that we want to transform.
+    observer : `~astropy.coordinates.BaseCoordinateFrame`, `~astropy.coordinates.SkyCoord`, `None`, optional
+        The location of the new observer.
+        Instruments in Earth orbit can be approximated by using the position
+        of the Earth at the observation time of the new observer.
+    time : sunpy-compatible time, `~astropy.time.TimeDelta`, `~astropy.units.Quantity`, `None`, optional
+        Used to define the duration over which the amount of solar rotation is
+        calculated. If 'time' is an `~astropy.time.Time` then the time interval
+        is difference between 'time' and the observation time of each map. If 'time' is
+        `~astropy.time.TimeDelta` or `~astropy.units.Quantity` then the calculation
+        is "initial_obstime + time" for each map.
+
+    Returns
+    -------
+    `~sunpy.map.MapSequence`
+        A sequence of the maps with the result of applying solar differential rotation
+        to each map of the input sequence, in the same order.
+
+    Notes
+    -----
+    The translational motion of the Sun over the time interval will be ignored.
+    See :func:`~sunpy.coordinates.transform_with_sun_center`.
+
+    """
+    maps = mapsequence.maps
+    if not maps:
+        raise ValueError("The map sequence is empty. No data to differentially rotate.")
+
+    # A relative time gives each map its own new observer
+    if isinstance(time, TimeDelta | u.Quantity):
+        _validate_observer_args(maps[0].date, observer, time)
+        warn_user("Using 'time' assumes an Earth-based observer.")
+        new_observers = [get_earth(smap.date + time) for smap in maps]
+    else:
+        new_observers = [_get_new_observer(maps[0].date, observer, time)] * len(maps)
+
+    # Only this function needs scikit image
+    from skimage import transform
+
+    outmaps = [None] * len(maps)
+    full_disk = []
+    for i, (smap, new_observer) in enumerate(zip(maps, new_observers)):
+        if contains_full_disk(smap):
+            full_disk.append(i)
+        else:
+            outmaps[i] = differential_rotate(smap, observer=new_observer, **diff_rot_kwargs)
+
+    # The coordinate transformations are done up front, as the setting of
+    # transform_with_sun_center() is not local to a thread
+    hgs_grids = {}
+    grid_keys = {}
+    hcc_transforms = {}
+    for new_observer in {id(new_observers[i]): new_observers[i] for i in full_disk}.values():
+        indices = [i for i in full_disk if new_observers[i] is new_observer]
+        for i in indices:
+            grid_keys[i] = (_pixel_grid_key(maps[i]), id(new_observer))
+            if grid_keys[i] not in hgs_grids:
+                with warnings.catch_warnings():
+                    # Suppress NaN warnings in coordinate transforms
+                    warnings.simplefilter('ignore')
+                    hgs_grids[grid_keys[i]] = _heliographic_pixel_grid(maps[i], new_observer)
+        with transform_with_sun_center():
+            transforms = _heliocentric_transforms(HeliographicStonyhurst(obstime=new_observer.obstime),
+                                                  [maps[i].coordinate_frame for i in indices])
+        for i, *hcc_transform in zip(indices, *transforms):
+            hcc_transforms[i] = hcc_transform
+
+    def derotate(i):
+        smap, new_observer = maps[i], new_observers[i]
+        coords = _derotated_pixel_coordinates(smap, new_observer, hgs_grids[grid_keys[i]],
+                                              hcc_transforms[i], **diff_rot_kwargs)
+        # Check for masked maps
+        if smap.mask is not None:
+            smap_data = np.ma.array(smap.data, mask=smap.mask)
+        else:
+            smap_data = smap.data
+        out_data = transform.warp(smap_data, inverse_map=coords, preserve_range=True, cval=np.nan)
+        out_meta = _new_observer_meta(smap, new_observer)
+        outmaps[i] = _new_observer_map(smap, out_data, out_meta, new_observer)
+
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(derotate, full_disk))
+    return MapSequence(outmaps, sortby=None)
@@ -8,6 +8,7 @@ from astropy.tests.helper import assert_quantity_allclose
 from astropy.time import Time, TimeDelta
 
 import sunpy.map
+import sunpy.physics.differential_rotation
 from sunpy.coordinates import frames, transform_with_sun_center
 from sunpy.coordinates.ephemeris import get_earth
 from sunpy.coordinates.metaframes import RotatedSunFrame
@@ -19,6 +20,7 @@ from sunpy.physics.differential_rotation import (
     _rotate_submap_edge,
     _warp_sun_coordinates,
     differential_rotate,
+    differential_rotate_sequence,
     solar_rotate_coordinate,
 )
 from sunpy.sun.constants import radius as R_sun
@@ -409,3 +411,48 @@ def test_rsun_fallback(aia171_test_map):
     new_observer = get_earth(aia171_test_map.date + 2 * u.day)
     rot_map = differential_rotate(aia171_test_map, observer=new_observer)
     assert_quantity_allclose(rot_map.rsun_meters, R_sun)
+
+
+def test_differential_rotate_sequence(aia171_test_map, all_on_disk_map):
+    pytest.importorskip("skimage")
+    later_map = aia171_test_map._new_instance(aia171_test_map.data * 2, aia171_test_map.meta.copy())
+    later_map.meta['date-obs'] = (aia171_test_map.date + 1*u.hr).isot
+    sequence = sunpy.map.MapSequence(aia171_test_map, all_on_disk_map, later_map, sortby=None)
+    new_observer = get_earth(aia171_test_map.date + 6*u.hr)
+    dseq = differential_rotate_sequence(sequence, observer=new_observer)
+
+    assert isinstance(dseq, sunpy.map.MapSequence)
+    assert len(dseq) == len(sequence)
+    for smap, dmap in zip(sequence, dseq):
+        expected = differential_rotate(smap, observer=new_observer)
+        assert dmap.data.shape == expected.data.shape
+        assert dmap.date.isot == new_observer.obstime.isot
+        assert dmap.heliographic_latitude == new_observer.lat
+        assert dmap.heliographic_longitude == new_observer.lon
+        assert dmap.wcs.wcs.compare(expected.wcs.wcs)
+        np.testing.assert_array_equal(np.isnan(dmap.data), np.isnan(expected.data))
+        np.testing.assert_allclose(dmap.data, expected.data, rtol=1e-6, equal_nan=True)
+
+
+def test_differential_rotate_sequence_time(aia171_test_map):
+    pytest.importorskip("skimage")
+    sequence = sunpy.map.MapSequence(aia171_test_map, aia171_test_map)
+    new_time = aia171_test_map.date + 6*u.hr
+    with pytest.warns(UserWarning, match="Using 'time' assumes an Earth-based observer"):
+        dseq = differential_rotate_sequence(sequence, time=new_time)
+    assert all(dmap.date.isot == new_time.isot for dmap in dseq)
+
+    with pytest.warns(UserWarning, match="Using 'time' assumes an Earth-based observer"):
+        dseq = differential_rotate_sequence(sequence, time=6*u.hr)
+    assert all(dmap.date.isot == new_time.isot for dmap in dseq)
+
+
+def test_differential_rotate_sequence_shared_grid(aia171_test_map, mocker):
+    pytest.importorskip("skimage")
+    grid = mocker.spy(sunpy.physics.differential_rotation, '_heliographic_pixel_grid')
+    shifted_map = aia171_test_map.shift_reference_coord(10*u.arcsec, 0*u.arcsec)
+    sequence = sunpy.map.MapSequence(aia171_test_map, aia171_test_map, shifted_map, aia171_test_map)
+    dseq = differential_rotate_sequence(sequence, observer=get_earth(aia171_test_map.date + 6*u.hr))
+    # One grid for each unique geometry
+    assert grid.call_count == 2
+    np.testing.assert_array_equal(dseq[0].data, dseq[1].data)
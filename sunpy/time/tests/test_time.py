@@ -89,6 +89,15 @@ def test_parse_time_nanoseconds():
     assert dt.jd2 == -0.4996971504992593
 
 
+def test_convert_time_registers_pandas(monkeypatch):
+    # The pandas types are registered on the first conversion after pandas is imported
+    monkeypatch.setattr(time.time, '_pandas_registered', False)
+    ts = pandas.Timestamp('2020-07-31 00:00:26.166196864')
+    dt = time.time.convert_time(ts)
+    assert time.time._pandas_registered
+    assert dt.jd2 == -0.4996971504992593
+
+
 @pytest.mark.parametrize("pd_type", [pandas.Series, pandas.Index])
 @pytest.mark.parametrize("inputs", [[datetime(2012, 1, i) for i in range(1, 13)],
                                     ['2025-09-18', '2025-09-19'],
@@ -2,10 +2,12 @@
 This module provides a collection of time handing functions.
 """
 import re
+import sys
 import textwrap
 import contextlib
+import importlib.util
 from datetime import date, datetime
-from functools import singledispatch
+from functools import wraps, singledispatch
 
 import numpy as np
 
@@ -166,13 +168,28 @@ find_time.__doc__ += ', '.join(list(REGEX.keys()))
 
 
 @singledispatch
-def convert_time(time_string, format=None, **kwargs):
+def _convert_time(time_string, format=None, **kwargs):
     # default case when no type matches
     return Time(time_string, format=format, **kwargs)
 
 
-# Only register pandas if we can import pandas
-try:
+# The pandas types are registered only once pandas has been imported, because importing pandas
+# is slow and a pandas object cannot be passed in without pandas having been imported
+_PANDAS_TYPES = ['Timestamp', 'Index', 'Series', 'DatetimeIndex']
+_pandas_registered = False
+
+
+# This copies the register(), dispatch() and registry attributes of the single-dispatch function
+@wraps(_convert_time)
+def convert_time(time_string, *args, **kwargs):
+    if not _pandas_registered and 'pandas' in sys.modules:
+        _register_pandas()
+    return _convert_time(time_string, *args, **kwargs)
+
+
+def _register_pandas():
+    global _pandas_registered
+    _pandas_registered = True
     import pandas
 
     @convert_time.register(pandas.Timestamp)
@@ -188,9 +205,6 @@ try:
     def convert_time_pandasDatetimeIndex(time_string, **kwargs):
         return Time(time_string.tolist(), **kwargs)
 
-except ImportError:
-    pass
-
 
 @convert_time.register(datetime)
 def convert_time_datetime(time_string, **kwargs):
@@ -291,6 +305,9 @@ def _variables_for_parse_time_docstring():
     types.remove(object)
     # Do Builtins
     types2 = [t.__qualname__ for t in types if t.__module__ == "builtins"]
+    # The pandas types are listed if pandas is available, even if they are not yet registered
+    if not _pandas_registered and importlib.util.find_spec("pandas") is not None:
+        types2 += [f"pandas.{name}" for name in _PANDAS_TYPES]
     # # Do all the non-special ones where we take the package name and the class
     types2 += [t.__module__.split(".")[0] + "." +
                t.__qualname__ for t in types if not t.__module__.startswith(("builtins", "astropy"))]
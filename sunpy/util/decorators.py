@@ -184,7 +184,9 @@ def cached_property_based_on(attr_name):
 
     Notes
     -----
-    The cached value of ``meth(instance)`` is stored under the key ``meth.__name__``.
+    The cached value of ``getattr(instance, attr_name)`` is stored alongside the
+    value of ``prop`` under the key ``prop.__name__``, so several properties can
+    be cached based on the same attribute without interfering with each other.
     """
     def outer(prop):
         """
@@ -204,17 +206,15 @@ def cached_property_based_on(attr_name):
 
             # Check if our caching method has changed output
             new_attr_val = getattr(instance, attr_name)
-            old_attr_val = cache.get(attr_name, _NOT_FOUND)
-            if (old_attr_val is _NOT_FOUND or
-                    new_attr_val != old_attr_val or
-                    prop_key not in cache):
+            old_attr_val, old_val = cache.get(prop_key, (_NOT_FOUND, _NOT_FOUND))
+            if old_attr_val is _NOT_FOUND or new_attr_val != old_attr_val:
                 # Recompute the property
                 new_val = prop(instance)
-                cache[prop_key] = new_val
                 # Store the new attribute value after the property is computed successfully
-                cache[attr_name] = new_attr_val
+                cache[prop_key] = (new_attr_val, new_val)
+                return new_val
 
-            return cache[prop_key]
+            return old_val
         return inner
     return outer
 
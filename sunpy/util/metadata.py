@@ -35,6 +35,7 @@ class MetaDict(OrderedDict):
     """
 
     def __init__(self, *args, save_original=True):
+        self._bump_version()
         # Store all keys as lower-case to allow for case-insensitive indexing
         # OrderedDict can be instantiated from a list of lists or a tuple of tuples
         tags = dict()
@@ -115,6 +116,23 @@ class MetaDict(OrderedDict):
         copied._original_meta = self.original_meta
         return copied
 
+    @property
+    def _version(self):
+        """
+        An opaque token that changes whenever the contents of this instance change.
+
+        This is much cheaper to compare than `item_hash`, and so can be used to
+        invalidate values derived from the metadata. Note that in-place
+        modification of mutable values stored in the dictionary is not detected.
+        """
+        return self.__version
+
+    def _bump_version(self):
+        # A new object is used (rather than an incrementing integer) so that the
+        # token can never compare equal to one from another instance, from an
+        # earlier state of this instance or from a different process.
+        self.__version = object()
+
     @staticmethod
     def _check_str_keys(items):
         bad_keys = []
@@ -170,10 +188,12 @@ class MetaDict(OrderedDict):
         """
         Override ``[]`` indexing.
         """
+        self._bump_version()
         return OrderedDict.__setitem__(self, key.lower(), value)
 
     def popitem(self, last):
         key, value = super().popitem(last)
+        self._bump_version()
         self._prune_keycomments()
         return key, value
 
@@ -182,6 +202,7 @@ class MetaDict(OrderedDict):
         Override ``del dict[key]`` key deletion.
         """
         OrderedDict.__delitem__(self, key.lower())
+        self._bump_version()
         self._prune_keycomments()
 
     def item_hash(self):
@@ -219,6 +240,7 @@ class MetaDict(OrderedDict):
         has_key = key in self
         result = OrderedDict.pop(self, key.lower(), default)
         if has_key:
+            self._bump_version()
             self._prune_keycomments()
         return result
 
@@ -232,4 +254,13 @@ class MetaDict(OrderedDict):
         """
         Override ``.setdefault()`` to perform case-insensitively.
         """
+        if key not in self:
+            self._bump_version()
         return OrderedDict.setdefault(self, key.lower(), default)
+
+    def clear(self):
+        """
+        Override ``.clear()`` so that the version of the contents is updated.
+        """
+        self._bump_version()
+        return OrderedDict.clear(self)
@@ -550,3 +550,32 @@ def test_original_copy():
     # Check removal of items
     md.pop('foo')
     assert md.removed_items == {'foo': 'bar'}
+
+
+@pytest.mark.parametrize(('method', 'args'), [
+    ('__setitem__', ('Foo', 'baz')),
+    ('__delitem__', ('FOO',)),
+    ('pop', ('foo',)),
+    ('popitem', (True,)),
+    ('update', ({'a': 'b'},)),
+    ('setdefault', ('a', 'b')),
+    ('clear', ()),
+])
+def test_version_changes(method, args):
+    md = MetaDict({'foo': 'bar'})
+    version = md._version
+    getattr(md, method)(*args)
+    assert md._version is not version
+
+
+def test_version_unchanged():
+    md = MetaDict({'foo': 'bar'})
+    version = md._version
+    _ = md['foo']
+    md.pop('missing')
+    md.setdefault('foo', 'baz')
+    assert md._version is version
+
+    # Copies never share a version with the original
+    assert md.copy()._version is not version
+    assert copy.deepcopy(md)._version is not version
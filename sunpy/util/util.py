@@ -288,6 +288,16 @@ def _figure_to_base64(fig):
     return b64encode(buf.getvalue()).decode('utf-8')
 
 
+def _make_readonly(result):
+    # Marks an array, or the arrays in a tuple, as read-only so that a cached result can be shared
+    if isinstance(result, np.ndarray):
+        result.flags.writeable = False
+    elif isinstance(result, tuple):
+        for item in result:
+            _make_readonly(item)
+    return result
+
+
 def fix_duplicate_notes(notes_to_add, docstring):
     """
     Merges a note section into a docstring that may have a notes section.
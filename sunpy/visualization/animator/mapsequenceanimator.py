@@ -3,6 +3,7 @@ This module provides a way to animate `~sunpy.map.MapSequence`.
 """
 from copy import deepcopy
 
+import numpy as np
 from mpl_animators import BaseFuncAnimator
 
 from sunpy.visualization import axis_labels_from_ctype, wcsaxes_compat
@@ -69,7 +70,7 @@ class MapSequenceAnimator(BaseFuncAnimator):
         while self.remove_obj:
             self.remove_obj.pop(0).remove()
         i = int(val)
-        im.set_array(self.data[i].data)
+        im.set_array(np.asarray(self.data[i].data))
         im.set_cmap(self.mapsequence[i].plot_settings.get('cmap', "grey"))
         if norm := self.mapsequence[i].plot_settings.get('norm'):
             im.set_norm(deepcopy(norm))
@@ -14,7 +14,14 @@ from astropy.wcs.wcsapi import BaseHighLevelWCS
 from sunpy.coordinates import HeliographicCarrington, HeliographicStonyhurst
 from sunpy.coordinates.frames import HeliocentricInertial, Helioprojective
 from sunpy.coordinates.sun import _angular_radius
-from sunpy.coordinates.utils import get_limb_coordinates
+from sunpy.coordinates.utils import (
+    _equator_vertices,
+    _frame_key,
+    _limb_vertices,
+    _observer_key,
+    _prime_meridian_vertices,
+    get_limb_coordinates,
+)
 from sunpy.util import grid_perimeter
 from sunpy.visualization import wcsaxes_compat
 
@@ -67,6 +74,12 @@ def limb(axes, observer, *, rsun: u.m = R_sun, resolution=1000, **kwargs):
     If there are no visible points (e.g., for an observer on the opposite side
     of the Sun to the map observer) ``visible`` will be ``None``.
 
+    For axes in a `~sunpy.coordinates.frames.Helioprojective` or
+    `~sunpy.coordinates.frames.HeliographicStonyhurst` frame, the vertices of the
+    limb are cached by observer, ``rsun``, ``resolution`` and axes frame, so that
+    redrawing the same limb (e.g., for each frame of an animation) does not repeat
+    the coordinate transformations.
+
     To avoid triggering Matplotlib auto-scaling, these patches are added as
     artists instead of patches. One consequence is that the plot legend is not
     populated automatically when the limb is specified with a text label. See
@@ -98,6 +111,11 @@ def limb(axes, observer, *, rsun: u.m = R_sun, resolution=1000, **kwargs):
             return circ, None
 
     # Otherwise, we use Polygon to be able to distort the limb
+    if _frame_key(axes_frame) is not None and _observer_key(observer) is not None:
+        # Use the cached vertices of the limb in the axes frame
+        vertices = _limb_vertices(observer, rsun, resolution, axes_frame)
+        return _draw_vertices(*vertices, axes, axes_frame, rsun, **kwargs)
+
     # Create the limb coordinate array using Heliocentric Radial
     limb = get_limb_coordinates(observer, rsun, resolution)
 
@@ -145,6 +163,10 @@ def equator(axes, *, rsun: u.m = R_sun, resolution=500, **kwargs):
         raise ValueError('axes must be a WCSAxes')
     axes_frame = wcsapi_to_celestial_frame(axes.wcs)
 
+    if _frame_key(axes_frame) is not None:
+        vertices = _equator_vertices(rsun, resolution, axes_frame)
+        return _draw_vertices(*vertices, axes, axes_frame, rsun, **kwargs)
+
     lat = 0*u.deg
     lat0 = SkyCoord(np.linspace(-180, 179, resolution) * u.deg,
                     np.ones(resolution) * lat, radius=rsun,
@@ -186,6 +208,10 @@ def prime_meridian(axes, *, rsun: u.m = R_sun, resolution=500, **kwargs):
                          'so zero Carrington longitude cannot be determined.')
     observer = axes_frame.observer
 
+    if isinstance(axes_frame, Helioprojective) and _frame_key(axes_frame) is not None:
+        vertices = _prime_meridian_vertices(rsun, resolution, axes_frame)
+        return _draw_vertices(*vertices, axes, axes_frame, rsun, close_path=False, **kwargs)
+
     lon = 0*u.deg
     lon0 = SkyCoord(np.ones(resolution) * lon,
                     np.linspace(-90, 90, resolution) * u.deg, radius=rsun,
@@ -235,6 +261,25 @@ def _plot_vertices(coord, axes, frame, rsun, close_path=True, **kwargs):
     Draws the provided SkyCoord on the WCSAxes as `~matplotlib.patches.Polygon`
     objects depending on visibility.
     """
+    # Get the 2D vertices of the coordinates
+    coord = coord.transform_to(frame)
+    Tx = coord.spherical.lon.to_value(u.deg)
+    Ty = coord.spherical.lat.to_value(u.deg)
+
+    # 2D points are always visible, which is indicated by not having a distance
+    is_2d = (norm := coord.spherical.norm()).unit is u.one and u.allclose(norm, 1*u.one)
+    distance = None if is_2d else coord.spherical.distance.to_value(u.m)
+    return _draw_vertices(Tx, Ty, distance, axes, frame, rsun, close_path=close_path, **kwargs)
+
+
+def _draw_vertices(Tx, Ty, distance, axes, frame, rsun, close_path=True, **kwargs):
+    """
+    Draws the provided vertices, in degrees, on the WCSAxes as
+    `~matplotlib.patches.Polygon` objects depending on visibility.
+
+    ``distance`` is the distance in meters of each vertex in ``frame``, or `None` if
+    the vertices are 2D.
+    """
     c_kw = {'fill': False,
             'color': 'white',
             'zorder': 100}
@@ -242,23 +287,18 @@ def _plot_vertices(coord, axes, frame, rsun, close_path=True, **kwargs):
     transform = axes.get_transform("world")
     c_kw.setdefault('transform', transform)
 
-    # Get the 2D vertices of the coordinates
-    coord = coord.transform_to(frame)
-    Tx = coord.spherical.lon.to_value(u.deg)
-    Ty = coord.spherical.lat.to_value(u.deg)
     vertices = np.array([Tx, Ty]).T
 
     # Determine which points are visible (2D points are always visible)
-    is_2d = (norm := coord.spherical.norm()).unit is u.one and u.allclose(norm, 1*u.one)
-    if not is_2d and hasattr(frame, 'observer'):
+    if distance is not None and hasattr(frame, 'observer'):
         # The reference distance is the distance to the limb for the axes
         # observer
         rsun = getattr(frame, 'rsun', rsun)
         reference_distance = np.sqrt(frame.observer.radius**2 - rsun**2)
-        is_visible = coord.spherical.distance <= reference_distance
+        is_visible = distance <= reference_distance.to_value(u.m)
     else:
         # If the axes has no observer, the entire limb is considered visible
-        is_visible = np.ones_like(coord.spherical.distance, bool, subok=False)
+        is_visible = np.ones(len(vertices), bool)
 
     # Identify discontinuities. Uses the same approach as
     # astropy.visualization.wcsaxes.grid_paths.get_lon_lat_path()
@@ -11,6 +11,7 @@ from astropy.wcs.wcsapi import HighLevelWCSWrapper
 from astropy.wcs.wcsapi.wrappers import SlicedLowLevelWCS
 
 import sunpy.io
+from sunpy.coordinates.utils import _clear_vertex_caches, _limb_vertices, get_limb_coordinates
 from sunpy.data.test import get_test_filepath
 from sunpy.map import Map
 from sunpy.tests.helpers import figure_test
@@ -86,6 +87,27 @@ def test_limb_invisible(aia171_test_map):
     assert hidden is not None
 
 
+def test_limb_cached(aia171_test_map):
+    aia_obs = aia171_test_map.observer_coordinate
+    new_obs = SkyCoord(lon=aia_obs.lon + 60*u.deg, lat=aia_obs.lat, radius=aia_obs.radius,
+                       frame=aia_obs.replicate_without_data())
+    ax = Figure().add_subplot(projection=aia171_test_map)
+
+    _clear_vertex_caches()
+    visible, hidden = drawing.limb(ax, new_obs)
+    visible_again, hidden_again = drawing.limb(ax, new_obs)
+    assert _limb_vertices.cache_info().hits == 1
+    np.testing.assert_array_equal(visible.get_xy(), visible_again.get_xy())
+
+    # The cached vertices match those of the transformed limb coordinates
+    limb = get_limb_coordinates(new_obs, resolution=1000)
+    expected_visible, expected_hidden = drawing._plot_vertices(limb, ax, aia171_test_map.coordinate_frame,
+                                                               limb.rsun)
+    np.testing.assert_allclose(visible.get_xy(), expected_visible.get_xy(), atol=1e-9)
+    np.testing.assert_array_equal(visible.get_path().codes, expected_visible.get_path().codes)
+    np.testing.assert_array_equal(hidden.get_path().codes, expected_hidden.get_path().codes)
+
+
 @pytest.fixture
 def cutout_wcs(aia171_test_map):
     header = {